@@ -0,0 +1,260 @@
+"""
+This module provides a `CircuitBreaker` that can be shared by name between
+functions decorated with `retry_deco` and between threads.
+
+The breaker has three states:
+1. `closed`: calls pass through, their outcomes are recorded in a sliding window.
+2. `open`: the failure rate in the window exceeded the threshold, calls are
+rejected without being attempted until `reset_timeout` seconds pass.
+3. `half_open`: a limited number of probe calls is let through; if all of them
+succeed the breaker closes again, any failure opens it back.
+
+`allow_request` returns a `Permit` tied to the state the call was admitted in.
+Outcomes reported with a permit from an earlier state are ignored, so a slow
+call admitted while closed cannot close a half-open breaker. A call that ends
+without an outcome, e.g. a cancelled probe, must return its permit with `release`.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, NamedTuple
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreakerOpenError(Exception):
+    """
+        Exception raised when a call is rejected by an open circuit breaker.
+    """
+
+
+class Permit(NamedTuple):
+    """
+        Admission of a call by `CircuitBreaker.allow_request`.
+        The generation is the number of transitions made before the admission.
+    """
+    generation: int
+    probe: bool
+
+
+class CircuitBreaker:  # pylint: disable=too-many-instance-attributes
+    """
+        A thread-safe circuit breaker driven by the failure rate of the last
+        `window_size` calls.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 10,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+            Initializes the circuit breaker in the closed state.
+
+            Args:
+                name (str): Name of the breaker, used in errors and stats.
+                failure_rate_threshold (float): Share of failed calls in the window
+                that opens the breaker.
+                window_size (int): Number of last call outcomes taken into account.
+                min_calls (int): Minimal number of recorded calls before the
+                failure rate is evaluated.
+                reset_timeout (float): Seconds the breaker stays open before
+                letting probe calls through.
+                half_open_max_calls (int): Number of probe calls allowed in half-open state.
+                clock (Callable[[], float]): Monotonic time source.
+        """
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError('failure_rate_threshold must be in (0, 1]')
+        if window_size < 1 or min_calls < 1 or half_open_max_calls < 1:
+            raise ValueError('window_size, min_calls and half_open_max_calls must be positive')
+
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min(min_calls, window_size)
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._window: deque[bool] = deque(maxlen=window_size)
+        self._failures = 0
+        self._state = CLOSED
+        self._generation = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._rejected = 0
+        self._transitions: dict[str, int] = {}
+        self._listeners: list[Callable[[str, str, str], None]] = []
+
+    @property
+    def state(self) -> str:
+        """Returns the current state, moving an expired open breaker to half-open."""
+        with self._lock:
+            self._check_reset_timeout()
+            return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        """Returns the share of failed calls in the current window."""
+        with self._lock:
+            return self._failures / len(self._window) if self._window else 0.0
+
+    @property
+    def stats(self) -> dict[str, object]:
+        """Returns a snapshot of the breaker state and counters."""
+        with self._lock:
+            self._check_reset_timeout()
+            return {
+                'name': self.name,
+                'state': self._state,
+                'failure_rate': self._failures / len(self._window) if self._window else 0.0,
+                'rejected': self._rejected,
+                'transitions': dict(self._transitions),
+            }
+
+    def add_listener(self, listener: Callable[[str, str, str], None]) -> None:
+        """
+            Registers a callback invoked as `listener(name, old_state, new_state)`
+            on every state transition. Listeners run under the breaker lock
+            and must not call back into the breaker.
+        """
+        self._listeners.append(listener)
+
+    def allow_request(self) -> Permit | None:
+        """
+            Decides whether a call may be attempted. In half-open state every
+            allowed call is counted as a probe and must be followed by
+            `record_success`, `record_failure` or `release` with the returned permit.
+
+            Returns:
+                Permit | None: The permit of the call if it may proceed, None if it is rejected.
+        """
+        with self._lock:
+            self._check_reset_timeout()
+            if self._state == CLOSED:
+                return Permit(self._generation, False)
+            if self._state == HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                return Permit(self._generation, True)
+            self._rejected += 1
+            return None
+
+    def record_success(self, permit: Permit | None = None) -> None:
+        """
+            Records a successful call. Without a permit the outcome is attributed
+            to the current state, with a stale permit it is ignored.
+        """
+        with self._lock:
+            if not self._is_current(permit):
+                return
+            if self._state == HALF_OPEN:
+                if not self._release_probe():
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_max_calls:
+                    self._transition(CLOSED)
+            elif self._state == CLOSED:
+                self._record_outcome(False)
+
+    def record_failure(self, permit: Permit | None = None) -> None:
+        """
+            Records a failed call, opening the breaker if the failure rate is too high.
+            Without a permit the outcome is attributed to the current state, with
+            a stale permit it is ignored.
+        """
+        with self._lock:
+            if not self._is_current(permit):
+                return
+            if self._state == HALF_OPEN:
+                self._transition(OPEN)
+            elif self._state == CLOSED:
+                self._record_outcome(True)
+                if (
+                    len(self._window) >= self.min_calls
+                    and self._failures / len(self._window) >= self.failure_rate_threshold
+                ):
+                    self._transition(OPEN)
+
+    def release(self, permit: Permit) -> None:
+        """Returns the probe slot of a call that ended without an outcome, e.g. was cancelled."""
+        with self._lock:
+            if permit.probe and self._is_current(permit):
+                self._release_probe()
+
+    def reset(self) -> None:
+        """Forces the breaker back to the closed state with an empty window."""
+        with self._lock:
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def _is_current(self, permit: Permit | None) -> bool:
+        """Checks that a permit was issued in the current state. Called under the lock."""
+        return permit is None or permit.generation == self._generation
+
+    def _release_probe(self) -> bool:
+        """Frees a probe slot, returns False if no probe is in flight. Called under the lock."""
+        if self._probes_in_flight == 0:
+            return False
+        self._probes_in_flight -= 1
+        return True
+
+    def _record_outcome(self, failed: bool) -> None:
+        """Appends a call outcome to the window keeping the failure counter in sync."""
+        if len(self._window) == self._window.maxlen and self._window[0]:
+            self._failures -= 1
+        self._window.append(failed)
+        self._failures += failed
+
+    def _check_reset_timeout(self) -> None:
+        """Moves an open breaker to half-open once `reset_timeout` has passed."""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._transition(HALF_OPEN)
+
+    def _transition(self, new_state: str) -> None:
+        """Switches the state, resetting the per-state bookkeeping. Called under the lock."""
+        old_state = self._state
+        self._state = new_state
+        self._generation += 1
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        if new_state == OPEN:
+            self._opened_at = self._clock()
+        elif new_state == CLOSED:
+            self._window.clear()
+            self._failures = 0
+
+        transition = f'{old_state}->{new_state}'
+        self._transitions[transition] = self._transitions.get(transition, 0) + 1
+        for listener in self._listeners:
+            listener(self.name, old_state, new_state)
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str, **options) -> CircuitBreaker:
+    """
+        Returns the circuit breaker registered under `name`, creating it with
+        `options` on first use. Options are ignored for an existing breaker.
+
+        Args:
+            name (str): Name of the shared breaker.
+            **options: Keyword arguments passed to `CircuitBreaker` on creation.
+
+        Returns:
+            CircuitBreaker: The shared breaker instance.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name, **options)
+        return breaker
@@ -0,0 +1,226 @@
+"""
+This module provides hedged (speculative) execution of a single attempt for
+`retry_deco`.
+
+If an attempt has not completed after `hedge_delay` seconds, a parallel copy
+of it is launched, up to `max_hedges` extra copies. The first successful
+result is returned and the remaining copies are cancelled or, for threads that
+are already running, abandoned. Hedging is only safe for idempotent calls.
+
+Sync functions run in a shared thread pool, coroutines run as asyncio tasks.
+Abandoned threads keep their pool worker until they return, so every copy,
+primary or hedge, holds one of `HEDGE_POOL_SIZE` slots until its thread returns
+and nothing ever waits in the pool queue. When no slot is free, the calling
+thread runs the copy itself: a hedge blocks the caller until it returns, and a
+primary call runs without hedging.
+If the awaiting coroutine is cancelled, all its copies are cancelled as well.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable
+
+HEDGE_POOL_SIZE = 32
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_worker_slots = threading.BoundedSemaphore(HEDGE_POOL_SIZE)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Returns the thread pool shared by all hedged sync functions, creating it on first use."""
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=HEDGE_POOL_SIZE, thread_name_prefix='retry-hedge')
+        return _executor
+
+
+def _release_worker_slot(_future: Future) -> None:
+    """Frees the slot of a copy once its thread returned or it was cancelled before starting."""
+    _worker_slots.release()
+
+
+def _submit(executor: ThreadPoolExecutor, func: Callable[..., Any], args: tuple, kwargs: dict[str, Any]) -> Future:
+    """Submits a copy holding a worker slot, which is released when the copy is done."""
+    future = executor.submit(func, *args, **kwargs)
+    future.add_done_callback(_release_worker_slot)
+    return future
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    """Marks the exception of a finished task as retrieved, so abandoned failures are not reported."""
+    if not task.cancelled():
+        task.exception()
+
+
+class HedgeStats:
+    """
+        Thread-safe counters describing how hedged attempts of a function went.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.attempts = 0
+        self.hedges_launched = 0
+        self.primary_wins = 0
+        self.hedge_wins = 0
+
+    def record(self, hedges_launched: int, hedge_won: bool | None) -> None:
+        """
+            Records the outcome of one hedged attempt.
+
+            :param hedges_launched: Number of extra copies launched for the attempt.
+            :param hedge_won: True if a hedge returned the result, False if the primary
+            call did, None if every copy failed.
+        """
+        with self._lock:
+            self.attempts += 1
+            self.hedges_launched += hedges_launched
+            if hedge_won is True:
+                self.hedge_wins += 1
+            elif hedge_won is False:
+                self.primary_wins += 1
+
+    def as_dict(self) -> dict[str, int]:
+        """Returns a snapshot of the counters."""
+        with self._lock:
+            return {
+                'attempts': self.attempts,
+                'hedges_launched': self.hedges_launched,
+                'primary_wins': self.primary_wins,
+                'hedge_wins': self.hedge_wins,
+            }
+
+
+def _call_inline(func: Callable[..., Any], args: tuple, kwargs: dict[str, Any], stats: HedgeStats) -> Any:
+    """Runs `func` on the calling thread without hedging, when no worker slot is free."""
+    try:
+        result = func(*args, **kwargs)
+    except Exception:
+        stats.record(0, None)
+        raise
+    stats.record(0, False)
+    return result
+
+
+def _run_on_caller(func: Callable[..., Any], args: tuple, kwargs: dict[str, Any]) -> Future:
+    """Runs a copy on the calling thread, when no worker slot is free, and returns it as a done future."""
+    future: Future = Future()
+    try:
+        future.set_result(func(*args, **kwargs))
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        future.set_exception(error)
+    return future
+
+
+def call_hedged(  # pylint: disable=too-many-arguments
+    func: Callable[..., Any],
+    args: tuple,
+    kwargs: dict[str, Any],
+    hedge_delay: float,
+    max_hedges: int,
+    allow_hedge: Callable[[], bool],
+    stats: HedgeStats,
+) -> Any:
+    """
+        Runs `func` in the shared thread pool, launching a hedge every `hedge_delay`
+        seconds while no copy has completed. Copies run on the calling thread when no
+        worker slot is free.
+
+        :param func: The function to call.
+        :param args: Positional arguments for the call.
+        :param kwargs: Keyword arguments for the call.
+        :param hedge_delay: Seconds to wait before launching the next copy.
+        :param max_hedges: Maximal number of extra copies.
+        :param allow_hedge: Callable consulted before every hedge, e.g. a retry budget.
+        :param stats: Counters updated with the outcome.
+        :return: The result of the first successful copy.
+        :raises Exception: The exception of the last failed copy if all of them failed.
+    """
+    if not _worker_slots.acquire(blocking=False):  # pylint: disable=consider-using-with
+        return _call_inline(func, args, kwargs, stats)
+
+    executor = _get_executor()
+    launched: list[Future] = [_submit(executor, func, args, kwargs)]
+    pending = set(launched)
+    can_hedge = max_hedges > 0
+    error = None
+
+    while pending:
+        done, pending = wait(pending, timeout=hedge_delay if can_hedge else None, return_when=FIRST_COMPLETED)
+        if not done:
+            if allow_hedge():
+                if _worker_slots.acquire(blocking=False):  # pylint: disable=consider-using-with
+                    future = _submit(executor, func, args, kwargs)
+                else:
+                    future = _run_on_caller(func, args, kwargs)
+                launched.append(future)
+                pending.add(future)
+            else:
+                can_hedge = False
+            can_hedge = can_hedge and len(launched) <= max_hedges
+            continue
+        for future in done:
+            if future.exception() is None:
+                for loser in pending:
+                    loser.cancel()
+                stats.record(len(launched) - 1, future is not launched[0])
+                return future.result()
+            error = future.exception()
+
+    stats.record(len(launched) - 1, None)
+    raise error
+
+
+async def call_hedged_async(  # pylint: disable=too-many-arguments
+    func: Callable[..., Any],
+    args: tuple,
+    kwargs: dict[str, Any],
+    hedge_delay: float,
+    max_hedges: int,
+    allow_hedge: Callable[[], bool],
+    stats: HedgeStats,
+) -> Any:
+    """
+        Runs the coroutine function `func` as an asyncio task, launching a hedge task
+        every `hedge_delay` seconds while no copy has completed. Losing tasks are cancelled,
+        all of them are if the awaiting coroutine is cancelled.
+
+        Parameters and result are the same as for `call_hedged`.
+    """
+    def launch() -> asyncio.Task:
+        task = asyncio.ensure_future(func(*args, **kwargs))
+        task.add_done_callback(_retrieve_exception)
+        launched.append(task)
+        return task
+
+    launched: list[asyncio.Task] = []
+    pending = {launch()}
+    can_hedge = max_hedges > 0
+    error = None
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, timeout=hedge_delay if can_hedge else None, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                if allow_hedge():
+                    pending.add(launch())
+                else:
+                    can_hedge = False
+                can_hedge = can_hedge and len(launched) <= max_hedges
+                continue
+            for task in done:
+                if task.exception() is None:
+                    stats.record(len(launched) - 1, task is not launched[0])
+                    return task.result()
+                error = task.exception()
+    finally:
+        for task in launched:
+            task.cancel()
+
+    stats.record(len(launched) - 1, None)
+    raise error
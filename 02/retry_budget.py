@@ -0,0 +1,109 @@
+"""
+This module provides a `RetryBudget` that caps retries made by `retry_deco`
+at a fixed share of the total traffic.
+
+The budget is a token bucket: every successful call earns `ratio` tokens
+(up to `max_tokens`) and every retry spends one token. When the bucket is
+empty retries are denied, so during an incident the retry traffic is limited
+to roughly `ratio` of the successful traffic instead of multiplying the load.
+"""
+
+import threading
+
+
+class RetryBudget:
+    """
+        A thread-safe token bucket limiting the number of retries.
+
+        The lock is only taken when the token level actually changes:
+        deposits into a full bucket and spends from an empty one return
+        after a single unlocked read.
+    """
+
+    def __init__(self, name: str, ratio: float = 0.1, max_tokens: float = 10.0) -> None:
+        """
+            Initializes a full retry budget.
+
+            Args:
+                name (str): Name of the budget, used in stats.
+                ratio (float): Tokens earned by every successful call, i.e. the
+                allowed share of retries relative to successful calls.
+                max_tokens (float): Bucket capacity, the size of a retry burst
+                allowed after a quiet period.
+        """
+        if ratio <= 0:
+            raise ValueError('ratio must be positive')
+        if max_tokens < 1:
+            raise ValueError('max_tokens must be at least 1')
+
+        self.name = name
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+        self._spent = 0
+        self._denied = 0
+
+    @property
+    def tokens(self) -> float:
+        """Returns the current token level."""
+        return self._tokens
+
+    @property
+    def stats(self) -> dict[str, object]:
+        """
+            Returns a snapshot of the token level and retry counters.
+            `denied` is counted without the lock and may be approximate under contention.
+        """
+        return {
+            'name': self.name,
+            'tokens': self._tokens,
+            'spent': self._spent,
+            'denied': self._denied,
+        }
+
+    def deposit(self) -> None:
+        """Earns `ratio` tokens for a successful call."""
+        if self._tokens >= self.max_tokens:
+            return
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """
+            Spends one token for a retry.
+
+            Returns:
+                bool: True if the retry is allowed, False if the budget is exhausted.
+        """
+        if self._tokens >= 1:
+            with self._lock:
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self._spent += 1
+                    return True
+        self._denied += 1
+        return False
+
+
+_budgets: dict[str, RetryBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def get_retry_budget(name: str, **options) -> RetryBudget:
+    """
+        Returns the retry budget registered under `name`, creating it with
+        `options` on first use. Options are ignored for an existing budget.
+
+        Args:
+            name (str): Name of the shared budget.
+            **options: Keyword arguments passed to `RetryBudget` on creation.
+
+        Returns:
+            RetryBudget: The shared budget instance.
+    """
+    with _budgets_lock:
+        budget = _budgets.get(name)
+        if budget is None:
+            budget = _budgets[name] = RetryBudget(name, **options)
+        return budget
@@ -8,15 +8,95 @@ The decorator takes two arguments:
 
 If an exception is not in `expected_exceptions`, the function will retry until
 the maximum number of attempts is reached.
+
+Optionally a shared `CircuitBreaker` (or its name) can be passed as `circuit_breaker`:
+while the breaker is open, calls fail fast with `CircuitBreakerOpenError`
+without being attempted.
+
+A shared `RetryBudget` (or its name) can be passed as `retry_budget` to cap
+retries at a share of the successful traffic across all call sites.
+
+For idempotent calls `hedge_delay` enables hedging: an attempt still running
+after the delay gets a parallel copy and the first successful result wins.
+Coroutine functions are supported and retried with `await`.
 """
 
 import functools
+import inspect
 from typing import Type
 
+from circuit_breaker import CircuitBreaker, CircuitBreakerOpenError, Permit, get_circuit_breaker
+from hedging import HedgeStats, call_hedged, call_hedged_async
+from retry_budget import RetryBudget, get_retry_budget
+
+
+class _RetryGuards:
+    """
+        Bundles the optional circuit breaker and retry budget consulted
+        around every attempt made by `retry_deco`.
+    """
+
+    def __init__(self, circuit_breaker: CircuitBreaker | None, retry_budget: RetryBudget | None):
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+
+    def before_attempt(self, function_info: str) -> Permit | None:
+        """
+            Returns the breaker permit of the attempt, None without a breaker.
+            Raises `CircuitBreakerOpenError` if the breaker rejects the attempt.
+        """
+        if self.circuit_breaker is None:
+            return None
+        permit = self.circuit_breaker.allow_request()
+        if permit is None:
+            print(function_info + f'rejected by circuit breaker = {self.circuit_breaker.name}')
+            raise CircuitBreakerOpenError(f'Circuit breaker "{self.circuit_breaker.name}" is open')
+        return permit
+
+    def on_success(self, permit: Permit | None) -> None:
+        """Records a successful attempt."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success(permit)
+        if self.retry_budget is not None:
+            self.retry_budget.deposit()
+
+    def on_expected_exception(self, permit: Permit | None) -> None:
+        """Records an attempt that raised an expected exception."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success(permit)
+
+    def on_failure(self, permit: Permit | None) -> None:
+        """Records a failed attempt."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure(permit)
+
+    def on_interrupt(self, permit: Permit | None) -> None:
+        """Releases the permit of an attempt interrupted by a `BaseException`, e.g. cancelled."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release(permit)
+
+    def allow_retry(self) -> bool:
+        """Spends a retry token, returns False if the retry budget is exhausted."""
+        return self.retry_budget is None or self.retry_budget.try_spend()
+
 
-def retry_deco(
+def _describe_attempt(func, args: tuple, kwargs: dict, attempt: int) -> str:
+    """Builds the beginning of the line printed for every attempt."""
+    function_info = f'run "{func.__name__}" with '
+    if args:
+        function_info += f'positional args = {args}, '
+    if kwargs:
+        function_info += f'keyword kwargs = {kwargs}, '
+    return function_info + f'attempt = {attempt}, '
+
+
+def retry_deco(  # pylint: disable=too-many-arguments
     max_attempts: int | None = 1,
-    expected_exceptions: list[Type[Exception]] | None = None
+    expected_exceptions: list[Type[Exception]] | None = None,
+    circuit_breaker: CircuitBreaker | str | None = None,
+    retry_budget: RetryBudget | str | None = None,
+    hedge_delay: float | None = None,
+    max_hedges: int = 1,
 ):
     """
         A decorator to retry a function up to `max_attempts` if it raises
@@ -29,41 +109,130 @@ def retry_deco(
             expected_exceptions (list[Type[Exception]] | None):
             List of exceptions to handle without retrying.
 
+            circuit_breaker (CircuitBreaker | str | None):
+            Circuit breaker guarding every attempt, or the name of a shared one.
+            Expected exceptions are not counted as breaker failures.
+
+            retry_budget (RetryBudget | str | None):
+            Retry budget shared between call sites, or the name of a shared one.
+            Successful calls earn tokens, every retry spends one; when the budget
+            is exhausted the last exception is raised without retrying.
+
+            hedge_delay (float | None):
+            Seconds after which a still running attempt gets a parallel copy.
+            Only for idempotent functions; hedges also spend retry budget tokens.
+
+            max_hedges (int): Maximum number of parallel copies per attempt.
+
         Returns:
-            Decorated function with retry mechanism.
+            Decorated function with retry mechanism. With hedging enabled it
+            has a `hedge_stats` attribute with hedging counters.
         """
+    if isinstance(circuit_breaker, str):
+        circuit_breaker = get_circuit_breaker(circuit_breaker)
+    if isinstance(retry_budget, str):
+        retry_budget = get_retry_budget(retry_budget)
+    guards = _RetryGuards(circuit_breaker, retry_budget)
+
     def wrapper(func):
-        @functools.wraps(func)
-        def wrapped(*args, **kwargs):
-            attempt = 1
-            while attempt <= max_attempts:
-                function_info = f'run "{func.__name__}" with '
-                if args:
-                    function_info += f'positional args = {args}, '
-                if kwargs:
-                    function_info += f'keyword kwargs = {kwargs}, '
-                function_info += f'attempt = {attempt}, '
-
-                try:
-                    result = func(*args, **kwargs)
-                except tuple(expected_exceptions or []) as e:
-                    function_info += f'expected exception = {type(e).__name__}'
-                    raise
-                except Exception as e:
-                    function_info += f'exception = {type(e).__name__}'
-                    attempt += 1
-                    if attempt > max_attempts:
-                        raise
-                else:
-                    function_info += f'result = {result}'
-                    return result
-                finally:
-                    print(function_info)
-            return None
+        hedge_stats = HedgeStats()
+        if inspect.iscoroutinefunction(func):
+            async def call_async(*args, **kwargs):
+                if hedge_delay is None:
+                    return await func(*args, **kwargs)
+                return await call_hedged_async(
+                    func, args, kwargs, hedge_delay, max_hedges, guards.allow_retry, hedge_stats
+                )
+            wrapped = _retry_async(func, call_async, max_attempts, tuple(expected_exceptions or []), guards)
+        else:
+            def call(*args, **kwargs):
+                if hedge_delay is None:
+                    return func(*args, **kwargs)
+                return call_hedged(
+                    func, args, kwargs, hedge_delay, max_hedges, guards.allow_retry, hedge_stats
+                )
+            wrapped = _retry_sync(func, call, max_attempts, tuple(expected_exceptions or []), guards)
+
+        if hedge_delay is not None:
+            wrapped.hedge_stats = hedge_stats
         return wrapped
     return wrapper
 
 
+def _retry_sync(func, call, max_attempts: int, expected_exceptions: tuple, guards: _RetryGuards):
+    """Builds the retrying wrapper of a sync function, every attempt runs `call`."""
+    @functools.wraps(func)
+    def wrapped(*args, **kwargs):
+        attempt = 1
+        while attempt <= max_attempts:
+            function_info = _describe_attempt(func, args, kwargs, attempt)
+            permit = guards.before_attempt(function_info)
+            try:
+                result = call(*args, **kwargs)
+            except expected_exceptions as e:
+                function_info += f'expected exception = {type(e).__name__}'
+                guards.on_expected_exception(permit)
+                raise
+            except Exception as e:
+                function_info += f'exception = {type(e).__name__}'
+                guards.on_failure(permit)
+                attempt += 1
+                if attempt > max_attempts:
+                    raise
+                if not guards.allow_retry():
+                    function_info += ', retry budget exhausted'
+                    raise
+            except BaseException as e:
+                function_info += f'interrupted = {type(e).__name__}'
+                guards.on_interrupt(permit)
+                raise
+            else:
+                function_info += f'result = {result}'
+                guards.on_success(permit)
+                return result
+            finally:
+                print(function_info)
+        return None
+    return wrapped
+
+
+def _retry_async(func, call, max_attempts: int, expected_exceptions: tuple, guards: _RetryGuards):
+    """Builds the retrying wrapper of a coroutine function, every attempt awaits `call`."""
+    @functools.wraps(func)
+    async def wrapped(*args, **kwargs):
+        attempt = 1
+        while attempt <= max_attempts:
+            function_info = _describe_attempt(func, args, kwargs, attempt)
+            permit = guards.before_attempt(function_info)
+            try:
+                result = await call(*args, **kwargs)
+            except expected_exceptions as e:
+                function_info += f'expected exception = {type(e).__name__}'
+                guards.on_expected_exception(permit)
+                raise
+            except Exception as e:
+                function_info += f'exception = {type(e).__name__}'
+                guards.on_failure(permit)
+                attempt += 1
+                if attempt > max_attempts:
+                    raise
+                if not guards.allow_retry():
+                    function_info += ', retry budget exhausted'
+                    raise
+            except BaseException as e:
+                function_info += f'interrupted = {type(e).__name__}'
+                guards.on_interrupt(permit)
+                raise
+            else:
+                function_info += f'result = {result}'
+                guards.on_success(permit)
+                return result
+            finally:
+                print(function_info)
+        return None
+    return wrapped
+
+
 @retry_deco(3)
 def add(a, b):
     """
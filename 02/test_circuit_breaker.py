@@ -0,0 +1,230 @@
+"""
+This module contains unit tests for the CircuitBreaker class and its
+integration with the retry_deco decorator.
+
+The tests cover:
+- State transitions driven by the failure rate window.
+- Fail-fast rejections while the breaker is open and half-open probes.
+- Sharing a breaker by name between decorated functions.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerOpenError, get_circuit_breaker
+)
+from retry_deco import retry_deco
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """
+    A manually advanced time source for the breaker.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_opens_after_failure_rate_exceeded():
+    """
+    Test that the breaker opens only after `min_calls` outcomes were recorded
+    and the failure rate reached the threshold.
+    """
+    breaker = CircuitBreaker('test', failure_rate_threshold=0.5, window_size=4, min_calls=4)
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.failure_rate == 0.5
+
+    breaker.record_failure()  # window = [fail, fail, success, fail]
+    assert breaker.state == OPEN
+    assert breaker.stats['transitions'] == {'closed->open': 1}
+
+
+def test_window_forgets_old_outcomes():
+    """
+    Test that only the last `window_size` outcomes affect the failure rate.
+    """
+    breaker = CircuitBreaker('test', failure_rate_threshold=0.75, window_size=4, min_calls=4)
+    for _ in range(2):
+        breaker.record_failure()
+    for _ in range(4):
+        breaker.record_success()
+    assert breaker.failure_rate == 0
+    assert breaker.state == CLOSED
+
+
+def test_open_rejects_then_half_open_probe_closes():
+    """
+    Test that an open breaker rejects calls until `reset_timeout` passes,
+    then lets a limited number of probes through and closes after they succeed.
+    """
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        'test', window_size=2, min_calls=1, reset_timeout=10, half_open_max_calls=2, clock=clock
+    )
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+    assert breaker.stats['rejected'] == 1
+
+    clock.now = 10
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request()
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == HALF_OPEN
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.stats['rejected'] == 2
+    assert breaker.stats['transitions'] == {
+        'closed->open': 1, 'open->half_open': 1, 'half_open->closed': 1
+    }
+
+
+def test_half_open_failure_reopens():
+    """
+    Test that a failed probe moves the breaker back to the open state.
+    """
+    clock = FakeClock()
+    transitions = []
+    breaker = CircuitBreaker('test', window_size=1, min_calls=1, reset_timeout=5, clock=clock)
+    breaker.add_listener(lambda name, old, new: transitions.append((name, old, new)))
+
+    breaker.record_failure()
+    clock.now = 5
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert transitions == [
+        ('test', CLOSED, OPEN), ('test', OPEN, HALF_OPEN), ('test', HALF_OPEN, OPEN)
+    ]
+
+
+def test_incorrect_options():
+    """
+    Test that invalid breaker options raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        CircuitBreaker('test', failure_rate_threshold=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker('test', window_size=0)
+
+
+def test_get_circuit_breaker_is_shared_by_name():
+    """
+    Test that the registry returns the same breaker for the same name.
+    """
+    breaker = get_circuit_breaker('shared-test', window_size=3)
+    assert get_circuit_breaker('shared-test') is breaker
+    assert get_circuit_breaker('other-shared-test') is not breaker
+
+
+def test_retry_deco_fails_fast_when_open():
+    """
+    Test that a decorated function is not attempted while its breaker is open,
+    and that the breaker is shared between functions by name.
+    """
+    breaker = get_circuit_breaker('retry-deco-test', window_size=2, min_calls=2, reset_timeout=60)
+    call_count = 0
+
+    @retry_deco(5, circuit_breaker='retry-deco-test')
+    def always_fail():
+        nonlocal call_count
+        call_count += 1
+        raise ConnectionError
+
+    @retry_deco(1, circuit_breaker='retry-deco-test')
+    def succeed():
+        return 'success'
+
+    with patch('builtins.print') as mock_print:
+        with pytest.raises(CircuitBreakerOpenError):
+            always_fail()
+        assert call_count == 2
+        mock_print.assert_called_with(
+            'run "always_fail" with attempt = 3, rejected by circuit breaker = retry-deco-test'
+        )
+
+        with pytest.raises(CircuitBreakerOpenError):
+            succeed()
+    assert breaker.stats['rejected'] == 2
+
+
+def test_retry_deco_expected_exception_is_not_failure():
+    """
+    Test that expected exceptions do not count as breaker failures.
+    """
+    breaker = CircuitBreaker('test', window_size=1, min_calls=1)
+
+    @retry_deco(3, [ValueError], circuit_breaker=breaker)
+    def raise_value_error():
+        raise ValueError
+
+    with patch('builtins.print'):
+        with pytest.raises(ValueError):
+            raise_value_error()
+    assert breaker.state == CLOSED
+    assert breaker.failure_rate == 0
+
+
+def test_stale_outcome_is_ignored():
+    """
+    Test that a call admitted while closed and finishing after the breaker
+    went half-open neither counts as a probe nor closes the breaker.
+    """
+    clock = FakeClock()
+    breaker = CircuitBreaker('test', window_size=1, min_calls=1, reset_timeout=5, clock=clock)
+    slow_call = breaker.allow_request()
+    breaker.record_failure(breaker.allow_request())
+    clock.now = 5
+    assert breaker.state == HALF_OPEN
+
+    breaker.record_success(slow_call)
+    breaker.record_failure(slow_call)
+    breaker.record_success()
+    assert breaker.state == HALF_OPEN
+
+    probe = breaker.allow_request()
+    assert probe.probe and not breaker.allow_request()
+    breaker.record_success(probe)
+    assert breaker.state == CLOSED
+
+
+def test_cancelled_probe_returns_its_slot():
+    """
+    Test that a half-open probe cancelled by a timeout releases its slot,
+    so the next call is let through as a probe.
+    """
+    clock = FakeClock()
+    breaker = CircuitBreaker('test', window_size=1, min_calls=1, reset_timeout=5, clock=clock)
+    breaker.record_failure()
+    clock.now = 5
+
+    @retry_deco(1, circuit_breaker=breaker)
+    async def fetch(delay):
+        await asyncio.sleep(delay)
+        return delay
+
+    with patch('builtins.print') as mock_print:
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(fetch(1), 0.01))
+        mock_print.assert_called_with(
+            'run "fetch" with positional args = (1,), attempt = 1, interrupted = CancelledError'
+        )
+        assert breaker.state == HALF_OPEN
+        assert asyncio.run(fetch(0)) == 0
+    assert breaker.state == CLOSED
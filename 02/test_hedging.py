@@ -0,0 +1,214 @@
+"""
+This module contains unit tests for hedged attempts made by the retry_deco decorator.
+
+The tests cover:
+- A slow primary call being beaten by a hedge for sync functions and coroutines.
+- A fast primary call not launching any hedge.
+- The cap on the number of hedges and failures of every copy.
+- The worker slots held by every copy and cancellation of the awaiting coroutine.
+- Retrying of coroutine functions without hedging.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+import hedging
+from hedging import HedgeStats
+from retry_budget import RetryBudget
+from retry_deco import retry_deco
+
+
+def test_hedge_wins_over_slow_primary():
+    """
+    Test that a hedge launched after `hedge_delay` returns the result
+    while the slow primary call is abandoned.
+    """
+    call_count = 0
+    lock = threading.Lock()
+
+    @retry_deco(1, hedge_delay=0.01)
+    def slow_first_call():
+        nonlocal call_count
+        with lock:
+            call_count += 1
+            current_call = call_count
+        if current_call == 1:
+            time.sleep(0.5)
+            return 'primary'
+        return 'hedge'
+
+    with patch('builtins.print') as mock_print:
+        assert slow_first_call() == 'hedge'
+        mock_print.assert_called_once_with('run "slow_first_call" with attempt = 1, result = hedge')
+    assert slow_first_call.hedge_stats.as_dict() == {
+        'attempts': 1, 'hedges_launched': 1, 'primary_wins': 0, 'hedge_wins': 1
+    }
+
+
+def test_fast_primary_launches_no_hedge():
+    """
+    Test that a call completing before `hedge_delay` is not hedged.
+    """
+    @retry_deco(1, hedge_delay=1)
+    def fast():
+        return 'fast'
+
+    with patch('builtins.print'):
+        assert fast() == 'fast'
+    assert fast.hedge_stats.as_dict() == {
+        'attempts': 1, 'hedges_launched': 0, 'primary_wins': 1, 'hedge_wins': 0
+    }
+
+
+def test_max_hedges_and_all_copies_failing():
+    """
+    Test that no more than `max_hedges` copies are launched and that the
+    attempt fails only when every copy failed.
+    """
+    @retry_deco(1, hedge_delay=0.01, max_hedges=2)
+    def slow_failure():
+        time.sleep(0.05)
+        raise ConnectionError
+
+    with patch('builtins.print'):
+        with pytest.raises(ConnectionError):
+            slow_failure()
+    assert slow_failure.hedge_stats.as_dict() == {
+        'attempts': 1, 'hedges_launched': 2, 'primary_wins': 0, 'hedge_wins': 0
+    }
+
+
+def test_hedges_spend_retry_budget():
+    """
+    Test that hedges are not launched when the retry budget is exhausted.
+    """
+    budget = RetryBudget('test', max_tokens=1)
+    budget.try_spend()
+
+    @retry_deco(1, retry_budget=budget, hedge_delay=0.01)
+    def slow():
+        time.sleep(0.05)
+        return 'slow'
+
+    with patch('builtins.print'):
+        assert slow() == 'slow'
+    assert slow.hedge_stats.hedges_launched == 0
+
+
+def test_abandoned_copies_hold_worker_slots():
+    """
+    Test that an abandoned primary keeps its worker slot until its thread returns,
+    and that copies without a free slot run on the calling thread instead of queueing.
+    """
+    released = threading.Event()
+    behaviours = iter(['hang', 'fast', 'fast', 'hang', 'fast', 'fast'])
+
+    @retry_deco(1, hedge_delay=0.01)
+    def flaky():
+        if next(behaviours) == 'hang':
+            released.wait(2)
+        return threading.current_thread().name
+
+    caller = threading.current_thread().name
+    with patch('builtins.print'), patch.object(hedging, '_worker_slots', threading.BoundedSemaphore(2)):
+        assert flaky().startswith('retry-hedge')
+        with hedging._worker_slots:  # pylint: disable=protected-access
+            assert flaky() == caller
+        start_time = time.monotonic()
+        assert flaky() == caller
+        assert time.monotonic() - start_time < 0.5
+        released.set()
+        time.sleep(0.05)
+        assert flaky().startswith('retry-hedge')
+    assert flaky.hedge_stats.as_dict() == {
+        'attempts': 4, 'hedges_launched': 2, 'primary_wins': 2, 'hedge_wins': 2
+    }
+
+
+def test_hedge_stats_record():
+    """
+    Test the counters of HedgeStats.
+    """
+    stats = HedgeStats()
+    stats.record(0, False)
+    stats.record(2, True)
+    stats.record(1, None)
+    assert stats.as_dict() == {'attempts': 3, 'hedges_launched': 3, 'primary_wins': 1, 'hedge_wins': 1}
+
+
+@pytest.mark.asyncio
+async def test_async_hedge_wins_over_slow_primary():
+    """
+    Test that a hedge task beats a slow primary coroutine and the loser is cancelled.
+    """
+    call_count = 0
+    cancelled = asyncio.Event()
+
+    @retry_deco(1, hedge_delay=0.01)
+    async def slow_first_call():
+        nonlocal call_count
+        call_count += 1
+        if call_count == 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return 'primary'
+        return 'hedge'
+
+    with patch('builtins.print'):
+        assert await slow_first_call() == 'hedge'
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert slow_first_call.hedge_stats.hedge_wins == 1
+
+
+@pytest.mark.asyncio
+async def test_async_cancellation_cancels_every_copy():
+    """
+    Test that cancelling the awaiting coroutine cancels the primary and hedge tasks.
+    """
+    started = running = 0
+
+    @retry_deco(1, hedge_delay=0.01, max_hedges=2)
+    async def hang():
+        nonlocal started, running
+        started += 1
+        running += 1
+        try:
+            await asyncio.sleep(1)
+        finally:
+            running -= 1
+
+    with patch('builtins.print'):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(hang(), 0.05)
+    await asyncio.sleep(0)
+    assert started == 3
+    assert running == 0
+
+
+@pytest.mark.asyncio
+async def test_async_retry_without_hedging():
+    """
+    Test that coroutine functions are awaited and retried.
+    """
+    call_count = 0
+
+    @retry_deco(3)
+    async def fail_once():
+        nonlocal call_count
+        call_count += 1
+        if call_count < 2:
+            raise ValueError
+        return 'success'
+
+    with patch('builtins.print') as mock_print:
+        assert await fail_once() == 'success'
+        mock_print.assert_any_call('run "fail_once" with attempt = 1, exception = ValueError')
+        mock_print.assert_any_call('run "fail_once" with attempt = 2, result = success')
+    assert not hasattr(fail_once, 'hedge_stats')
@@ -0,0 +1,109 @@
+"""
+This module contains unit tests for the RetryBudget class and its
+integration with the retry_deco decorator.
+
+The tests cover:
+- Earning and spending tokens, including the bucket capacity.
+- Concurrent spending from many threads.
+- Denying retries in retry_deco once the shared budget is exhausted.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from retry_budget import RetryBudget, get_retry_budget
+from retry_deco import retry_deco
+
+
+def test_spend_and_deposit():
+    """
+    Test that retries spend whole tokens and successes earn `ratio` tokens
+    without exceeding `max_tokens`.
+    """
+    budget = RetryBudget('test', ratio=0.5, max_tokens=2)
+    assert budget.tokens == 2
+    budget.deposit()
+    assert budget.tokens == 2
+
+    assert budget.try_spend()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    assert budget.tokens == 0
+
+    budget.deposit()
+    assert not budget.try_spend()
+    budget.deposit()
+    assert budget.try_spend()
+    assert budget.stats == {'name': 'test', 'tokens': 0, 'spent': 3, 'denied': 2}
+
+
+def test_incorrect_options():
+    """
+    Test that invalid budget options raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        RetryBudget('test', ratio=0)
+    with pytest.raises(ValueError):
+        RetryBudget('test', max_tokens=0.5)
+
+
+def test_concurrent_spend_never_overdraws():
+    """
+    Test that concurrent retries never spend more tokens than available.
+    """
+    budget = RetryBudget('test', max_tokens=100)
+    allowed = []
+
+    def spend():
+        allowed.append(sum(budget.try_spend() for _ in range(50)))
+
+    threads = [threading.Thread(target=spend) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(allowed) == 100
+    assert budget.tokens == 0
+
+
+def test_get_retry_budget_is_shared_by_name():
+    """
+    Test that the registry returns the same budget for the same name.
+    """
+    budget = get_retry_budget('shared-budget-test', max_tokens=3)
+    assert get_retry_budget('shared-budget-test') is budget
+    assert budget.max_tokens == 3
+
+
+def test_retry_deco_stops_when_budget_exhausted():
+    """
+    Test that retry_deco stops retrying once the shared budget is empty
+    and that successful calls refill it.
+    """
+    budget = get_retry_budget('retry-deco-budget-test', ratio=0.5, max_tokens=1)
+    call_count = 0
+
+    @retry_deco(5, retry_budget='retry-deco-budget-test')
+    def always_fail():
+        nonlocal call_count
+        call_count += 1
+        raise ConnectionError
+
+    @retry_deco(1, retry_budget='retry-deco-budget-test')
+    def succeed():
+        return 'success'
+
+    with patch('builtins.print') as mock_print:
+        with pytest.raises(ConnectionError):
+            always_fail()
+        assert call_count == 2
+        mock_print.assert_called_with(
+            'run "always_fail" with attempt = 2, exception = ConnectionError, retry budget exhausted'
+        )
+
+        succeed()
+        succeed()
+    assert budget.tokens == 1
@@ -0,0 +1,290 @@
+"""
+This module contains the ArrayCustomList class, a compact counterpart of CustomList.
+Elements are stored in a typed `array('q')` buffer (8 bytes per element instead of
+a boxed int plus a list pointer), and element-wise addition and subtraction run as
+`map` over `operator` functions, so the per-element loop stays in C.
+
+Addition and subtraction follow the CustomList rules: the shorter operand is padded
+with zeros and an integer operand is broadcast to every element. Comparisons are
+based on the sum of the elements.
+"""
+
+
+from __future__ import annotations
+
+import operator
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import chain, islice, repeat
+
+from custom_list import CustomList
+
+TYPECODE = 'q'
+CHUNK_SIZE = 1 << 16
+
+
+def combine_into(  # pylint: disable=too-many-arguments
+    out: memoryview | array,
+    left: Sequence[int] | int,
+    right: Sequence[int] | int,
+    operator_func: Callable[[int, int], int],
+    start: int = 0,
+    stop: int | None = None,
+) -> int:
+    """
+        Writes `operator_func(left, right)` element-wise into the preallocated buffer `out`
+        for the index range [start, stop), in chunks of `CHUNK_SIZE` elements, so no
+        temporary of the full result length is built. The shorter operand is padded with
+        zeros and an integer operand is broadcast, as for CustomList.
+
+        :param out: A writable `q` buffer at least as long as the longest operand.
+        :param left: Left operand: a sequence of integers or a single integer.
+        :param right: Right operand: a sequence of integers or a single integer.
+        :param operator_func: `operator.add` or `operator.sub`.
+        :param start: First index to compute.
+        :param stop: Index after the last one to compute, the end of `out` by default.
+        :return: The sum of the written elements.
+    """
+    stop = len(out) if stop is None else stop
+    total = 0
+    left_length = len(out) if isinstance(left, int) else len(left)
+    right_length = len(out) if isinstance(right, int) else len(right)
+    for chunk_start in range(start, stop, CHUNK_SIZE):
+        chunk_stop = min(chunk_start + CHUNK_SIZE, stop)
+        left_chunk = _padded_chunk(left, left_length, chunk_start, chunk_stop)
+        right_chunk = _padded_chunk(right, right_length, chunk_start, chunk_stop)
+        chunk = array(TYPECODE, map(operator_func, left_chunk, right_chunk))
+        out[chunk_start:chunk_stop] = chunk
+        total += sum(chunk)
+    return total
+
+
+def _padded_chunk(values: Sequence[int] | int, length: int, start: int, stop: int) -> Iterable[int]:
+    """
+        Returns the elements of `values` in [start, stop), padded with zeros past `length`.
+    """
+    if isinstance(values, int):
+        return repeat(values, stop - start)
+    if stop <= length:
+        return values[start:stop]
+    return chain(values[start:length] if start < length else (), repeat(0, stop - max(start, length)))
+
+
+class ArrayCustomList:
+    """
+        ArrayCustomList stores integers in a typed array and supports the same
+        element-wise arithmetic and sum-based comparisons as CustomList.
+    """
+
+    def __init__(self, values: Iterable[int] | None = None):
+        """
+            Initializes the ArrayCustomList with the given values.
+            If no values are provided, an empty buffer is initialized.
+        """
+        self._data = array(TYPECODE, [] if values is None else values)
+
+    @classmethod
+    def from_array(cls, data: array) -> ArrayCustomList:
+        """
+            Wraps an existing typed array without copying it.
+
+            :param data: An array with the `q` typecode.
+            :return: A new ArrayCustomList sharing the buffer.
+        """
+        if data.typecode != TYPECODE:
+            raise TypeError(f'Expected array with typecode {TYPECODE!r}, got {data.typecode!r}')
+        instance = cls()
+        instance._data = data
+        return instance
+
+    @property
+    def data(self) -> array:
+        """Returns the underlying typed buffer."""
+        return self._data
+
+    @property
+    def total(self) -> int:
+        """Returns the sum of the elements."""
+        return sum(self._data)
+
+    @staticmethod
+    def _combine(
+        left: Sequence[int], right: Sequence[int], operator_func: Callable[[int, int], int]
+    ) -> array:
+        """
+            Applies `operator_func` element-wise, padding the shorter operand with zeros.
+
+            :param left: Left operand.
+            :param right: Right operand.
+            :param operator_func: `operator.add` or `operator.sub`.
+            :return: A new typed array with the result.
+        """
+        common_length = min(len(left), len(right))
+        result = array(TYPECODE, map(operator_func, left, right))
+        if len(left) > common_length:
+            result.extend(islice(left, common_length, None))
+        elif len(right) > common_length:
+            tail = islice(right, common_length, None)
+            result.extend(tail if operator_func is operator.add else map(operator.neg, tail))
+        return result
+
+    def _operate(
+        self, other: Sequence[int] | int, operator_func: Callable[[int, int], int], reflected: bool = False
+    ) -> ArrayCustomList:
+        """
+            A helper function for performing element-wise operations (addition or subtraction).
+
+            :param other: A list, CustomList, ArrayCustomList or a single integer.
+            :param operator_func: `operator.add` or `operator.sub`.
+            :param reflected: True if `other` is the left operand.
+            :return: A new ArrayCustomList instance with the result of the operation.
+        """
+        if isinstance(other, int):
+            if not self._data:
+                values = [operator_func(other, 0) if reflected else operator_func(0, other)]
+            elif reflected:
+                values = map(operator_func, repeat(other), self._data)
+            else:
+                values = map(operator_func, self._data, repeat(other))
+            return ArrayCustomList(values)
+
+        if isinstance(other, ArrayCustomList):
+            other = other.data
+        elif not isinstance(other, list):
+            raise NotImplementedError
+
+        if reflected:
+            return ArrayCustomList.from_array(self._combine(other, self._data, operator_func))
+        return ArrayCustomList.from_array(self._combine(self._data, other, operator_func))
+
+    def __add__(self, other: Sequence[int] | int) -> ArrayCustomList:
+        """
+            Adds either another list or an integer to the current ArrayCustomList instance.
+
+            :param other: A list, CustomList, ArrayCustomList or a single integer.
+            :return: A new ArrayCustomList instance with the result of addition.
+        """
+        return self._operate(other, operator.add)
+
+    def __radd__(self, other: Sequence[int] | int) -> ArrayCustomList:
+        """
+            Handles the reverse addition case when ArrayCustomList is on the right-hand side of the `+`.
+
+            :param other: A list or a single integer.
+            :return: A new ArrayCustomList instance with the result of addition.
+        """
+        return self._operate(other, operator.add, reflected=True)
+
+    def __sub__(self, other: Sequence[int] | int) -> ArrayCustomList:
+        """
+            Subtracts either another list or an integer from the current ArrayCustomList instance.
+
+            :param other: A list, CustomList, ArrayCustomList or a single integer.
+            :return: A new ArrayCustomList instance with the result of subtraction.
+        """
+        return self._operate(other, operator.sub)
+
+    def __rsub__(self, other: Sequence[int] | int) -> ArrayCustomList:
+        """
+            Handles the reverse subtraction case when ArrayCustomList is on the right-hand side of the `-`.
+
+            :param other: A list or a single integer.
+            :return: A new ArrayCustomList instance with the result of subtraction.
+        """
+        return self._operate(other, operator.sub, reflected=True)
+
+    def _sum_of(self, other: ArrayCustomList | CustomList) -> int:
+        """
+            Returns the sum of another comparable instance.
+
+            :param other: An ArrayCustomList or CustomList instance.
+            :raises NotImplementedError: if `other` is of an unsupported type.
+        """
+        if isinstance(other, (ArrayCustomList, CustomList)):
+            return other.total
+        raise NotImplementedError
+
+    def __eq__(self, other: ArrayCustomList | CustomList) -> bool:
+        """
+            Compares the sums of the elements.
+
+            :param other: An ArrayCustomList or CustomList instance.
+            :return: True if sums are equal, False otherwise.
+        """
+        return self.total == self._sum_of(other)
+
+    def __ne__(self, other: ArrayCustomList | CustomList) -> bool:
+        """
+            Checks if the sums of the elements are not equal.
+
+            :param other: An ArrayCustomList or CustomList instance.
+            :return: True if sums are not equal, False otherwise.
+        """
+        return self.total != self._sum_of(other)
+
+    def __gt__(self, other: ArrayCustomList | CustomList) -> bool:
+        """
+            Checks if the sum of the current instance is greater than the sum of another one.
+
+            :param other: An ArrayCustomList or CustomList instance.
+            :return: True if current sum is greater, False otherwise.
+        """
+        return self.total > self._sum_of(other)
+
+    def __ge__(self, other: ArrayCustomList | CustomList) -> bool:
+        """
+            Checks if the sum of the current instance is greater than or equal to the sum of another one.
+
+            :param other: An ArrayCustomList or CustomList instance.
+            :return: True if current sum is greater or equal, False otherwise.
+        """
+        return self.total >= self._sum_of(other)
+
+    def __le__(self, other: ArrayCustomList | CustomList) -> bool:
+        """
+            Checks if the sum of the current instance is less than or equal to the sum of another one.
+
+            :param other: An ArrayCustomList or CustomList instance.
+            :return: True if current sum is less or equal, False otherwise.
+        """
+        return self.total <= self._sum_of(other)
+
+    def __lt__(self, other: ArrayCustomList | CustomList) -> bool:
+        """
+            Checks if the sum of the current instance is less than the sum of another one.
+
+            :param other: An ArrayCustomList or CustomList instance.
+            :return: True if current sum is less, False otherwise.
+        """
+        return self.total < self._sum_of(other)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._data)
+
+    def __getitem__(self, index: int | slice) -> int | ArrayCustomList:
+        if isinstance(index, slice):
+            return ArrayCustomList.from_array(self._data[index])
+        return self._data[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self._data[index] = value
+
+    def tolist(self) -> list[int]:
+        """
+            Returns the elements as a regular list.
+        """
+        return self._data.tolist()
+
+    def __repr__(self) -> str:
+        return f'ArrayCustomList({self._data.tolist()})'
+
+    def __str__(self) -> str:
+        """
+            Returns a string representation showing the elements and their sum.
+
+            :return: String representation of the elements and the sum of them.
+        """
+        return f'{self._data.tolist()}, sum = {self.total}'
@@ -0,0 +1,268 @@
+"""
+This script benchmarks CustomList operations and comparisons against other
+storage backends and baselines:
+1. CustomList, ArrayCustomList and TypedCustomList (int64).
+2. Plain lists with list comprehensions, as a baseline without any class overhead.
+3. NumPy arrays, if NumPy is installed.
+
+Every operation (add, sub, radd, rsub, int broadcast and the six comparisons) is
+measured for every length and length skew (the right operand has `length * skew`
+elements). The script reports:
+- operations per second, repeating the operation for at least `--min-time` seconds;
+- bytes allocated by one operation, traced with `tracemalloc`.
+
+Results are written as JSON. With `--compare`, they are compared to a previous
+JSON report, and the script exits with code 1 if any operation got slower than
+the baseline by more than `--tolerance`.
+
+Example:
+    python benchmark_custom_list.py --lengths 10 1000 --output baseline.json
+    python benchmark_custom_list.py --lengths 10 1000 --compare baseline.json
+"""
+
+import argparse
+import json
+import operator
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from itertools import zip_longest
+
+from array_custom_list import ArrayCustomList
+from custom_list import CustomList
+from typed_custom_list import TypedCustomList
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+LENGTHS = (10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+SKEWS = (1.0, 0.5, 0.01)
+INT_OPERAND = 7
+
+COMPARISONS = {
+    'eq': operator.eq, 'ne': operator.ne, 'lt': operator.lt,
+    'le': operator.le, 'gt': operator.gt, 'ge': operator.ge,
+}
+
+
+def operator_backend(factory: Callable[[list[int]], object]) -> dict:
+    """
+    Describe a backend implementing the CustomList operators.
+
+    Args:
+        factory: A function creating an instance from a list of integers.
+
+    Returns:
+        A backend description: the factory and a function for every operation. Operations
+        take the left and right operands and the right operand as a plain list, which is
+        the left operand of the reflected operations (radd, rsub).
+    """
+    operations = {
+        'add': lambda left, right, plain_right: left + right,
+        'sub': lambda left, right, plain_right: left - right,
+        'radd': lambda left, right, plain_right: plain_right + left,
+        'rsub': lambda left, right, plain_right: plain_right - left,
+        'add_int': lambda left, right, plain_right: left + INT_OPERAND,
+        'sub_int': lambda left, right, plain_right: left - INT_OPERAND,
+    }
+    for name, comparison in COMPARISONS.items():
+        operations[name] = lambda left, right, plain_right, comparison=comparison: comparison(left, right)
+    return {'create': factory, 'operations': operations}
+
+
+def list_comprehension_backend() -> dict:
+    """
+    Describe the baseline: plain lists, element-wise operations as list comprehensions
+    and comparisons of freshly computed sums.
+    """
+    def combine(left, right, operator_func):
+        return [operator_func(x, y) for x, y in zip_longest(left, right, fillvalue=0)]
+
+    operations = {
+        'add': lambda left, right, plain_right: combine(left, right, operator.add),
+        'sub': lambda left, right, plain_right: combine(left, right, operator.sub),
+        'radd': lambda left, right, plain_right: combine(right, left, operator.add),
+        'rsub': lambda left, right, plain_right: combine(right, left, operator.sub),
+        'add_int': lambda left, right, plain_right: [x + INT_OPERAND for x in left],
+        'sub_int': lambda left, right, plain_right: [x - INT_OPERAND for x in left],
+    }
+    for name, comparison in COMPARISONS.items():
+        operations[name] = lambda left, right, plain_right, comparison=comparison: comparison(sum(left), sum(right))
+    return {'create': list, 'operations': operations}
+
+
+def numpy_backend() -> dict:
+    """
+    Describe the NumPy baseline: int64 arrays, the shorter operand is padded with zeros.
+    """
+    def padded(first, second):
+        length = max(len(first), len(second))
+        return numpy.pad(first, (0, length - len(first))), numpy.pad(second, (0, length - len(second)))
+
+    operations = {
+        'add': lambda left, right, plain_right: numpy.add(*padded(left, right)),
+        'sub': lambda left, right, plain_right: numpy.subtract(*padded(left, right)),
+        'radd': lambda left, right, plain_right: numpy.add(*padded(right, left)),
+        'rsub': lambda left, right, plain_right: numpy.subtract(*padded(right, left)),
+        'add_int': lambda left, right, plain_right: left + INT_OPERAND,
+        'sub_int': lambda left, right, plain_right: left - INT_OPERAND,
+    }
+    for name, comparison in COMPARISONS.items():
+        operations[name] = lambda left, right, plain_right, comparison=comparison: comparison(left.sum(), right.sum())
+    return {'create': lambda values: numpy.array(values, dtype=numpy.int64), 'operations': operations}
+
+
+def available_backends() -> dict:
+    """
+    Return the backends that can run in the current environment, by name.
+    """
+    backends = {
+        'custom_list': operator_backend(CustomList),
+        'array_custom_list': operator_backend(ArrayCustomList),
+        'typed_custom_list': operator_backend(lambda values: TypedCustomList(values, 'int64')),
+        'list_comprehension': list_comprehension_backend(),
+    }
+    if numpy is not None:
+        backends['numpy'] = numpy_backend()
+    return backends
+
+
+def benchmark_operation(operation: Callable, operands: tuple, min_time: float) -> dict:
+    """
+    Measure the throughput and allocations of one operation.
+
+    Args:
+        operation: A function of the operands.
+        operands: The left, right and plain right operands.
+        min_time: Minimal total time of the repetitions, in seconds.
+
+    Returns:
+        A dict with operations per second and bytes allocated by one operation.
+    """
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    operation(*operands)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    runs = 0
+    start_time = time.perf_counter()
+    elapsed = 0.0
+    while runs == 0 or elapsed < min_time:
+        operation(*operands)
+        runs += 1
+        elapsed = time.perf_counter() - start_time
+    return {'ops_per_sec': runs / elapsed, 'bytes_allocated': peak - baseline}
+
+
+def run_benchmarks(
+    backends: dict, operations: list[str], lengths: list[int], skews: list[float], min_time: float
+) -> dict:
+    """
+    Run every operation of every backend for every length and skew, logging progress to stderr.
+
+    Returns:
+        The JSON report: environment description and a list of results.
+    """
+    results = []
+    for length in lengths:
+        for skew in skews:
+            left_values = [i % 1000 - 500 for i in range(length)]
+            right_values = [i % 997 - 498 for i in range(int(length * skew))]
+            for backend_name, backend in backends.items():
+                operands = backend['create'](left_values), backend['create'](right_values), right_values
+                for operation_name in operations:
+                    result = {
+                        'backend': backend_name, 'operation': operation_name, 'length': length, 'skew': skew,
+                        **benchmark_operation(backend['operations'][operation_name], operands, min_time),
+                    }
+                    results.append(result)
+                    print(
+                        f"{backend_name} {operation_name} length={length} skew={skew}: "
+                        f"{result['ops_per_sec']:.1f} ops/s, {result['bytes_allocated']} bytes",
+                        file=sys.stderr,
+                    )
+    return {
+        'environment': {'python': sys.version, 'platform': platform.platform(), 'min_time': min_time},
+        'results': results,
+    }
+
+
+def result_key(result: dict) -> tuple:
+    """
+    Return the key identifying a measured case across reports.
+    """
+    return result['backend'], result['operation'], result['length'], result['skew']
+
+
+def compare_reports(report: dict, baseline: dict, tolerance: float) -> list[dict]:
+    """
+    Compare results to the baseline report, case by case.
+
+    Args:
+        report: The current report.
+        baseline: A previous report.
+        tolerance: Allowed relative slowdown, e.g. 0.1 for 10%.
+
+    Returns:
+        Comparisons of the cases present in both reports: speedup (>1 is faster),
+        allocation ratio (<1 is less memory) and whether the case regressed.
+    """
+    baseline_results = {result_key(result): result for result in baseline['results']}
+    comparisons = []
+    for result in report['results']:
+        previous = baseline_results.get(result_key(result))
+        if previous is None:
+            continue
+        speedup = result['ops_per_sec'] / previous['ops_per_sec']
+        memory_ratio = (result['bytes_allocated'] + 1) / (previous['bytes_allocated'] + 1)
+        comparisons.append({
+            'backend': result['backend'], 'operation': result['operation'],
+            'length': result['length'], 'skew': result['skew'],
+            'speedup': speedup, 'memory_ratio': memory_ratio,
+            'regression': speedup < 1 - tolerance,
+        })
+    return comparisons
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """
+        Provides benchmarks
+    """
+    backends = available_backends()
+    operations = list(operator_backend(list)['operations'])
+
+    parser = argparse.ArgumentParser(description="Benchmark CustomList operations and comparisons.")
+    parser.add_argument("--lengths", type=int, nargs="+", default=list(LENGTHS), help="Lengths of the left operand.")
+    parser.add_argument("--skews", type=float, nargs="+", default=list(SKEWS),
+                        help="Length of the right operand relative to the left one.")
+    parser.add_argument("--backends", nargs="+", choices=list(backends), default=list(backends))
+    parser.add_argument("--operations", nargs="+", choices=operations, default=operations)
+    parser.add_argument("--min-time", type=float, default=0.1, help="Minimal time per case, in seconds.")
+    parser.add_argument("--output", help="Write the JSON report to a file instead of stdout.")
+    parser.add_argument("--compare", help="Compare the results to a previous JSON report.")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed relative slowdown for --compare.")
+    args = parser.parse_args(arguments)
+
+    report = run_benchmarks(
+        {name: backends[name] for name in args.backends}, args.operations, args.lengths, args.skews, args.min_time
+    )
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            report['comparison'] = compare_reports(report, json.load(file), args.tolerance)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    return int(any(comparison['regression'] for comparison in report.get('comparison', ())))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
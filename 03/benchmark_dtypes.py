@@ -0,0 +1,83 @@
+"""
+This script benchmarks the storage of CustomList elements with different dtypes:
+1. CustomList: a regular list of boxed Python ints.
+2. TypedCustomList with `int16`, `int32` and `int64` elements.
+
+The script measures:
+- Memory per element, traced with `tracemalloc` while the instance is created.
+- Element-wise addition throughput, in elements per second.
+- Addition throughput when every result overflows, for each overflow policy.
+"""
+
+import time
+import tracemalloc
+
+from custom_list import CustomList
+from typed_custom_list import OVERFLOW_POLICIES, TypedCustomList, dtype_bounds
+
+
+def benchmark_memory(factory, n: int) -> float:
+    """
+    Measure the memory held per element by an instance, including the int objects
+    a regular list has to allocate for values outside of the small int cache.
+
+    Args:
+        factory: A function creating an instance from an iterable of values.
+        n: Number of elements.
+
+    Returns:
+        Allocated bytes per element.
+    """
+    tracemalloc.start()
+    instance = factory(1000 + i % 10_000 for i in range(n))
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instance
+    return allocated / n
+
+
+def benchmark_addition(left, right, repetitions: int = 5) -> float:
+    """
+    Measure element-wise addition throughput.
+
+    Args:
+        left: Left operand.
+        right: Right operand.
+        repetitions: Number of additions, the fastest one is reported.
+
+    Returns:
+        Elements per second.
+    """
+    best = float('inf')
+    for _ in range(repetitions):
+        start_time = time.perf_counter()
+        _ = left + right
+        best = min(best, time.perf_counter() - start_time)
+    return len(left) / best
+
+
+def main():
+    """
+        Provides benchmarks
+    """
+    n = 1_000_000
+    values = [i % 100 for i in range(n)]
+
+    factories = {'CustomList': CustomList}
+    for dtype in ('int16', 'int32', 'int64'):
+        factories[dtype] = lambda values, dtype=dtype: TypedCustomList(values, dtype)
+
+    for name, factory in factories.items():
+        memory = benchmark_memory(factory, n)
+        throughput = benchmark_addition(factory(values), factory(values))
+        print(f"{name}: Memory: {memory:.2f} bytes/element, Addition: {throughput / 1e6:.2f}M elements/s")
+
+    _, high = dtype_bounds('int16')
+    for overflow in OVERFLOW_POLICIES[1:]:
+        left = TypedCustomList([high] * n, 'int16', overflow)
+        throughput = benchmark_addition(left, TypedCustomList([1] * n, 'int16'))
+        print(f"int16 overflow, {overflow}: Addition: {throughput / 1e6:.2f}M elements/s")
+
+
+if __name__ == '__main__':
+    main()
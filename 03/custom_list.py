@@ -3,12 +3,16 @@ This module contains the CustomList class, which extends the functionality
 of Python's built-in list. It allows addition and subtraction of CustomList
 instances, integers, and regular lists, as well as element-wise operations.
 It also includes comparison operations based on the sum of the list elements.
+The sum is cached and kept up to date by every mutating list method,
+so comparisons do not rescan the elements.
 """
 
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from itertools import islice
+from typing import SupportsIndex
 
 
 class CustomList(list):
@@ -17,7 +21,8 @@ class CustomList(list):
         and subtraction of lists, integers, and other CustomList instances.
 
         It also supports element-wise operations and compares the sum of elements
-        between instances.
+        between instances. The sum is cached in `_sum`, every mutating method
+        updates it incrementally and notifies the registered sum watchers.
         """
 
     def __init__(self, values: list[int] | None = None):
@@ -28,6 +33,103 @@ class CustomList(list):
         if values is None:
             values = []
         super().__init__(values)
+        self._sum = sum(self)
+        self._sum_watchers = None
+
+    @property
+    def total(self) -> int:
+        """Returns the cached sum of the elements."""
+        return self._sum
+
+    def add_sum_watcher(self, watcher: Callable[[CustomList, int, int], None]) -> None:
+        """
+            Registers a function called as `watcher(custom_list, old_sum, new_sum)`
+            after every mutation that changes the sum, e.g. to keep an index up to date.
+        """
+        if self._sum_watchers is None:
+            self._sum_watchers = []
+        self._sum_watchers.append(watcher)
+
+    def remove_sum_watcher(self, watcher: Callable[[CustomList, int, int], None]) -> None:
+        """Unregisters a function added with `add_sum_watcher`."""
+        self._sum_watchers.remove(watcher)
+
+    def _update_sum(self, delta: int) -> None:
+        """Adds `delta` to the cached sum and notifies the sum watchers about the change."""
+        if not delta:
+            return
+        old_sum = self._sum
+        self._sum = old_sum + delta
+        if self._sum_watchers:
+            for watcher in self._sum_watchers:
+                watcher(self, old_sum, self._sum)
+
+    def __reduce__(self):
+        """
+            Pickles and copies the CustomList through its constructor,
+            so the cached sum is recomputed for the new instance and sum watchers
+            are not copied.
+        """
+        return self.__class__, (list(self),)
+
+    def append(self, value: int) -> None:
+        """Appends a value, updating the cached sum."""
+        super().append(value)
+        self._update_sum(value)
+
+    def extend(self, values: Iterable[int]) -> None:
+        """Extends the list with values, updating the cached sum."""
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        added = sum(values)
+        super().extend(values)
+        self._update_sum(added)
+
+    def insert(self, index: SupportsIndex, value: int) -> None:
+        """Inserts a value before index, updating the cached sum."""
+        super().insert(index, value)
+        self._update_sum(value)
+
+    def pop(self, index: SupportsIndex = -1) -> int:
+        """Removes and returns the item at index, updating the cached sum."""
+        value = super().pop(index)
+        self._update_sum(-value)
+        return value
+
+    def remove(self, value: int) -> None:
+        """Removes the first occurrence of value, updating the cached sum."""
+        self.pop(self.index(value))
+
+    def clear(self) -> None:
+        """Removes all items and resets the cached sum."""
+        super().clear()
+        self._update_sum(-self._sum)
+
+    def __setitem__(self, index: SupportsIndex | slice, value: int | Iterable[int]) -> None:
+        """Sets an item or a slice, updating the cached sum by the difference."""
+        if isinstance(index, slice):
+            removed = super().__getitem__(index)
+            if not isinstance(value, (list, tuple)):
+                value = list(value)
+            added = sum(value)
+            super().__setitem__(index, value)
+            self._update_sum(added - sum(removed))
+        else:
+            removed = super().__getitem__(index)
+            super().__setitem__(index, value)
+            self._update_sum(value - removed)
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        """Deletes an item or a slice, updating the cached sum."""
+        removed = super().__getitem__(index)
+        super().__delitem__(index)
+        self._update_sum(-(sum(removed) if isinstance(index, slice) else removed))
+
+    def __imul__(self, times: SupportsIndex) -> CustomList:
+        """Repeats the list in place (`*=`), scaling the cached sum."""
+        super().__imul__(times)
+        self._update_sum((self._sum * times if self else 0) - self._sum)
+        return self
 
     def _operate(self, other: list[int] | int, operator: Callable[[int, int], int]) -> CustomList:
         """
@@ -52,6 +154,55 @@ class CustomList(list):
             raise NotImplementedError
         return CustomList(result)
 
+    def _operate_inplace(self, other: list[int] | int, operator: Callable[[int, int], int]) -> CustomList:
+        """
+            A helper function for performing element-wise operations in place.
+            Elements are updated one by one, the list is only grown (with the operation
+            applied to zero padding) when `other` is longer, so no temporary list is built.
+
+            :param other: A list of integers or a single integer.
+            :param operator: A function defining the operation to be performed.
+            :return: The current CustomList instance.
+        """
+        set_item = super().__setitem__
+        get_item = super().__getitem__
+        if isinstance(other, int):
+            if not self:
+                super().append(operator(0, other))
+                self._update_sum(operator(0, other))
+                return self
+            for i in range(len(self)):
+                set_item(i, operator(get_item(i), other))
+            self._update_sum(operator(0, other) * len(self))
+        elif isinstance(other, list):
+            common_length = min(len(self), len(other))
+            for i, value in enumerate(islice(other, common_length)):
+                set_item(i, operator(get_item(i), value))
+            if len(other) > common_length:
+                super().extend(operator(0, value) for value in islice(other, common_length, None))
+            self._update_sum(operator(0, other.total if isinstance(other, CustomList) else sum(other)))
+        else:
+            raise NotImplementedError
+        return self
+
+    def __iadd__(self, other: list[int] | int) -> CustomList:
+        """
+            Adds either another list or an integer to the current CustomList instance in place.
+
+            :param other: A list of integers or a single integer.
+            :return: The current CustomList instance with the result of addition.
+        """
+        return self._operate_inplace(other, lambda x, y: x + y)
+
+    def __isub__(self, other: list[int] | int) -> CustomList:
+        """
+            Subtracts either another list or an integer from the current CustomList instance in place.
+
+            :param other: A list of integers or a single integer.
+            :return: The current CustomList instance with the result of subtraction.
+        """
+        return self._operate_inplace(other, lambda x, y: x - y)
+
     def __add__(self, other: list[int] | int) -> CustomList:
         """
             Adds either another list or an integer to the current CustomList instance.
@@ -96,7 +247,7 @@ class CustomList(list):
             :return: True if sums are equal, False otherwise.
         """
         if isinstance(other, CustomList):
-            return sum(self) == sum(other)
+            return self._sum == other.total
 
         raise NotImplementedError
 
@@ -117,7 +268,7 @@ class CustomList(list):
             :return: True if current CustomList sum is greater, False otherwise.
         """
         if isinstance(other, CustomList):
-            return sum(self) > sum(other)
+            return self._sum > other.total
 
         raise NotImplementedError
 
@@ -128,7 +279,10 @@ class CustomList(list):
             :param other: Another CustomList instance.
             :return: True if current CustomList sum is greater or equal, False otherwise.
         """
-        return self.__eq__(other) or self.__gt__(other)
+        if isinstance(other, CustomList):
+            return self._sum >= other.total
+
+        raise NotImplementedError
 
     def __le__(self, other: CustomList) -> bool:
         """
@@ -146,7 +300,10 @@ class CustomList(list):
             :param other: Another CustomList instance.
             :return: True if current CustomList sum is less, False otherwise.
         """
-        return not self.__ge__(other)
+        if isinstance(other, CustomList):
+            return self._sum < other.total
+
+        raise NotImplementedError
 
     def __str__(self) -> str:
         """
@@ -154,4 +311,4 @@ class CustomList(list):
 
             :return: String representation of the list and the sum of its elements.
         """
-        return f'{list(self)}, sum = {sum(self)}'
+        return f'{list(self)}, sum = {self._sum}'
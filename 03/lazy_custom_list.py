@@ -0,0 +1,249 @@
+"""
+This module contains the LazyCustomList class, an opt-in lazy mode for chained
+CustomList arithmetic.
+
+`lazy(values)` wraps a list; `+` and `-` on the result do not compute anything,
+they only record the operands. Since both operations are linear, an expression
+like `lazy(a) + b - c + 5` is kept as a flat combination of signed list operands
+and integer constants, each constant remembering how many leading elements it
+was broadcast to. The expression is evaluated in one fused pass over the longest
+operand when it is materialized, and its sum for comparisons is computed from
+the operand sums without building any list at all.
+
+An expression must start with `lazy()`: CustomList operands may appear anywhere
+after it, but `CustomList + LazyCustomList` is rejected by CustomList itself.
+
+The zero-padding and int-broadcast rules are the same as for eager CustomList
+arithmetic. Operands are read at materialization time, so they must not be
+mutated while an expression referencing them is alive.
+"""
+
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Iterator, Sequence
+from itertools import repeat, zip_longest
+
+from custom_list import CustomList
+
+
+class LazyCustomList:
+    """
+        A deferred linear combination of integer lists and broadcast constants.
+    """
+
+    def __init__(
+        self,
+        terms: tuple[tuple[int, Sequence[int]], ...],
+        constants: tuple[tuple[int, int], ...] = (),
+        length: int | None = None,
+    ):
+        """
+            Initializes the expression.
+
+            :param terms: Pairs of sign (1 or -1) and list operand.
+            :param constants: Pairs of signed integer and the number of leading elements it applies to.
+            :param length: Length of the result, computed from the operands if omitted.
+        """
+        self._terms = terms
+        self._constants = constants
+        self._length = max((len(values) for _, values in terms), default=0) if length is None else length
+
+    def __neg__(self) -> LazyCustomList:
+        """
+            Returns the expression multiplied by -1.
+        """
+        return LazyCustomList(
+            tuple((-sign, values) for sign, values in self._terms),
+            tuple((-value, extent) for value, extent in self._constants),
+            self._length,
+        )
+
+    def _combine(self, other: LazyCustomList | list[int] | int, sign: int) -> LazyCustomList:
+        """
+            A helper function recording an addition (sign = 1) or subtraction (sign = -1).
+
+            :param other: A LazyCustomList, a list of integers or a single integer.
+            :param sign: Sign applied to `other`.
+            :return: A new LazyCustomList instance.
+        """
+        if isinstance(other, int):
+            extent = self._length or 1
+            return LazyCustomList(self._terms, self._constants + ((sign * other, extent),), extent)
+        if isinstance(other, LazyCustomList):
+            if sign < 0:
+                other = -other
+            return LazyCustomList(
+                self._terms + other.terms,
+                self._constants + other.constants,
+                max(self._length, len(other)),
+            )
+        if isinstance(other, list):
+            return LazyCustomList(self._terms + ((sign, other),), self._constants, max(self._length, len(other)))
+        raise NotImplementedError
+
+    @property
+    def terms(self) -> tuple[tuple[int, Sequence[int]], ...]:
+        """Returns the signed list operands of the expression."""
+        return self._terms
+
+    @property
+    def constants(self) -> tuple[tuple[int, int], ...]:
+        """Returns the broadcast constants of the expression with their extents."""
+        return self._constants
+
+    def __add__(self, other: LazyCustomList | list[int] | int) -> LazyCustomList:
+        """
+            Records an addition of another expression, a list or an integer.
+
+            :param other: A LazyCustomList, a list of integers or a single integer.
+            :return: A new LazyCustomList instance.
+        """
+        return self._combine(other, 1)
+
+    def __radd__(self, other: list[int] | int) -> LazyCustomList:
+        """
+            Handles the reverse addition case when LazyCustomList is on the right-hand side of the `+`.
+
+            :param other: A list of integers or a single integer.
+            :return: A new LazyCustomList instance.
+        """
+        return self._combine(other, 1)
+
+    def __sub__(self, other: LazyCustomList | list[int] | int) -> LazyCustomList:
+        """
+            Records a subtraction of another expression, a list or an integer.
+
+            :param other: A LazyCustomList, a list of integers or a single integer.
+            :return: A new LazyCustomList instance.
+        """
+        return self._combine(other, -1)
+
+    def __rsub__(self, other: list[int] | int) -> LazyCustomList:
+        """
+            Handles the reverse subtraction case when LazyCustomList is on the right-hand side of the `-`.
+
+            :param other: A list of integers or a single integer.
+            :return: A new LazyCustomList instance.
+        """
+        return (-self)._combine(other, 1)
+
+    def _column_sums(self, sign: int) -> Iterator[int]:
+        """
+            Returns per-index sums of the operands with the given sign, padded to the result length.
+        """
+        operands = [values for term_sign, values in self._terms if term_sign == sign]
+        operands.extend(
+            repeat(sign * value, extent) for value, extent in self._constants if value * sign > 0
+        )
+        return map(sum, zip_longest(*operands, repeat(0, self._length), fillvalue=0))
+
+    def materialize(self) -> CustomList:
+        """
+            Evaluates the expression in one pass over the longest operand.
+
+            :return: A new CustomList instance with the result.
+        """
+        if all(sign > 0 for sign, _ in self._terms) and all(value >= 0 for value, _ in self._constants):
+            return CustomList(list(self._column_sums(1)))
+        return CustomList(list(map(operator.sub, self._column_sums(1), self._column_sums(-1))))
+
+    @property
+    def total(self) -> int:
+        """
+            Returns the sum of the result computed from the operand sums, without evaluating the elements.
+        """
+        return sum(
+            sign * (values.total if isinstance(values, CustomList) else sum(values))
+            for sign, values in self._terms
+        ) + sum(value * extent for value, extent in self._constants)
+
+    def _total_of(self, other: LazyCustomList | CustomList) -> int:
+        """
+            Returns the sum of another comparable instance.
+
+            :param other: A LazyCustomList or CustomList instance.
+            :raises NotImplementedError: if `other` is of an unsupported type.
+        """
+        if isinstance(other, (LazyCustomList, CustomList)):
+            return other.total
+        raise NotImplementedError
+
+    def __eq__(self, other: LazyCustomList | CustomList) -> bool:
+        """
+            Compares the sums of the results.
+
+            :param other: A LazyCustomList or CustomList instance.
+            :return: True if sums are equal, False otherwise.
+        """
+        return self.total == self._total_of(other)
+
+    def __ne__(self, other: LazyCustomList | CustomList) -> bool:
+        """
+            Checks if the sums of the results are not equal.
+
+            :param other: A LazyCustomList or CustomList instance.
+            :return: True if sums are not equal, False otherwise.
+        """
+        return self.total != self._total_of(other)
+
+    def __gt__(self, other: LazyCustomList | CustomList) -> bool:
+        """
+            Checks if the sum of the result is greater than the sum of another one.
+
+            :param other: A LazyCustomList or CustomList instance.
+            :return: True if current sum is greater, False otherwise.
+        """
+        return self.total > self._total_of(other)
+
+    def __ge__(self, other: LazyCustomList | CustomList) -> bool:
+        """
+            Checks if the sum of the result is greater than or equal to the sum of another one.
+
+            :param other: A LazyCustomList or CustomList instance.
+            :return: True if current sum is greater or equal, False otherwise.
+        """
+        return self.total >= self._total_of(other)
+
+    def __le__(self, other: LazyCustomList | CustomList) -> bool:
+        """
+            Checks if the sum of the result is less than or equal to the sum of another one.
+
+            :param other: A LazyCustomList or CustomList instance.
+            :return: True if current sum is less or equal, False otherwise.
+        """
+        return self.total <= self._total_of(other)
+
+    def __lt__(self, other: LazyCustomList | CustomList) -> bool:
+        """
+            Checks if the sum of the result is less than the sum of another one.
+
+            :param other: A LazyCustomList or CustomList instance.
+            :return: True if current sum is less, False otherwise.
+        """
+        return self.total < self._total_of(other)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.materialize())
+
+    def __str__(self) -> str:
+        """
+            Returns a string representation of the materialized result.
+        """
+        return str(self.materialize())
+
+
+def lazy(values: list[int]) -> LazyCustomList:
+    """
+        Starts a lazy arithmetic expression over a list or CustomList.
+
+        :param values: A list of integers.
+        :return: A LazyCustomList wrapping the list.
+    """
+    if not isinstance(values, list):
+        raise NotImplementedError
+    return LazyCustomList(((1, values),))
@@ -0,0 +1,269 @@
+"""
+This module contains the MappedCustomList class, a disk-backed ArrayCustomList for
+vectors larger than RAM.
+
+The elements are `int64` values in a memory-mapped file with a small header:
+
+    offset 0   8 bytes   magic `b'CLSTMAP1'`
+    offset 8   8 bytes   number of elements, little-endian signed
+    offset 16  16 bytes  sum of the elements, little-endian signed
+    offset 32            elements
+
+Addition and subtraction stream over the operands in chunks of `CHUNK_SIZE`
+elements and write the result into another mapped file, following the CustomList
+zero-padding and int-broadcast rules. The sum is kept in the header (it is
+accumulated while the result is written and updated on item assignment), so
+comparisons read it instead of scanning the file.
+
+Results of the `+` and `-` operators are temporary files. They are removed by
+`close`, or when the result is garbage collected, so intermediates such as
+`a + b` in `(a + b) - 5` do not stay on disk.
+"""
+
+
+from __future__ import annotations
+
+import mmap
+import operator
+import os
+import struct
+import tempfile
+import weakref
+from collections.abc import Callable, Iterable, Sequence
+
+from array_custom_list import CHUNK_SIZE, TYPECODE, ArrayCustomList, combine_into
+
+MAGIC = b'CLSTMAP1'
+HEADER_FORMAT = '<8sq'
+HEADER = struct.Struct(HEADER_FORMAT)
+SUM_OFFSET = struct.calcsize(HEADER_FORMAT)
+SUM_SIZE = 16
+HEADER_SIZE = SUM_OFFSET + SUM_SIZE
+ITEM_SIZE = 8
+
+
+def _release_mapping(views: tuple[memoryview, ...], mapping: mmap.mmap, file, path: str | None) -> None:
+    """
+        Releases the views, unmaps and closes the file and removes it if a path is given.
+        Does not reference the MappedCustomList, so it can run as its finalizer.
+    """
+    for view in views:
+        view.release()
+    mapping.close()
+    file.close()
+    if path is not None:
+        os.remove(path)
+
+
+class MappedCustomList(ArrayCustomList):
+    """
+        MappedCustomList stores `int64` elements in a memory-mapped file and
+        supports the arithmetic and comparisons of ArrayCustomList.
+    """
+
+    def __init__(self, path: str, delete_on_close: bool = False):
+        """
+            Maps an existing file created by `create` or `empty`. Use `open`,
+            `create` or `empty` instead of calling the constructor directly.
+
+            :param path: Path to the file.
+            :param delete_on_close: Remove the file in `close` or when the instance is
+            garbage collected, used for temporary results.
+        """
+        super().__init__()
+        self._path = path
+        self._file = open(path, 'r+b')  # pylint: disable=consider-using-with
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        magic, length = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            _release_mapping((), self._mmap, self._file, path if delete_on_close else None)
+            raise ValueError(f'{path} is not a mapped CustomList file')
+        self._view = memoryview(self._mmap)
+        self._data = self._view[HEADER_SIZE:HEADER_SIZE + length * ITEM_SIZE].cast(TYPECODE)
+        self._finalizer = weakref.finalize(
+            self, _release_mapping, (self._data, self._view), self._mmap, self._file,
+            path if delete_on_close else None,
+        )
+
+    @classmethod
+    def open(cls, path: str) -> MappedCustomList:
+        """
+            Maps an existing file.
+
+            :param path: Path to the file.
+            :return: A new MappedCustomList.
+        """
+        return cls(path)
+
+    @classmethod
+    def empty(cls, path: str | None, length: int) -> MappedCustomList:
+        """
+            Creates a zero-filled file, e.g. an output for element-wise operations.
+
+            :param path: Path to the new file, a temporary file removed on close if None.
+            :param length: Number of elements.
+            :return: A new MappedCustomList.
+        """
+        if length < 0:
+            raise ValueError('length must be non-negative')
+        delete_on_close = path is None
+        if path is None:
+            descriptor, path = tempfile.mkstemp(suffix='.clst')
+            os.close(descriptor)
+        with open(path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, length))
+            file.write(bytes(SUM_SIZE))
+            file.truncate(HEADER_SIZE + length * ITEM_SIZE)
+        return cls(path, delete_on_close)
+
+    @classmethod
+    def create(cls, path: str | None, values: Iterable[int]) -> MappedCustomList:
+        """
+            Creates a file with the given values.
+
+            :param path: Path to the new file, a temporary file removed on close if None.
+            :param values: Integers to store.
+            :return: A new MappedCustomList.
+        """
+        if not isinstance(values, Sequence):
+            values = ArrayCustomList(values).data
+        instance = cls.empty(path, len(values))
+        instance.set_total(combine_into(instance.data, values, 0, operator.add))
+        return instance
+
+    @property
+    def path(self) -> str:
+        """Returns the path to the mapped file."""
+        return self._path
+
+    @property
+    def total(self) -> int:
+        """Returns the sum of the elements stored in the header."""
+        return int.from_bytes(self._mmap[SUM_OFFSET:HEADER_SIZE], 'little', signed=True)
+
+    def set_total(self, total: int) -> None:
+        """
+            Stores the sum of the elements in the header.
+
+            :param total: The sum of the elements.
+        """
+        self._mmap[SUM_OFFSET:HEADER_SIZE] = total.to_bytes(SUM_SIZE, 'little', signed=True)
+
+    def recompute_total(self) -> int:
+        """
+            Rescans the elements, e.g. after writing through `data` directly, and stores the sum.
+
+            :return: The sum of the elements.
+        """
+        total = sum(sum(self._data[start:start + CHUNK_SIZE]) for start in range(0, len(self._data), CHUNK_SIZE))
+        self.set_total(total)
+        return total
+
+    def __setitem__(self, index: int, value: int) -> None:
+        previous = self._data[index]
+        self._data[index] = value
+        self.set_total(self.total + value - previous)
+
+    def flush(self) -> None:
+        """
+            Flushes changes to the file.
+        """
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """
+            Unmaps and closes the file, removing it if it is a temporary result.
+            Closing twice does nothing.
+        """
+        self._finalizer()
+
+    def __enter__(self) -> MappedCustomList:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _stream(
+        self,
+        other: Sequence[int] | int,
+        operator_func: Callable[[int, int], int],
+        path: str | None,
+        reflected: bool,
+    ) -> MappedCustomList:
+        """
+            Streams an element-wise operation into a new mapped file.
+
+            :param other: A list, ArrayCustomList (e.g. another MappedCustomList) or a single integer.
+            :param operator_func: `operator.add` or `operator.sub`.
+            :param path: Path to the output file, a temporary file removed on close if None.
+            :param reflected: True if `other` is the left operand.
+            :return: A new MappedCustomList with the result.
+        """
+        if isinstance(other, int):
+            result_length = len(self) or 1
+        elif isinstance(other, (list, ArrayCustomList)):
+            result_length = max(len(self), len(other))
+            other = other.data if isinstance(other, ArrayCustomList) else other
+        else:
+            raise NotImplementedError
+
+        out = MappedCustomList.empty(path, result_length)
+        if reflected:
+            total = combine_into(out.data, other, self._data, operator_func)
+        else:
+            total = combine_into(out.data, self._data, other, operator_func)
+        out.set_total(total)
+        return out
+
+    def add(self, other: Sequence[int] | int, path: str | None = None) -> MappedCustomList:
+        """
+            Adds either another list or an integer, writing the result to `path`.
+
+            :param other: A list, ArrayCustomList or a single integer.
+            :param path: Path to the output file, a temporary file removed on close if None.
+            :return: A new MappedCustomList with the result.
+        """
+        return self._stream(other, operator.add, path, reflected=False)
+
+    def sub(self, other: Sequence[int] | int, path: str | None = None, reflected: bool = False) -> MappedCustomList:
+        """
+            Subtracts either another list or an integer, writing the result to `path`.
+
+            :param other: A list, ArrayCustomList or a single integer.
+            :param path: Path to the output file, a temporary file removed on close if None.
+            :param reflected: True if `other` is the left operand (`other - self`).
+            :return: A new MappedCustomList with the result.
+        """
+        return self._stream(other, operator.sub, path, reflected)
+
+    def __add__(self, other: Sequence[int] | int) -> MappedCustomList:
+        """
+            Adds either another list or an integer, the result is a temporary mapped file.
+        """
+        return self.add(other)
+
+    def __radd__(self, other: Sequence[int] | int) -> MappedCustomList:
+        """
+            Handles the reverse addition case, the result is a temporary mapped file.
+        """
+        return self.add(other)
+
+    def __sub__(self, other: Sequence[int] | int) -> MappedCustomList:
+        """
+            Subtracts either another list or an integer, the result is a temporary mapped file.
+        """
+        return self.sub(other)
+
+    def __rsub__(self, other: Sequence[int] | int) -> MappedCustomList:
+        """
+            Handles the reverse subtraction case, the result is a temporary mapped file.
+        """
+        return self.sub(other, reflected=True)
+
+    def __getitem__(self, index: int | slice) -> int | ArrayCustomList:
+        if isinstance(index, slice):
+            return ArrayCustomList(self._data[index])
+        return self._data[index]
+
+    def __repr__(self) -> str:
+        return f'MappedCustomList(path={self._path!r}, length={len(self._data)})'
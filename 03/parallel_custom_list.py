@@ -0,0 +1,204 @@
+"""
+This module provides multi-core element-wise operations and sums for very large
+ArrayCustomList vectors.
+
+The index range of the result is split into one contiguous chunk per worker, and
+every chunk is computed by `combine_into` in a worker process of a
+`ProcessPoolExecutor`. Operands and the output are passed as SharedCustomList
+segments, so workers read and write them in place: only segment names travel
+between processes. Sums of SharedCustomLists are computed as a parallel
+reduction of per-chunk sums.
+
+Below `PARALLEL_THRESHOLD` elements (or with a single worker) the cost of starting
+workers and copying plain operands into shared memory does not pay off, and the
+single-process path is used.
+"""
+
+
+from __future__ import annotations
+
+import operator
+import os
+from array import array
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from array_custom_list import TYPECODE, ArrayCustomList, combine_into
+from shared_custom_list import ITEM_SIZE, SharedCustomList
+
+PARALLEL_THRESHOLD = 1_000_000
+
+Operand = Sequence[int] | ArrayCustomList | int
+
+
+def _buffer_of(value: Operand) -> Sequence[int] | int:
+    """Returns the typed buffer of an ArrayCustomList, other operands unchanged."""
+    return value.data if isinstance(value, ArrayCustomList) else value
+
+
+def _close_attached(*values: Operand) -> None:
+    """Unmaps SharedCustomLists attached in a worker process."""
+    for value in values:
+        if isinstance(value, SharedCustomList):
+            value.close()
+
+
+def _combine_chunk(  # pylint: disable=too-many-arguments
+    out: SharedCustomList,
+    left: SharedCustomList | int,
+    right: SharedCustomList | int,
+    operator_func: Callable[[int, int], int],
+    start: int,
+    stop: int,
+) -> int:
+    """Worker task: computes the [start, stop) chunk of the result, returns its sum."""
+    try:
+        return combine_into(out.data, _buffer_of(left), _buffer_of(right), operator_func, start, stop)
+    finally:
+        _close_attached(out, left, right)
+
+
+def _sum_chunk(values: SharedCustomList, start: int, stop: int) -> int:
+    """Worker task: returns the sum of the [start, stop) chunk."""
+    try:
+        return sum(values.data[start:stop])
+    finally:
+        values.close()
+
+
+def _chunks(length: int, workers: int) -> list[tuple[int, int]]:
+    """Splits [0, length) into at most `workers` contiguous ranges of similar size."""
+    step = max(-(-length // workers), 1)
+    return [(start, min(start + step, length)) for start in range(0, length, step)]
+
+
+def _map_chunks(
+    task: Callable[..., int], length: int, workers: int, executor: Executor | None, *args
+) -> list[int]:
+    """
+        Runs `task(*args, start, stop)` for every chunk of [0, length) in worker processes.
+
+        :return: Results of the tasks in chunk order.
+    """
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [pool.submit(task, *args, start, stop) for start, stop in _chunks(length, workers)]
+        return [future.result() for future in futures]
+    finally:
+        if executor is None:
+            pool.shutdown()
+
+
+def _result_length(left: Operand, right: Operand) -> int:
+    """Returns the length of an element-wise result following the CustomList rules."""
+    if isinstance(left, int):
+        return len(right) or 1
+    if isinstance(right, int):
+        return len(left) or 1
+    return max(len(left), len(right))
+
+
+def parallel_operate(  # pylint: disable=too-many-arguments
+    left: Operand,
+    right: Operand,
+    operator_func: Callable[[int, int], int],
+    out: ArrayCustomList | None = None,
+    workers: int | None = None,
+    threshold: int = PARALLEL_THRESHOLD,
+    executor: Executor | None = None,
+) -> ArrayCustomList:
+    """
+        Applies `operator_func` element-wise with the CustomList padding and broadcast rules,
+        using worker processes for results of at least `threshold` elements.
+
+        :param left: Left operand: a list, ArrayCustomList or a single integer.
+        :param right: Right operand: a list, ArrayCustomList or a single integer.
+        :param operator_func: `operator.add` or `operator.sub`.
+        :param out: Optional preallocated ArrayCustomList of exactly the result length.
+        Passing a SharedCustomList avoids copying the result out of shared memory.
+        :param workers: Number of worker processes, `os.cpu_count()` by default.
+        :param threshold: Minimal result length for the parallel path.
+        :param executor: A process pool to reuse, a new one is started per call if omitted.
+        :return: `out`, or a new ArrayCustomList with the result.
+    """
+    for value in (left, right):
+        if not isinstance(value, (int, list, ArrayCustomList)):
+            raise NotImplementedError
+    result_length = _result_length(left, right)
+    if out is not None and len(out) != result_length:
+        raise ValueError(f'Output length {len(out)} does not match result length {result_length}')
+    workers = workers or os.cpu_count() or 1
+
+    if result_length < threshold or workers < 2:
+        if out is None:
+            out = ArrayCustomList.from_array(array(TYPECODE, bytes(result_length * ITEM_SIZE)))
+        combine_into(out.data, _buffer_of(left), _buffer_of(right), operator_func)
+        return out
+
+    temporary = []
+
+    def shared(value: Operand) -> SharedCustomList | int:
+        """Copies a plain operand into a temporary segment, removed when the call ends."""
+        if isinstance(value, (int, SharedCustomList)):
+            return value
+        temporary.append(SharedCustomList.create(_buffer_of(value)))
+        return temporary[-1]
+
+    try:
+        if isinstance(out, SharedCustomList):
+            shared_out = out
+        else:
+            shared_out = SharedCustomList.empty(result_length)
+            temporary.append(shared_out)
+        _map_chunks(
+            _combine_chunk, result_length, workers, executor, shared_out, shared(left), shared(right), operator_func
+        )
+
+        if out is None:
+            result = array(TYPECODE)
+            result.frombytes(shared_out.data.cast('B'))
+            return ArrayCustomList.from_array(result)
+        if out is not shared_out:
+            memoryview(out.data)[:] = shared_out.data
+        return out
+    finally:
+        for value in temporary:
+            value.close()
+            value.unlink()
+
+
+def parallel_add(left: Operand, right: Operand, **options) -> ArrayCustomList:
+    """
+        Adds two operands element-wise, see `parallel_operate` for the options.
+    """
+    return parallel_operate(left, right, operator.add, **options)
+
+
+def parallel_sub(left: Operand, right: Operand, **options) -> ArrayCustomList:
+    """
+        Subtracts `right` from `left` element-wise, see `parallel_operate` for the options.
+    """
+    return parallel_operate(left, right, operator.sub, **options)
+
+
+def parallel_sum(
+    values: ArrayCustomList,
+    workers: int | None = None,
+    threshold: int = PARALLEL_THRESHOLD,
+    executor: Executor | None = None,
+) -> int:
+    """
+        Sums a SharedCustomList as a parallel reduction of per-chunk sums. Other
+        vectors, and vectors shorter than `threshold`, are summed in the current process,
+        since copying them to shared memory would cost more than the sum itself.
+
+        :param values: The vector to sum.
+        :param workers: Number of worker processes, `os.cpu_count()` by default.
+        :param threshold: Minimal length for the parallel path.
+        :param executor: A process pool to reuse, a new one is started per call if omitted.
+        :return: The sum of the elements.
+    """
+    workers = workers or os.cpu_count() or 1
+    if not isinstance(values, SharedCustomList) or len(values) < threshold or workers < 2:
+        return values.total
+    return sum(_map_chunks(_sum_chunk, len(values), workers, executor, values))
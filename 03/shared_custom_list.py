@@ -0,0 +1,217 @@
+"""
+This module contains the SharedCustomList class, an ArrayCustomList whose elements
+live in a `multiprocessing.shared_memory` segment, so large vectors can be handed
+to worker processes without pickling and copying the data.
+
+Lifetime of a segment is explicit:
+- `SharedCustomList.create()` and `SharedCustomList.empty()` allocate a new segment
+and make the instance its owner;
+- `SharedCustomList.attach()` (also used when an instance is pickled to a worker)
+maps an existing segment by name without owning it;
+- `close()` unmaps the segment in the current process, `unlink()` destroys it and
+may only be called by the owner. Used as a context manager, the instance is closed
+on exit and, if it is the owner, unlinked.
+
+An instance that is garbage collected without `close()` is closed automatically, e.g.
+a non-owning instance unpickled in a worker. Its segment is not unlinked.
+
+A segment that is never unlinked outlives the process that created it.
+"""
+
+
+from __future__ import annotations
+
+import operator
+import weakref
+from collections.abc import Callable, Iterable, Sequence
+from multiprocessing.shared_memory import SharedMemory
+
+from array_custom_list import TYPECODE, ArrayCustomList, combine_into
+
+ITEM_SIZE = 8
+
+
+def _release_segment(views: tuple[memoryview, ...], shared_memory: SharedMemory) -> None:
+    """
+        Releases the views and unmaps the segment, views first, as the segment cannot be
+        closed while they exist. Does not reference the SharedCustomList, so it can run
+        as its finalizer.
+    """
+    for view in views:
+        view.release()
+    shared_memory.close()
+
+
+class SharedCustomList(ArrayCustomList):
+    """
+        SharedCustomList stores `int64` elements in a named shared memory segment
+        and supports the arithmetic and comparisons of ArrayCustomList.
+    """
+
+    def __init__(self, shared_memory: SharedMemory, length: int, owner: bool):
+        """
+            Wraps an opened shared memory segment. Use `create`, `empty` or `attach`
+            instead of calling the constructor directly.
+
+            :param shared_memory: The opened segment.
+            :param length: Number of elements stored in the segment.
+            :param owner: True if this instance is responsible for unlinking the segment.
+        """
+        super().__init__()
+        self._shared_memory = shared_memory
+        self._length = length
+        self._owner = owner
+        self._buffer = shared_memory.buf.cast(TYPECODE)
+        self._data = self._buffer[:length]
+        self._finalizer = weakref.finalize(self, _release_segment, (self._data, self._buffer), shared_memory)
+
+    @classmethod
+    def empty(cls, length: int, name: str | None = None) -> SharedCustomList:
+        """
+            Allocates a zero-filled segment, e.g. a preallocated output for element-wise operations.
+
+            :param length: Number of elements.
+            :param name: Name of the segment, generated if omitted.
+            :return: A new owning SharedCustomList.
+        """
+        if length < 0:
+            raise ValueError('length must be non-negative')
+        shared_memory = SharedMemory(name=name, create=True, size=max(length, 1) * ITEM_SIZE)
+        return cls(shared_memory, length, owner=True)
+
+    @classmethod
+    def create(cls, values: Iterable[int], name: str | None = None) -> SharedCustomList:
+        """
+            Allocates a segment and copies `values` into it.
+
+            :param values: Integers to store.
+            :param name: Name of the segment, generated if omitted.
+            :return: A new owning SharedCustomList.
+        """
+        values = ArrayCustomList(values).data
+        instance = cls.empty(len(values), name)
+        instance.data[:] = values
+        return instance
+
+    @classmethod
+    def attach(cls, name: str, length: int) -> SharedCustomList:
+        """
+            Maps an existing segment by name without copying it.
+
+            :param name: Name of the segment.
+            :param length: Number of elements stored in the segment.
+            :return: A new non-owning SharedCustomList.
+        """
+        return cls(SharedMemory(name=name), length, owner=False)
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the shared memory segment."""
+        return self._shared_memory.name
+
+    @property
+    def owner(self) -> bool:
+        """Returns True if this instance is responsible for unlinking the segment."""
+        return self._owner
+
+    def __reduce__(self):
+        """
+            Pickles the instance as a reference to the segment: the receiving process
+            attaches to it by name instead of getting a copy of the elements.
+        """
+        return SharedCustomList.attach, (self.name, self._length)
+
+    def close(self) -> None:
+        """
+            Unmaps the segment in the current process. The instance cannot be used afterwards.
+            Closing twice does nothing.
+        """
+        self._finalizer()
+
+    def unlink(self) -> None:
+        """
+            Destroys the segment. Only the owner may unlink it; other processes
+            that still have it mapped keep their mapping until they close it.
+        """
+        if not self._owner:
+            raise PermissionError(f'Shared memory segment {self.name} is not owned by this instance')
+        self._shared_memory.unlink()
+        self._owner = False
+
+    def __enter__(self) -> SharedCustomList:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def _operate_into(
+        self,
+        other: Sequence[int] | int,
+        operator_func: Callable[[int, int], int],
+        out: ArrayCustomList,
+        reflected: bool,
+    ) -> ArrayCustomList:
+        """
+            Writes the result of an element-wise operation into a preallocated output.
+
+            :param other: A list, ArrayCustomList or a single integer.
+            :param operator_func: `operator.add` or `operator.sub`.
+            :param out: Output of exactly the result length, e.g. a SharedCustomList from `empty`.
+            :param reflected: True if `other` is the left operand.
+            :return: `out`.
+        """
+        if isinstance(other, int):
+            result_length = len(self) or 1
+        elif isinstance(other, (list, ArrayCustomList)):
+            result_length = max(len(self), len(other))
+            other = other.data if isinstance(other, ArrayCustomList) else other
+        else:
+            raise NotImplementedError
+        if len(out) != result_length:
+            raise ValueError(f'Output length {len(out)} does not match result length {result_length}')
+
+        if reflected:
+            combine_into(out.data, other, self._data, operator_func)
+        else:
+            combine_into(out.data, self._data, other, operator_func)
+        return out
+
+    def add(
+        self, other: Sequence[int] | int, out: ArrayCustomList | None = None, reflected: bool = False
+    ) -> ArrayCustomList:
+        """
+            Adds either another list or an integer, like `+`.
+
+            :param other: A list, ArrayCustomList or a single integer.
+            :param out: Optional preallocated output the result is written to.
+            :param reflected: True if `other` is the left operand.
+            :return: `out`, or a new ArrayCustomList if no output is given.
+        """
+        if out is None:
+            return self._operate(other, operator.add, reflected)
+        return self._operate_into(other, operator.add, out, reflected)
+
+    def sub(
+        self, other: Sequence[int] | int, out: ArrayCustomList | None = None, reflected: bool = False
+    ) -> ArrayCustomList:
+        """
+            Subtracts either another list or an integer, like `-`.
+
+            :param other: A list, ArrayCustomList or a single integer.
+            :param out: Optional preallocated output the result is written to.
+            :param reflected: True if `other` is the left operand (`other - self`).
+            :return: `out`, or a new ArrayCustomList if no output is given.
+        """
+        if out is None:
+            return self._operate(other, operator.sub, reflected)
+        return self._operate_into(other, operator.sub, out, reflected)
+
+    def __getitem__(self, index: int | slice) -> int | ArrayCustomList:
+        if isinstance(index, slice):
+            return ArrayCustomList(self._data[index])
+        return self._data[index]
+
+    def __repr__(self) -> str:
+        return f'SharedCustomList(name={self.name!r}, length={self._length})'
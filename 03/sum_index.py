@@ -0,0 +1,130 @@
+"""
+This module contains the SumIndex class, a container of CustomLists ordered by
+the sum of their elements, for repeated top-N and sum range queries.
+
+Members are kept in a sorted list of `(sum, sequence number)` keys, searched with
+`bisect`: lookups, range bounds and top-N take O(log n) comparisons of small
+tuples instead of re-summing and re-sorting all lists. Insertion and removal also
+shift the tail of the key list, which is a single memmove and stays cheap even for
+millions of members.
+
+The index registers a sum watcher on every member (see
+`CustomList.add_sum_watcher`), so in-place mutations of the members move them to
+the right position automatically.
+"""
+
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Iterator
+from itertools import count, islice
+
+from custom_list import CustomList
+
+
+class SumIndex:
+    """
+        SumIndex stores CustomList instances ordered by their sums and keeps
+        the order up to date when the members are mutated.
+    """
+
+    def __init__(self, lists: Iterable[CustomList] = ()):
+        """
+            Initializes the index with the given lists.
+
+            :param lists: CustomList instances to index.
+        """
+        self._keys = []
+        self._members = {}
+        self._sequence_numbers = {}
+        self._counter = count()
+        for custom_list in lists:
+            self.add(custom_list)
+
+    def add(self, custom_list: CustomList) -> None:
+        """
+            Adds a list to the index.
+
+            :param custom_list: A CustomList instance.
+            :raises TypeError: if `custom_list` is not a CustomList.
+            :raises ValueError: if the list is already indexed.
+        """
+        if not isinstance(custom_list, CustomList):
+            raise TypeError(f'Expected CustomList, got {type(custom_list).__name__}')
+        if id(custom_list) in self._sequence_numbers:
+            raise ValueError('The list is already indexed')
+        sequence_number = next(self._counter)
+        self._sequence_numbers[id(custom_list)] = sequence_number
+        self._members[sequence_number] = custom_list
+        insort(self._keys, (custom_list.total, sequence_number))
+        custom_list.add_sum_watcher(self._on_sum_change)
+
+    def remove(self, custom_list: CustomList) -> None:
+        """
+            Removes a list from the index.
+
+            :param custom_list: An indexed CustomList instance.
+            :raises KeyError: if the list is not indexed.
+        """
+        sequence_number = self._sequence_numbers.pop(id(custom_list))
+        del self._members[sequence_number]
+        self._delete_key(custom_list.total, sequence_number)
+        custom_list.remove_sum_watcher(self._on_sum_change)
+
+    def _delete_key(self, total: int, sequence_number: int) -> None:
+        """
+            Deletes the key of a member from the sorted key list.
+        """
+        del self._keys[bisect_left(self._keys, (total, sequence_number))]
+
+    def _on_sum_change(self, custom_list: CustomList, old_sum: int, new_sum: int) -> None:
+        """
+            Sum watcher: moves a mutated member to its new position.
+        """
+        sequence_number = self._sequence_numbers[id(custom_list)]
+        self._delete_key(old_sum, sequence_number)
+        insort(self._keys, (new_sum, sequence_number))
+
+    def top(self, n: int) -> list[CustomList]:
+        """
+            Returns the lists with the largest sums.
+
+            :param n: Number of lists to return.
+            :return: Up to `n` lists in descending order of their sums.
+        """
+        start = max(len(self._keys) - n, 0)
+        return [self._members[sequence_number] for _, sequence_number in reversed(self._keys[start:])]
+
+    def bottom(self, n: int) -> list[CustomList]:
+        """
+            Returns the lists with the smallest sums.
+
+            :param n: Number of lists to return.
+            :return: Up to `n` lists in ascending order of their sums.
+        """
+        return [self._members[sequence_number] for _, sequence_number in islice(self._keys, max(n, 0))]
+
+    def between(self, low: int, high: int) -> list[CustomList]:
+        """
+            Returns the lists whose sums are within the range.
+
+            :param low: The minimal sum, inclusive.
+            :param high: The maximal sum, inclusive.
+            :return: The lists in ascending order of their sums.
+        """
+        start = bisect_left(self._keys, (low,))
+        stop = bisect_left(self._keys, (high + 1,))
+        return [self._members[sequence_number] for _, sequence_number in self._keys[start:stop]]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, custom_list: CustomList) -> bool:
+        return id(custom_list) in self._sequence_numbers
+
+    def __iter__(self) -> Iterator[CustomList]:
+        """
+            Iterates over the lists in ascending order of their sums.
+        """
+        return (self._members[sequence_number] for _, sequence_number in self._keys)
@@ -0,0 +1,129 @@
+"""
+This module contains tests for the ArrayCustomList class. Results of its
+arithmetic are checked against CustomList, which defines the expected
+zero-padding and int-broadcast semantics.
+"""
+
+import operator
+from array import array
+
+import pytest
+
+from array_custom_list import ArrayCustomList
+from custom_list import CustomList
+from test_parametrize_with_dict import parametrize_with_dict
+
+OPERANDS = [[], [1], [-100], [4, 5, 6], [-9, 8], [5, 3, -1, 0, 7], list(range(1000))]
+
+
+@pytest.mark.parametrize('operator_func', [operator.add, operator.sub])
+@pytest.mark.parametrize('left', OPERANDS)
+@pytest.mark.parametrize('right', OPERANDS + [0, 5, -7])
+def test_matches_custom_list(operator_func, left, right):
+    """
+        Test that every combination of operands gives the same elements as CustomList,
+        for ArrayCustomList, list and int right operands and for reflected operations.
+    """
+    expected = list(operator_func(CustomList(left), right))
+    right_operand = ArrayCustomList(right) if isinstance(right, list) else right
+
+    result = operator_func(ArrayCustomList(left), right_operand)
+    assert isinstance(result, ArrayCustomList)
+    assert result.tolist() == expected
+    assert operator_func(ArrayCustomList(left), right).tolist() == expected
+
+    reflected_expected = list(operator_func(right, CustomList(left)))
+    assert operator_func(right, ArrayCustomList(left)).tolist() == reflected_expected
+
+
+def test_operands_are_not_modified():
+    """
+        Test that arithmetic returns a new instance and keeps the operands intact.
+    """
+    first = ArrayCustomList([1, 2, 3])
+    second = [4, 5]
+    result = first - second
+    assert result is not first
+    assert first.tolist() == [1, 2, 3]
+    assert second == [4, 5]
+
+
+def test_storage_is_typed_array():
+    """
+        Test that elements are stored in a compact typed buffer.
+    """
+    values = ArrayCustomList(range(10)) + 1
+    assert isinstance(values.data, array)
+    assert values.data.itemsize == 8
+    assert ArrayCustomList.from_array(values.data).data is values.data
+    with pytest.raises(TypeError):
+        ArrayCustomList.from_array(array('i'))
+
+
+def test_overflow_is_not_silent():
+    """
+        Test that values outside the int64 range raise an OverflowError instead of wrapping.
+    """
+    with pytest.raises(OverflowError):
+        _ = ArrayCustomList([2 ** 63 - 1]) + 1
+
+
+@parametrize_with_dict(
+    ['first_operand', 'second_operand', 'expected_result'],
+    [
+        {
+            'case_id': 'eq',
+            'first_operand': ArrayCustomList([1, 2, 3]),
+            'second_operand': ArrayCustomList([2, 2, 1, 1]),
+            'expected_result': (True, False, False, True, True, False),
+        },
+        {
+            'case_id': 'gt',
+            'first_operand': ArrayCustomList([4, 5, 6]),
+            'second_operand': ArrayCustomList([1, 2, 3]),
+            'expected_result': (False, True, True, True, False, False),
+        },
+        {
+            'case_id': 'lt with custom list',
+            'first_operand': ArrayCustomList([1, 2, 3]),
+            'second_operand': CustomList([4, 5, 6]),
+            'expected_result': (False, True, False, False, True, True),
+        },
+    ]
+)
+def test_comparisons(first_operand, second_operand, expected_result):
+    """
+        Test ==, !=, >, >=, <=, < comparisons by the sum of the elements.
+    """
+    assert (
+        first_operand == second_operand,
+        first_operand != second_operand,
+        first_operand > second_operand,
+        first_operand >= second_operand,
+        first_operand <= second_operand,
+        first_operand < second_operand,
+    ) == expected_result
+
+
+def test_wrong_types():
+    """
+        Test that unsupported operand types raise NotImplementedError.
+    """
+    with pytest.raises(NotImplementedError):
+        assert ArrayCustomList([1, 2, 3]) == '[1, 2, 3]'
+    with pytest.raises(NotImplementedError):
+        assert ArrayCustomList([1, 2, 3]) + '123'
+
+
+def test_sequence_protocol_and_str():
+    """
+        Test indexing, slicing, iteration and the string representation.
+    """
+    values = ArrayCustomList([5, 3, 1])
+    assert len(values) == 3
+    assert values[1] == 3
+    assert values[1:].tolist() == [3, 1]
+    values[0] = 10
+    assert list(values) == [10, 3, 1]
+    assert str(values) == '[10, 3, 1], sum = 14'
+    assert repr(values) == 'ArrayCustomList([10, 3, 1])'
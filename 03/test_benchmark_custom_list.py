@@ -0,0 +1,48 @@
+"""
+This module contains tests for the CustomList benchmark suite: the JSON report
+and the comparison to a baseline report.
+"""
+
+import json
+
+from benchmark_custom_list import compare_reports, main
+
+
+def test_report_covers_every_case(tmp_path):
+    """
+        Test that the report has a result for every backend, operation, length and skew.
+    """
+    output = tmp_path / 'report.json'
+    arguments = ['--lengths', '3', '5', '--skews', '1', '0.5', '--min-time', '0', '--output', str(output)]
+    assert main(arguments + ['--backends', 'custom_list', 'list_comprehension']) == 0
+
+    report = json.loads(output.read_text())
+    assert len(report['results']) == 2 * 12 * 2 * 2
+    assert {result['operation'] for result in report['results']} == {
+        'add', 'sub', 'radd', 'rsub', 'add_int', 'sub_int', 'eq', 'ne', 'lt', 'le', 'gt', 'ge',
+    }
+    assert all(result['ops_per_sec'] > 0 and result['bytes_allocated'] >= 0 for result in report['results'])
+
+
+def test_compare_reports_detects_regressions(tmp_path):
+    """
+        Test that slowdowns beyond the tolerance are reported and fail the run.
+    """
+    def report(ops_per_sec):
+        return {'results': [{
+            'backend': 'custom_list', 'operation': 'add', 'length': 3, 'skew': 1.0,
+            'ops_per_sec': ops_per_sec, 'bytes_allocated': 99,
+        }]}
+
+    assert not compare_reports(report(95), report(100), tolerance=0.1)[0]['regression']
+    comparison = compare_reports(report(50), report(100), tolerance=0.1)[0]
+    assert comparison['regression']
+    assert comparison['speedup'] == 0.5
+    assert comparison['memory_ratio'] == 1
+    assert not compare_reports(report(50), {'results': []}, tolerance=0.1)
+
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(json.dumps(report(float('inf'))))
+    arguments = ['--lengths', '3', '--skews', '1', '--min-time', '0', '--backends', 'custom_list',
+                 '--operations', 'add', '--output', str(tmp_path / 'report.json'), '--compare', str(baseline)]
+    assert main(arguments) == 1
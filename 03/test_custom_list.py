@@ -4,6 +4,9 @@ addition, subtraction, and comparison functionality, as well as its string
 representation and behavior when interacting with lists and numbers.
 """
 
+import copy
+import pickle
+
 import pytest
 
 from test_parametrize_with_dict import parametrize_with_dict
@@ -584,3 +587,204 @@ def test_custom_list_add_with_wrong_type():
     """
     with pytest.raises(NotImplementedError):
         assert CustomList([1, 2, 3]) + '123'
+
+
+def assert_sum_cached(values: CustomList) -> None:
+    """
+    Asserts that the cached sum of a CustomList matches its elements.
+    :param values: CustomList to check
+    """
+    assert values.total == sum(list(values))
+    assert str(values) == f'{list(values)}, sum = {sum(list(values))}'
+
+
+def test_custom_list_cached_sum_after_mutations():
+    """
+    Test that the cached sum stays correct through every mutating list method.
+    """
+    values = CustomList([1, 2, 3])
+    assert_sum_cached(values)
+
+    values.append(10)
+    assert_sum_cached(values)
+    values.extend(i for i in range(5))
+    assert_sum_cached(values)
+    values.extend(values)
+    assert_sum_cached(values)
+    values.insert(0, -7)
+    assert_sum_cached(values)
+    assert values.pop() == 4
+    assert_sum_cached(values)
+    values.pop(0)
+    assert_sum_cached(values)
+    values.remove(10)
+    assert_sum_cached(values)
+
+    values[0] = 100
+    assert_sum_cached(values)
+    values[-1] = -100
+    assert_sum_cached(values)
+    values[1:4] = [5, 5]
+    assert_sum_cached(values)
+    values[::2] = range(len(values[::2]))
+    assert_sum_cached(values)
+    del values[0]
+    assert_sum_cached(values)
+    del values[1:3]
+    assert_sum_cached(values)
+
+    values.sort()
+    values.reverse()
+    assert_sum_cached(values)
+    values *= 3
+    assert_sum_cached(values)
+    values *= 0
+    assert_sum_cached(values)
+
+    values.append(8)
+    values.clear()
+    assert_sum_cached(values)
+
+
+def test_custom_list_cached_sum_in_comparisons():
+    """
+    Test that comparisons and sorting use the sum updated after mutations.
+    """
+    first = CustomList([1, 2, 3])
+    second = CustomList([10])
+    assert first < second
+    first.append(5)
+    assert first > second
+    second[0] = 11
+    assert first == second
+    assert sorted([CustomList([5]), CustomList([1, 1]), CustomList([-3, 10])]) == [
+        CustomList([2]), CustomList([5]), CustomList([7])
+    ]
+
+
+def test_custom_list_copy_and_pickle_keep_sum():
+    """
+    Test that copies and pickled CustomLists have a correct cached sum.
+    """
+    values = CustomList([1, 2, 3])
+    for restored in (copy.copy(values), copy.deepcopy(values), pickle.loads(pickle.dumps(values))):
+        assert isinstance(restored, CustomList)
+        assert list(restored) == [1, 2, 3]
+        assert_sum_cached(restored)
+
+
+@parametrize_with_dict(
+    ['first_operand', 'second_operand', 'expected_add', 'expected_sub'],
+    [
+        {
+            'case_id': 'empty custom lists',
+            'first_operand': [],
+            'second_operand': CustomList(),
+            'expected_add': [],
+            'expected_sub': [],
+        },
+        {
+            'case_id': 'same sizes',
+            'first_operand': [1, 2, 3],
+            'second_operand': CustomList([4, 5, 6]),
+            'expected_add': [5, 7, 9],
+            'expected_sub': [-3, -3, -3],
+        },
+        {
+            'case_id': 'longer left operand',
+            'first_operand': [4, 5, 6],
+            'second_operand': [-9, 8],
+            'expected_add': [-5, 13, 6],
+            'expected_sub': [13, -3, 6],
+        },
+        {
+            'case_id': 'longer right operand grows the list',
+            'first_operand': [1],
+            'second_operand': CustomList([4, 5, 6]),
+            'expected_add': [5, 5, 6],
+            'expected_sub': [-3, -5, -6],
+        },
+        {
+            'case_id': 'number',
+            'first_operand': [5, 3, 1],
+            'second_operand': 5,
+            'expected_add': [10, 8, 6],
+            'expected_sub': [0, -2, -4],
+        },
+        {
+            'case_id': 'number and empty custom list',
+            'first_operand': [],
+            'second_operand': 5,
+            'expected_add': [5],
+            'expected_sub': [-5],
+        },
+    ]
+)
+def test_custom_list_inplace(first_operand, second_operand, expected_add, expected_sub):
+    """
+    Test that += and -= update the left operand element-wise in place,
+    match the results of + and -, and keep the cached sum correct.
+    """
+    second_operand_copy = transform_to_list(second_operand)
+    for operation, expected_result in (('add', expected_add), ('sub', expected_sub)):
+        values = CustomList(first_operand)
+        original = values
+        if operation == 'add':
+            values += second_operand
+            assert list(CustomList(first_operand) + second_operand) == expected_result
+        else:
+            values -= second_operand
+            assert list(CustomList(first_operand) - second_operand) == expected_result
+
+        assert values is original
+        assert list(values) == expected_result
+        assert_sum_cached(values)
+        assert transform_to_list(second_operand) == second_operand_copy
+
+
+def test_custom_list_inplace_accumulation():
+    """
+    Test accumulating several vectors into one CustomList, including itself.
+    """
+    acc = CustomList()
+    for vector in ([1, 2], CustomList([3]), [0, 0, 7], 1):
+        acc += vector
+    assert list(acc) == [5, 3, 8]
+    acc += acc
+    assert list(acc) == [10, 6, 16]
+    acc -= acc
+    assert list(acc) == [0, 0, 0]
+    assert_sum_cached(acc)
+
+
+def test_custom_list_inplace_with_wrong_type():
+    """
+    Test that in-place arithmetic with an unsupported type raises NotImplementedError.
+    """
+    values = CustomList([1, 2, 3])
+    with pytest.raises(NotImplementedError):
+        values += '123'
+    with pytest.raises(NotImplementedError):
+        values -= '123'
+
+
+def test_custom_list_sum_watchers():
+    """
+    Test that sum watchers are notified about sum changes only, and can be removed.
+    """
+    changes = []
+    values = CustomList([1, 2])
+
+    def watcher(custom_list, old_sum, new_sum):
+        assert custom_list is values
+        changes.append((old_sum, new_sum))
+
+    values.add_sum_watcher(watcher)
+    values.append(3)
+    values.append(0)
+    values[0] = 1
+    values.clear()
+    assert changes == [(3, 6), (6, 0)]
+    values.remove_sum_watcher(watcher)
+    values.append(5)
+    assert changes == [(3, 6), (6, 0)]
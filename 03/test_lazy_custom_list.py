@@ -0,0 +1,106 @@
+"""
+This module contains tests for the LazyCustomList class. Lazy expressions are
+checked against the same expressions evaluated eagerly with CustomList.
+"""
+
+import random
+
+import pytest
+
+from custom_list import CustomList
+from lazy_custom_list import LazyCustomList, lazy
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_matches_eager_chains(seed):
+    """
+        Test that random chains of +, - and reflected operations with lists,
+        CustomLists and integers give the same elements and sum as eager evaluation.
+    """
+    rng = random.Random(seed)
+
+    def random_operand():
+        if rng.random() < 0.3:
+            return rng.randint(-10, 10)
+        values = [rng.randint(-100, 100) for _ in range(rng.randint(0, 6))]
+        return CustomList(values) if rng.random() < 0.5 else values
+
+    start = CustomList([rng.randint(-100, 100) for _ in range(rng.randint(0, 6))])
+    eager = start
+    expression = lazy(start)
+    for _ in range(rng.randint(1, 6)):
+        operand = random_operand()
+        choice = rng.randrange(4 if isinstance(operand, int) else 3)
+        if choice == 0:
+            eager, expression = eager + operand, expression + operand
+        elif choice == 1:
+            eager, expression = eager - operand, expression - operand
+        elif choice == 2:
+            operand = operand if isinstance(operand, int) else list(operand)
+            eager, expression = operand - eager, operand - expression
+        else:
+            eager, expression = operand + eager, operand + expression
+
+    assert isinstance(expression, LazyCustomList)
+    assert len(expression) == len(eager)
+    assert expression.total == sum(eager)
+    result = expression.materialize()
+    assert isinstance(result, CustomList)
+    assert list(result) == list(eager)
+
+
+def test_chain_from_request():
+    """
+        Test the `a + b - c + 5` chain and that operands are not modified.
+    """
+    first, second, third = CustomList([1, 2, 3]), [10], CustomList([0, 0, 0, 4])
+    expression = lazy(first) + second - third + 5
+    assert list(expression) == [16, 7, 8, 1]
+    assert str(expression) == '[16, 7, 8, 1], sum = 32'
+    assert list(first) == [1, 2, 3]
+    assert second == [10]
+
+
+def test_combining_lazy_expressions():
+    """
+        Test adding and subtracting two lazy expressions.
+    """
+    first = lazy([1, 2]) + 1
+    second = lazy([5]) - [0, 0, 3]
+    assert list(first - second) == [-3, 3, 3]
+    assert list(first + second) == [7, 3, -3]
+
+
+def test_empty_operand_and_number():
+    """
+        Test that a number broadcast to an empty operand gives one element, as for CustomList.
+    """
+    assert list(lazy([]) + 5) == [5]
+    assert list(5 - lazy([])) == [5]
+    assert list(lazy([]) - 5 + [1, 1]) == [-4, 1]
+
+
+def test_comparisons_without_materializing():
+    """
+        Test comparisons with CustomList and LazyCustomList by the sum of the result.
+    """
+    expression = lazy(CustomList([1, 2, 3])) - [1] + 1
+    assert expression.total == 8
+    assert expression == CustomList([8])
+    assert expression != lazy([7])
+    assert expression > CustomList([7])
+    assert expression >= lazy([4, 4])
+    assert expression < CustomList([9])
+    assert expression <= lazy([8])
+
+
+def test_wrong_types():
+    """
+        Test that unsupported operand types raise NotImplementedError.
+    """
+    with pytest.raises(NotImplementedError):
+        lazy('123')
+    with pytest.raises(NotImplementedError):
+        _ = lazy([1]) + '123'
+    with pytest.raises(NotImplementedError):
+        assert lazy([1]) == '[1]'
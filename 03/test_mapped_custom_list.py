@@ -0,0 +1,132 @@
+"""
+This module contains tests for the MappedCustomList class: streaming arithmetic
+into mapped files, the sum stored in the header and file handling.
+"""
+
+import gc
+import operator
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+import array_custom_list
+from array_custom_list import ArrayCustomList
+from custom_list import CustomList
+from mapped_custom_list import MappedCustomList
+
+
+@pytest.mark.parametrize('operator_func', [operator.add, operator.sub])
+@pytest.mark.parametrize('left, right', [
+    ([1, 2, 3], [10, 20]),
+    ([1], [10, 20, 30]),
+    ([], 5),
+    ([4, 5], -1),
+    ([], []),
+    (list(range(100)), list(range(37))),
+])
+def test_streaming_matches_array_custom_list(tmp_path, operator_func, left, right):
+    """
+        Test that chunked streaming operations give the same elements and sum as
+        ArrayCustomList, for list, mapped and integer operands, direct and reflected.
+    """
+    with patch.object(array_custom_list, 'CHUNK_SIZE', 7), \
+            MappedCustomList.create(str(tmp_path / 'left.clst'), left) as values:
+        expected = operator_func(ArrayCustomList(left), right).tolist()
+        with operator_func(values, right) as result:
+            assert list(result) == expected
+            assert result.total == sum(expected)
+
+        if isinstance(right, list):
+            with MappedCustomList.create(None, right) as mapped_right, operator_func(values, mapped_right) as result:
+                assert list(result) == expected
+
+        reflected_expected = operator_func(right, ArrayCustomList(left)).tolist()
+        with operator_func(right, values) as result:
+            assert list(result) == reflected_expected
+            assert result.total == sum(reflected_expected)
+
+
+def test_result_written_to_path_and_reopened(tmp_path):
+    """
+        Test that a result written to an explicit path persists with its header.
+    """
+    path = str(tmp_path / 'result.clst')
+    with MappedCustomList.create(None, [1, 2, 3]) as values:
+        values.add([10], path).close()
+    with MappedCustomList.open(path) as result:
+        assert list(result) == [11, 2, 3]
+        assert result.total == 16
+        assert str(result) == '[11, 2, 3], sum = 16'
+
+
+def test_comparisons_use_header_sum(tmp_path):
+    """
+        Test that comparisons read the stored sum instead of scanning the elements.
+    """
+    with MappedCustomList.create(str(tmp_path / 'values.clst'), [1, 2, 3]) as values:
+        values.set_total(100)
+        assert values > CustomList([99])
+        assert values == ArrayCustomList([100])
+        assert values.recompute_total() == 6
+        assert values < CustomList([7])
+
+
+def test_setitem_updates_header_sum(tmp_path):
+    """
+        Test that item assignment keeps the stored sum correct.
+    """
+    with MappedCustomList.create(str(tmp_path / 'values.clst'), [1, 2, 3]) as values:
+        values[0] = 10
+        values[-1] = -3
+        assert list(values) == [10, 2, -3]
+        assert values.total == 9
+        assert values[1:].tolist() == [2, -3]
+
+
+def test_large_sum_does_not_overflow_header(tmp_path):
+    """
+        Test that a sum outside of the int64 range is stored correctly.
+    """
+    with MappedCustomList.create(str(tmp_path / 'values.clst'), [2 ** 63 - 1] * 4) as values:
+        assert values.total == 4 * (2 ** 63 - 1)
+
+
+def test_temporary_results_are_removed():
+    """
+        Test that temporary results are removed from disk on close.
+    """
+    with MappedCustomList.create(None, [1, 2]) as values:
+        result = values + 1
+        path = result.path
+        assert os.path.exists(path)
+        result.close()
+        assert not os.path.exists(path)
+
+
+def test_intermediate_results_are_removed(tmp_path, monkeypatch):
+    """
+        Test that an unreachable intermediate result is removed without an explicit close.
+    """
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    with MappedCustomList.create(None, [1, 2]) as left, MappedCustomList.create(None, [3]) as right:
+        with (left + right) - 5 as result:
+            assert list(result) == [-1, -3]
+            gc.collect()
+            assert len(list(tmp_path.iterdir())) == 3
+        result.close()
+    assert not list(tmp_path.iterdir())
+
+
+def test_wrong_file_and_operand(tmp_path):
+    """
+        Test that foreign files and unsupported operands are rejected.
+    """
+    path = tmp_path / 'foreign.bin'
+    path.write_bytes(b'x' * 64)
+    with pytest.raises(ValueError):
+        MappedCustomList.open(str(path))
+    with MappedCustomList.create(None, [1]) as values:
+        with pytest.raises(NotImplementedError):
+            _ = values + '123'
@@ -0,0 +1,111 @@
+"""
+This module contains tests for the parallel element-wise operations and sums:
+equivalence with the single-process path, outputs, the threshold and clean-up of
+temporary shared segments.
+"""
+
+import operator
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from array_custom_list import ArrayCustomList
+from parallel_custom_list import parallel_add, parallel_operate, parallel_sub, parallel_sum
+from shared_custom_list import SharedCustomList
+
+
+@pytest.fixture(name='executor', scope='module')
+def fixture_executor():
+    """
+        A process pool shared by the tests, so workers are started once.
+    """
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        yield executor
+
+
+def shared_segments() -> set:
+    """
+        Returns names of the shared memory segments currently present in the system.
+    """
+    return set(os.listdir('/dev/shm')) if os.path.isdir('/dev/shm') else set()
+
+
+@pytest.mark.parametrize('operator_func', [operator.add, operator.sub])
+@pytest.mark.parametrize('left, right', [
+    ([1, 2, 3], [10, 20]),
+    ([1], [10, 20, 30]),
+    ([], 5),
+    (5, [4, 5]),
+    ([4, 5], -1),
+    ([], []),
+    (list(range(100)), list(range(37))),
+])
+def test_parallel_matches_single_process(executor, operator_func, left, right):
+    """
+        Test that the parallel path gives the same elements as ArrayCustomList for
+        list, ArrayCustomList and integer operands.
+    """
+    expected = operator_func(
+        left if isinstance(left, int) else ArrayCustomList(left),
+        right if isinstance(right, int) else ArrayCustomList(right),
+    ).tolist()
+    result = parallel_operate(left, right, operator_func, workers=3, threshold=0, executor=executor)
+    assert result.tolist() == expected
+    assert type(result) is ArrayCustomList  # pylint: disable=unidiomatic-typecheck
+
+    wrapped = [value if isinstance(value, int) else ArrayCustomList(value) for value in (left, right)]
+    assert parallel_operate(*wrapped, operator_func, workers=3, threshold=0, executor=executor).tolist() == expected
+
+
+def test_shared_operands_and_output(executor):
+    """
+        Test that shared operands are used in place and the result is written into a shared output.
+    """
+    with SharedCustomList.create(range(1000)) as left, \
+            SharedCustomList.create([1] * 500) as right, \
+            SharedCustomList.empty(1000) as out:
+        assert parallel_add(left, right, out=out, workers=3, threshold=0, executor=executor) is out
+        assert out[:3].tolist() == [1, 2, 3]
+        assert out[-1] == 999
+        assert parallel_sum(out, workers=3, threshold=0, executor=executor) == sum(range(1000)) + 500
+
+
+def test_plain_output_and_single_process_path(executor):
+    """
+        Test writing into a plain ArrayCustomList output, and that the threshold keeps
+        small inputs in the current process.
+    """
+    out = ArrayCustomList([0] * 4)
+    assert parallel_sub([5, 5, 5, 5], [1, 2], out=out, workers=2, threshold=0, executor=executor) is out
+    assert out.tolist() == [4, 3, 5, 5]
+    assert parallel_add([1, 2], [3], workers=2).tolist() == [4, 2]
+    assert parallel_add([1, 2], 3, workers=1, threshold=0).tolist() == [4, 5]
+
+
+def test_parallel_sum(executor):
+    """
+        Test that the parallel reduction equals the sum for shared and plain vectors.
+    """
+    with SharedCustomList.create(range(-50, 1001)) as values:
+        assert parallel_sum(values, workers=3, threshold=0, executor=executor) == sum(range(-50, 1001))
+    assert parallel_sum(ArrayCustomList([1, 2, 3]), workers=3, threshold=0) == 6
+
+
+def test_temporary_segments_are_removed(executor):
+    """
+        Test that operands and outputs copied to shared memory are removed after the call.
+    """
+    before = shared_segments()
+    parallel_add(list(range(100)), ArrayCustomList([1] * 100), workers=3, threshold=0, executor=executor)
+    assert shared_segments() == before
+
+
+def test_wrong_operands_and_output():
+    """
+        Test that unsupported operands and outputs of a wrong length are rejected.
+    """
+    with pytest.raises(NotImplementedError):
+        parallel_add([1], '123')
+    with pytest.raises(ValueError):
+        parallel_add([1, 2], [1], out=ArrayCustomList([0]))
@@ -0,0 +1,131 @@
+"""
+This module contains tests for the SharedCustomList class: arithmetic on shared
+segments, writing into preallocated outputs, zero-copy attaching by name and
+the lifetime of segments.
+"""
+
+import gc
+import operator
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from array_custom_list import ArrayCustomList
+from shared_custom_list import SharedCustomList
+
+
+def add_in_worker(left: SharedCustomList, right: SharedCustomList, out: SharedCustomList) -> int:
+    """
+        Adds two shared lists in a worker process, writing into a shared output.
+        :return: sum of the result, as seen by the worker
+    """
+    left.add(right, out=out)
+    return sum(out)
+
+
+def test_arithmetic_matches_array_custom_list():
+    """
+        Test that arithmetic and comparisons behave like ArrayCustomList.
+    """
+    with SharedCustomList.create([1, 2, 3]) as values:
+        assert list(values) == [1, 2, 3]
+        assert (values + [1]).tolist() == [2, 2, 3]
+        assert (10 - values).tolist() == [9, 8, 7]
+        assert values == ArrayCustomList([6])
+        assert values[1:].tolist() == [2, 3]
+        assert str(values) == '[1, 2, 3], sum = 6'
+
+
+@pytest.mark.parametrize('operator_name', ['add', 'sub'])
+@pytest.mark.parametrize('left, right', [
+    ([1, 2, 3], [10, 20]),
+    ([1], [10, 20, 30]),
+    ([], 5),
+    ([4, 5], -1),
+    ([], []),
+])
+def test_operations_into_preallocated_output(operator_name, left, right):
+    """
+        Test that results written into a preallocated shared output match the operators,
+        for direct and reflected operations.
+    """
+    operator_func = getattr(operator, operator_name)
+    with SharedCustomList.create(left) as values:
+        expected = operator_func(ArrayCustomList(left), right).tolist()
+        with SharedCustomList.empty(len(expected)) as out:
+            assert getattr(values, operator_name)(right, out=out) is out
+            assert list(out) == expected
+
+        reflected_expected = operator_func(right, ArrayCustomList(left)).tolist()
+        with SharedCustomList.empty(len(reflected_expected)) as out:
+            getattr(values, operator_name)(right, out=out, reflected=True)
+            assert list(out) == reflected_expected
+
+
+def test_output_of_wrong_length():
+    """
+        Test that an output of a wrong length is rejected.
+    """
+    with SharedCustomList.create([1, 2, 3]) as values, SharedCustomList.empty(2) as out:
+        with pytest.raises(ValueError):
+            values.add([1], out=out)
+        with pytest.raises(NotImplementedError):
+            values.add('123', out=out)
+
+
+def test_attach_by_name_is_zero_copy():
+    """
+        Test that an attached or unpickled instance sees writes made through the owner.
+    """
+    with SharedCustomList.create([1, 2, 3]) as owner:
+        attached = SharedCustomList.attach(owner.name, len(owner))
+        unpickled = pickle.loads(pickle.dumps(owner))
+        owner[0] = 100
+        assert attached[0] == 100
+        assert unpickled[0] == 100
+        assert not attached.owner
+        with pytest.raises(PermissionError):
+            attached.unlink()
+        attached.close()
+        unpickled.close()
+
+
+def test_worker_process_writes_shared_output():
+    """
+        Test that worker processes attach to the segments and write results visible to the parent.
+    """
+    with SharedCustomList.create(range(1000)) as left, \
+            SharedCustomList.create([1] * 500) as right, \
+            SharedCustomList.empty(1000) as out:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            worker_sum = executor.submit(add_in_worker, left, right, out).result()
+        assert worker_sum == sum(range(1000)) + 500
+        assert out[:3].tolist() == [1, 2, 3]
+        assert out[-1] == 999
+
+
+def test_collected_instance_is_closed(monkeypatch):
+    """
+        Test that an attached instance collected without `close()` releases its views
+        before the segment is closed, so no BufferError is reported.
+    """
+    errors = []
+    monkeypatch.setattr(sys, 'unraisablehook', errors.append)
+    with SharedCustomList.create([1, 2, 3]) as owner:
+        attached = pickle.loads(pickle.dumps(owner))
+        assert attached[2] == 3
+        del attached
+        gc.collect()
+    assert not errors
+
+
+def test_unlinked_segment_cannot_be_attached():
+    """
+        Test that the owner destroys the segment on exit from the context manager.
+    """
+    with SharedCustomList.create([1]) as values:
+        name = values.name
+    with pytest.raises(FileNotFoundError):
+        SharedCustomList.attach(name, 1)
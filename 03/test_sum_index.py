@@ -0,0 +1,107 @@
+"""
+This module contains tests for the SumIndex class: ordering by sum, top-N and
+range queries, and keeping the order up to date when members are mutated.
+"""
+
+import copy
+import random
+
+import pytest
+
+from custom_list import CustomList
+from sum_index import SumIndex
+
+
+def sums(lists: list) -> list[int]:
+    """
+        Returns the sums of the lists.
+    """
+    return [custom_list.total for custom_list in lists]
+
+
+def test_queries():
+    """
+        Test iteration order, top-N, bottom-N and inclusive sum ranges.
+    """
+    lists = [CustomList([5]), CustomList([1, 1]), CustomList([-3]), CustomList([2, 3]), CustomList()]
+    index = SumIndex(lists)
+    assert len(index) == 5
+    assert sums(index) == [-3, 0, 2, 5, 5]
+    assert sums(index.top(3)) == [5, 5, 2]
+    assert sums(index.top(10)) == [5, 5, 2, 0, -3]
+    assert sums(index.bottom(2)) == [-3, 0]
+    assert sums(index.between(0, 5)) == [0, 2, 5, 5]
+    assert index.between(6, 10) == []
+    assert all(custom_list in index for custom_list in lists)
+    assert CustomList([5]) not in index
+
+
+def test_mutations_move_members():
+    """
+        Test that every kind of mutation keeps members at the right position.
+    """
+    first, second = CustomList([1]), CustomList([2])
+    index = SumIndex([first, second])
+    first.append(10)
+    assert index.top(1)[0] is first
+    first.clear()
+    assert index.bottom(1)[0] is first
+    second -= 5
+    assert index.bottom(1)[0] is second
+    second[0:1] = [100]
+    first *= 3
+    del second[0]
+    first += [7]
+    assert sums(index) == [0, 7]
+    assert index.top(1)[0] is first
+
+
+def test_matches_sorting_after_random_mutations():
+    """
+        Test that after random mutations queries equal sorting all lists by sum.
+    """
+    rng = random.Random(37)
+    lists = [CustomList([rng.randint(-50, 50) for _ in range(rng.randint(0, 5))]) for _ in range(200)]
+    index = SumIndex(lists)
+    for _ in range(2000):
+        custom_list = rng.choice(lists)
+        action = rng.randrange(4)
+        if action == 0:
+            custom_list.append(rng.randint(-50, 50))
+        elif action == 1 and custom_list:
+            custom_list.pop()
+        elif action == 2 and custom_list:
+            custom_list[rng.randrange(len(custom_list))] = rng.randint(-50, 50)
+        else:
+            custom_list += rng.randint(-5, 5)
+
+    expected = sorted(sums(lists))
+    assert sums(index) == expected
+    assert sums(index.top(10)) == expected[::-1][:10]
+    assert sums(index.between(-20, 20)) == [total for total in expected if -20 <= total <= 20]
+
+
+def test_removed_and_copied_lists_are_not_tracked():
+    """
+        Test that removed members and copies of members do not affect the index.
+    """
+    first, second = CustomList([1]), CustomList([2])
+    index = SumIndex([first, second])
+    index.remove(first)
+    first.append(100)
+    copy.copy(second).append(100)
+    assert sums(index) == [2]
+    with pytest.raises(KeyError):
+        index.remove(first)
+
+
+def test_wrong_members():
+    """
+        Test that non-CustomList values and duplicates are rejected.
+    """
+    custom_list = CustomList([1])
+    index = SumIndex([custom_list])
+    with pytest.raises(ValueError):
+        index.add(custom_list)
+    with pytest.raises(TypeError):
+        index.add([1, 2])
@@ -0,0 +1,116 @@
+"""
+This module contains tests for the TypedCustomList class: compact storage per
+dtype, arithmetic matching CustomList and the overflow policies.
+"""
+
+import operator
+from array import array
+
+import pytest
+
+from array_custom_list import ArrayCustomList
+from custom_list import CustomList
+from typed_custom_list import TypedCustomList, dtype_bounds
+
+OPERANDS = [[], [1], [-100], [4, 5, 6], [-9, 8], list(range(300))]
+
+
+@pytest.mark.parametrize('dtype', ['int16', 'int32', 'int64'])
+@pytest.mark.parametrize('operator_func', [operator.add, operator.sub])
+@pytest.mark.parametrize('left', OPERANDS)
+@pytest.mark.parametrize('right', OPERANDS + [0, -7])
+def test_matches_custom_list(dtype, operator_func, left, right):
+    """
+        Test that results within the dtype range equal CustomList results, for direct
+        and reflected operations.
+    """
+    result = operator_func(TypedCustomList(left, dtype), right)
+    assert isinstance(result, TypedCustomList)
+    assert result.dtype == dtype
+    assert result.tolist() == list(operator_func(CustomList(left), right))
+    assert operator_func(right, TypedCustomList(left, dtype)).tolist() == list(operator_func(right, CustomList(left)))
+
+
+@pytest.mark.parametrize('dtype, itemsize', [('int16', 2), ('int32', 4), ('int64', 8)])
+def test_compact_storage(dtype, itemsize):
+    """
+        Test the bytes per element and that sums and comparisons do not overflow.
+    """
+    _, high = dtype_bounds(dtype)
+    values = TypedCustomList([high] * 3, dtype)
+    assert values.itemsize == itemsize
+    assert values.total == 3 * high
+    assert values > CustomList([high])
+    assert values == CustomList([3 * high])
+    assert str(values) == f'[{high}, {high}, {high}], sum = {3 * high}'
+
+
+def test_raise_policy():
+    """
+        Test that overflowing results, assignments and initial values raise and keep the operands.
+    """
+    values = TypedCustomList([32767, 1], 'int16')
+    with pytest.raises(OverflowError):
+        _ = values + 1
+    with pytest.raises(OverflowError):
+        _ = -32768 - values
+    with pytest.raises(OverflowError):
+        values[1] = 40000
+    with pytest.raises(OverflowError):
+        TypedCustomList([2 ** 31], 'int32')
+    assert values.tolist() == [32767, 1]
+
+
+def test_saturate_policy():
+    """
+        Test that overflowing values are clamped to the dtype range.
+    """
+    values = TypedCustomList([32000, -32000, 5], 'int16', 'saturate')
+    assert (values + [1000, -1000, 1]).tolist() == [32767, -32768, 6]
+    values[2] = -10 ** 6
+    assert values.tolist() == [32000, -32000, -32768]
+    assert values.dtype == 'int16'
+
+
+def test_promote_policy():
+    """
+        Test that overflowing results are stored in the narrowest wider dtype.
+    """
+    values = TypedCustomList([32000, 1], 'int16', 'promote')
+    result = values + 1000
+    assert result.dtype == 'int32'
+    assert result.tolist() == [33000, 1001]
+    assert (values + [2 ** 40]).dtype == 'int64'
+    assert values.dtype == 'int16'
+
+    values[1] = 70000
+    assert values.dtype == 'int32'
+    assert values.tolist() == [32000, 70000]
+
+    with pytest.raises(OverflowError):
+        _ = TypedCustomList([2 ** 62], 'int64', 'promote') + [2 ** 62]
+
+
+def test_result_dtype_is_widest_operand():
+    """
+        Test that mixing dtypes gives the wider one, and ArrayCustomList counts as int64.
+    """
+    narrow = TypedCustomList([1, 2], 'int16')
+    assert (narrow + TypedCustomList([1], 'int32')).dtype == 'int32'
+    assert (narrow - ArrayCustomList([1])).dtype == 'int64'
+    assert narrow[1:].dtype == 'int16'
+    assert TypedCustomList.from_array(array('i', [1, 2])).dtype == 'int32'
+
+
+def test_wrong_arguments():
+    """
+        Test that unknown dtypes, policies, typecodes and operands are rejected.
+    """
+    with pytest.raises(ValueError):
+        TypedCustomList([1], 'int8')
+    with pytest.raises(ValueError):
+        TypedCustomList([1], 'int16', 'wrap')
+    with pytest.raises(TypeError):
+        TypedCustomList.from_array(array('d', [1.0]))
+    with pytest.raises(NotImplementedError):
+        _ = TypedCustomList([1]) + '123'
@@ -0,0 +1,199 @@
+"""
+This module contains the TypedCustomList class, an ArrayCustomList with a
+configurable element type: `int16`, `int32` or `int64` (2, 4 or 8 bytes per element).
+
+Python integers never overflow, but a compact buffer cannot hold every result, so
+arithmetic and item assignment check the range of the dtype and apply an overflow
+policy instead of wrapping around silently:
+- `raise`: raise OverflowError (the default);
+- `saturate`: clamp the values to the minimum or maximum of the dtype;
+- `promote`: store the result in the narrowest wider dtype that fits it, raising
+OverflowError if even `int64` is too narrow.
+
+The range check is free in the common case: the result is built directly in the
+target buffer, which rejects out-of-range values, and only then is the operation
+repeated with the policy applied.
+"""
+
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import partial
+from itertools import repeat, starmap, zip_longest
+
+from array_custom_list import ArrayCustomList
+
+DTYPES = {'int16': 'h', 'int32': 'i', 'int64': 'q'}
+PROMOTIONS = ('int16', 'int32', 'int64')
+
+OVERFLOW_RAISE = 'raise'
+OVERFLOW_SATURATE = 'saturate'
+OVERFLOW_PROMOTE = 'promote'
+OVERFLOW_POLICIES = (OVERFLOW_RAISE, OVERFLOW_SATURATE, OVERFLOW_PROMOTE)
+
+
+def dtype_bounds(dtype: str) -> tuple[int, int]:
+    """
+        Returns the minimum and maximum values of a dtype.
+
+        :param dtype: One of `DTYPES`.
+        :return: A (minimum, maximum) tuple.
+    """
+    bits = array(DTYPES[dtype]).itemsize * 8
+    return -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+
+
+def _dtype_of(values: Sequence[int]) -> str | None:
+    """
+        Returns the dtype an operand contributes to the result: its own for TypedCustomList,
+        `int64` for other ArrayCustomLists and None for lists.
+    """
+    if isinstance(values, TypedCustomList):
+        return values.dtype
+    if isinstance(values, ArrayCustomList):
+        return 'int64'
+    return None
+
+
+class TypedCustomList(ArrayCustomList):
+    """
+        TypedCustomList stores integers of a fixed dtype in a compact typed array and
+        supports the arithmetic and comparisons of ArrayCustomList with overflow checks.
+    """
+
+    def __init__(self, values: Iterable[int] | None = None, dtype: str = 'int32', overflow: str = OVERFLOW_RAISE):
+        """
+            Initializes the TypedCustomList with the given values.
+
+            :param values: Integers to store, an empty buffer is initialized if omitted.
+            :param dtype: One of `DTYPES`.
+            :param overflow: One of `OVERFLOW_POLICIES`.
+            :raises ValueError: if `dtype` or `overflow` is unknown.
+            :raises OverflowError: if a value does not fit `dtype` and the policy is `raise`.
+        """
+        super().__init__()
+        if dtype not in DTYPES:
+            raise ValueError(f'Unknown dtype {dtype!r}, expected one of {list(DTYPES)}')
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f'Unknown overflow policy {overflow!r}, expected one of {list(OVERFLOW_POLICIES)}')
+        self._dtype = dtype
+        self._overflow = overflow
+        values = [] if values is None else values
+        if isinstance(values, Iterator):
+            values = list(values)
+        self._data = self._store(lambda: values)
+
+    @classmethod
+    def from_array(cls, data: array, overflow: str = OVERFLOW_RAISE) -> TypedCustomList:
+        """
+            Wraps an existing typed array without copying it.
+
+            :param data: An array with one of the `DTYPES` typecodes.
+            :param overflow: One of `OVERFLOW_POLICIES`.
+            :return: A new TypedCustomList sharing the buffer.
+        """
+        for dtype, typecode in DTYPES.items():
+            if data.typecode == typecode and data.itemsize == array(typecode).itemsize:
+                instance = cls(dtype=dtype, overflow=overflow)
+                instance._data = data
+                return instance
+        raise TypeError(f'Unsupported array typecode {data.typecode!r}')
+
+    @classmethod
+    def _build(cls, values: Callable[[], Iterable[int]], dtype: str, overflow: str) -> TypedCustomList:
+        """
+            Creates an instance from a function returning the values, see `_store`.
+        """
+        instance = cls(dtype=dtype, overflow=overflow)
+        instance._data = instance._store(values)
+        return instance
+
+    @property
+    def dtype(self) -> str:
+        """Returns the element type."""
+        return self._dtype
+
+    @property
+    def overflow(self) -> str:
+        """Returns the overflow policy."""
+        return self._overflow
+
+    @property
+    def itemsize(self) -> int:
+        """Returns the number of bytes per element."""
+        return self._data.itemsize
+
+    def _store(self, values: Callable[[], Iterable[int]]) -> array:
+        """
+            Builds a buffer of the current dtype, applying the overflow policy. Promotion
+            changes the dtype of the instance.
+
+            :param values: A function returning the values, called again if they overflow.
+            :return: A new typed array.
+        """
+        try:
+            return array(DTYPES[self._dtype], values())
+        except OverflowError:
+            if self._overflow == OVERFLOW_RAISE:
+                raise OverflowError(f'Value out of {self._dtype} range') from None
+
+        values = list(values())
+        if self._overflow == OVERFLOW_SATURATE:
+            low, high = dtype_bounds(self._dtype)
+            return array(DTYPES[self._dtype], (min(max(value, low), high) for value in values))
+
+        low, high = min(values), max(values)
+        for dtype in PROMOTIONS[PROMOTIONS.index(self._dtype) + 1:]:
+            dtype_low, dtype_high = dtype_bounds(dtype)
+            if dtype_low <= low and high <= dtype_high:
+                self._dtype = dtype
+                return array(DTYPES[dtype], values)
+        raise OverflowError(f'Value out of {PROMOTIONS[-1]} range')
+
+    def _operate(
+        self, other: Sequence[int] | int, operator_func: Callable[[int, int], int], reflected: bool = False
+    ) -> TypedCustomList:
+        """
+            A helper function for performing element-wise operations (addition or subtraction).
+            The result has the widest dtype of the typed operands and the overflow policy of
+            the current instance.
+
+            :param other: A list, ArrayCustomList, TypedCustomList or a single integer.
+            :param operator_func: `operator.add` or `operator.sub`.
+            :param reflected: True if `other` is the left operand.
+            :return: A new TypedCustomList instance with the result of the operation.
+        """
+        left, right = (other, self._data) if reflected else (self._data, other)
+        if isinstance(other, int):
+            if not self._data:
+                left, right = (other, [0]) if reflected else ([0], other)
+            pairs = partial(zip, repeat(left), right) if reflected else partial(zip, left, repeat(right))
+        elif isinstance(other, (list, ArrayCustomList)):
+            pairs = partial(zip_longest, left, right, fillvalue=0)
+        else:
+            raise NotImplementedError
+
+        dtype = max(self._dtype, _dtype_of(other) or self._dtype, key=PROMOTIONS.index)
+        return TypedCustomList._build(lambda: starmap(operator_func, pairs()), dtype, self._overflow)
+
+    def __getitem__(self, index: int | slice) -> int | TypedCustomList:
+        if isinstance(index, slice):
+            return TypedCustomList.from_array(self._data[index], self._overflow)
+        return self._data[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        """
+            Assigns an element, applying the overflow policy to the value.
+        """
+        low, high = dtype_bounds(self._dtype)
+        if low <= value <= high:
+            self._data[index] = value
+            return
+        values = self._data.tolist()
+        values[index] = value
+        self._data = self._store(lambda: values)
+
+    def __repr__(self) -> str:
+        return f'TypedCustomList({self._data.tolist()}, dtype={self._dtype!r}, overflow={self._overflow!r})'
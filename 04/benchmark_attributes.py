@@ -0,0 +1,253 @@
+"""
+This script benchmarks attribute handling of the instrument classes:
+1. PlainInstrument: a standard class with regular attribute storage.
+2. SlotsInstrument: a class optimized with `__slots__`.
+3. DescriptorInstrument: `BaseDescriptor` fields stored in the instance `__dict__`.
+4. MusicalInstrument: descriptor fields stored in slots by `SlottedDescriptorMeta`.
+5. EncodedMusicalInstrument: descriptor fields packed into one int.
+6. CustomMetaInstrument and CustomMetaSlotsInstrument: classes created by `CustomMeta`,
+   without and with `slots=True`.
+
+The script measures, as in `08/class_attributes.py`:
+- Creation time for a number of instances.
+- Read time and write time for the attributes of these instances.
+- Memory allocated per instance, traced with `tracemalloc`.
+
+Every measurement is repeated after a warm-up run; the script prints the mean,
+standard deviation and minimum over the repetitions.
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from operator import attrgetter
+
+from descriptor import EncodedMusicalInstrument, InstrumentType, Material, MusicalInstrument, SoundRegister
+from metaclass import CustomMeta
+
+FIELDS = ('instrument_type', 'material', 'sound_register')
+VALUES = ('string', 'wood', 'medium')
+NEW_VALUES = ('wind', 'metal', 'high')
+
+
+class PlainInstrument:
+    """
+    An instrument with regular attributes and no validation.
+    """
+
+    def __init__(self, instrument_type: str, material: str, sound_register: str):
+        self.instrument_type = instrument_type
+        self.material = material
+        self.sound_register = sound_register
+
+
+class SlotsInstrument:
+    """
+    An instrument with attributes in `__slots__` and no validation.
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, instrument_type: str, material: str, sound_register: str):
+        self.instrument_type = instrument_type
+        self.material = material
+        self.sound_register = sound_register
+
+
+class DescriptorInstrument:
+    """
+    An instrument validated by descriptors storing values in the instance `__dict__`.
+    """
+    instrument_type = InstrumentType()
+    material = Material()
+    sound_register = SoundRegister()
+
+    def __init__(self, instrument_type: str, material: str, sound_register: str):
+        self.instrument_type = instrument_type
+        self.material = material
+        self.sound_register = sound_register
+
+
+class CustomMetaInstrument(metaclass=CustomMeta):
+    """
+    An instrument created by `CustomMeta`, attributes are stored with the 'custom_' prefix.
+    """
+
+    def __init__(self, instrument_type: str, material: str, sound_register: str):
+        self.instrument_type = instrument_type
+        self.material = material
+        self.sound_register = sound_register
+
+
+class CustomMetaSlotsInstrument(metaclass=CustomMeta, slots=True):
+    """
+    An instrument created by `CustomMeta` with prefixed attributes in `__slots__`.
+    """
+    instrument_type: str
+    material: str
+    sound_register: str
+
+    def __init__(self, instrument_type: str, material: str, sound_register: str):
+        self.instrument_type = instrument_type
+        self.material = material
+        self.sound_register = sound_register
+
+
+CUSTOM_FIELDS = tuple(f'custom_{field}' for field in FIELDS)
+CLASSES = {
+    'PlainInstrument': (PlainInstrument, FIELDS),
+    'SlotsInstrument': (SlotsInstrument, FIELDS),
+    'DescriptorInstrument': (DescriptorInstrument, FIELDS),
+    'MusicalInstrument': (MusicalInstrument, FIELDS),
+    'EncodedMusicalInstrument': (EncodedMusicalInstrument, FIELDS),
+    'CustomMetaInstrument': (CustomMetaInstrument, CUSTOM_FIELDS),
+    'CustomMetaSlotsInstrument': (CustomMetaSlotsInstrument, CUSTOM_FIELDS),
+}
+
+
+def benchmark_class_creation(cls, n: int):
+    """
+    Measure the time required to create `n` instances of a class.
+
+    Args:
+        cls: The class to be instantiated.
+        n: Number of instances to create.
+
+    Returns:
+        A tuple containing the list of instances and the elapsed time.
+    """
+    start_time = time.perf_counter()
+    instances = [cls(*VALUES) for _ in range(n)]
+    end_time = time.perf_counter()
+    return instances, end_time - start_time
+
+
+def benchmark_attribute_read(instances, fields: tuple[str, ...]) -> float:
+    """
+    Measure the time required to read the attributes of instances.
+
+    Args:
+        instances: List of instances whose attributes are to be read.
+        fields: Names of the attributes.
+
+    Returns:
+        The elapsed time.
+    """
+    read = attrgetter(*fields)
+    start_time = time.perf_counter()
+    for instance in instances:
+        read(instance)
+    end_time = time.perf_counter()
+    return end_time - start_time
+
+
+def benchmark_attribute_write(instances) -> float:
+    """
+    Measure the time required to modify the attributes of instances.
+
+    Args:
+        instances: List of instances whose attributes are to be modified.
+
+    Returns:
+        The elapsed time.
+    """
+    instrument_type, material, sound_register = NEW_VALUES
+    start_time = time.perf_counter()
+    for instance in instances:
+        instance.instrument_type = instrument_type
+        instance.material = material
+        instance.sound_register = sound_register
+    end_time = time.perf_counter()
+    return end_time - start_time
+
+
+def memory_per_instance(cls, n: int) -> float:
+    """
+    Measure the memory allocated by one instance of a class, including its `__dict__`.
+
+    Args:
+        cls: The class to be instantiated.
+        n: Number of instances to average over.
+
+    Returns:
+        Bytes per instance, without the list holding the instances.
+    """
+    instances = [None] * n
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for index in range(n):
+        instances[index] = cls(*VALUES)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / n
+
+
+def repeat(measurement: Callable[[], float], repetitions: int) -> dict[str, float]:
+    """
+    Repeat a measurement after one warm-up run.
+
+    Args:
+        measurement: A function returning the elapsed time.
+        repetitions: Number of measured runs.
+
+    Returns:
+        Mean, standard deviation and minimum of the runs.
+    """
+    measurement()
+    times = [measurement() for _ in range(repetitions)]
+    return {
+        'mean': statistics.mean(times),
+        'stdev': statistics.stdev(times) if repetitions > 1 else 0.0,
+        'min': min(times),
+    }
+
+
+def run_benchmarks(classes: dict, n: int, repetitions: int) -> dict[str, dict]:
+    """
+    Benchmark creation, reads, writes and memory of every class.
+
+    Args:
+        classes: (class, attribute names to read) by class name.
+        n: Number of instances per run.
+        repetitions: Number of measured runs.
+
+    Returns:
+        Statistics of every measurement by class name.
+    """
+    results = {}
+    for name, (cls, fields) in classes.items():
+        instances, _ = benchmark_class_creation(cls, n)
+        results[name] = {
+            'creation': repeat(lambda cls=cls: benchmark_class_creation(cls, n)[1], repetitions),
+            'read': repeat(lambda fields=fields, instances=instances: benchmark_attribute_read(instances, fields),
+                           repetitions),
+            'write': repeat(lambda instances=instances: benchmark_attribute_write(instances), repetitions),
+            'bytes_per_instance': memory_per_instance(cls, min(n, 10_000)),
+        }
+    return results
+
+
+def main(arguments: list[str] | None = None):
+    """
+        Provides benchmarks
+    """
+    parser = argparse.ArgumentParser(description="Benchmark attribute access of the instrument classes.")
+    parser.add_argument("--instances", type=int, default=1_000_000, help="Number of instances per run.")
+    parser.add_argument("--repetitions", type=int, default=5, help="Number of measured runs.")
+    parser.add_argument("--classes", nargs="+", choices=list(CLASSES), default=list(CLASSES))
+    args = parser.parse_args(arguments)
+
+    results = run_benchmarks({name: CLASSES[name] for name in args.classes}, args.instances, args.repetitions)
+    for name, result in results.items():
+        timings = ', '.join(
+            f"{measurement.capitalize()} Time: {result[measurement]['mean']:.5f}s "
+            f"± {result[measurement]['stdev']:.5f}s (min {result[measurement]['min']:.5f}s)"
+            for measurement in ('creation', 'read', 'write')
+        )
+        print(f"{name}: {timings}, Memory: {result['bytes_per_instance']:.1f} bytes per instance")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+This script benchmarks the binary instrument catalog against JSON:
+1. JSON: a list of dicts, materialized and re-validated by creating `MusicalInstrument` objects.
+2. Catalog, untrusted: records validated column by column on bytes.
+3. Catalog, trusted: records used as they are when the settings digest matches.
+
+The script measures:
+- The size of the serialized data.
+- Encoding time.
+- Decoding time, alone and with every instrument materialized.
+"""
+
+import json
+import time
+from collections.abc import Callable
+from itertools import cycle, islice
+
+from descriptor import MusicalInstrument
+from instrument_codec import decode, encode
+
+ROWS = [
+    ('string', 'wood', 'medium'),
+    ('wind', 'metal', 'high'),
+    ('percussion', 'plastic', 'low'),
+    ('keyboard', 'wood', 'medium'),
+]
+
+
+def measure(function: Callable[[], object]) -> float:
+    """
+    Measure the execution time of a function.
+
+    Args:
+        function: A function without arguments.
+
+    Returns:
+        The time in seconds.
+    """
+    start_time = time.perf_counter()
+    function()
+    return time.perf_counter() - start_time
+
+
+def json_encode(instruments: list[MusicalInstrument]) -> bytes:
+    """
+    Serialize instruments as a JSON list of dicts.
+    """
+    return json.dumps([
+        {'instrument_type': instrument.instrument_type, 'material': instrument.material,
+         'sound_register': instrument.sound_register}
+        for instrument in instruments
+    ]).encode()
+
+
+def json_decode(data: bytes) -> list[MusicalInstrument]:
+    """
+    Deserialize instruments from JSON, validating every value.
+    """
+    return [MusicalInstrument(**row) for row in json.loads(data)]
+
+
+def benchmark_codecs(n: int) -> dict[str, dict[str, float]]:
+    """
+    Benchmark JSON and the catalog on the same instruments.
+
+    Args:
+        n: The number of instruments.
+
+    Returns:
+        Sizes and timings by codec.
+    """
+    instruments = [MusicalInstrument(*row) for row in islice(cycle(ROWS), n)]
+    json_data = json_encode(instruments)
+    catalog_data = encode(instruments)
+    return {
+        'JSON': {
+            'size': len(json_data),
+            'encode': measure(lambda: json_encode(instruments)),
+            'decode': measure(lambda: json.loads(json_data)),
+            'decode + materialize': measure(lambda: json_decode(json_data)),
+        },
+        'Catalog (untrusted)': {
+            'size': len(catalog_data),
+            'encode': measure(lambda: encode(instruments)),
+            'decode': measure(lambda: decode(catalog_data)),
+            'decode + materialize': measure(lambda: list(decode(catalog_data))),
+        },
+        'Catalog (trusted)': {
+            'size': len(catalog_data),
+            'encode': measure(lambda: encode(instruments)),
+            'decode': measure(lambda: decode(catalog_data, trusted=True)),
+            'decode + materialize': measure(lambda: list(decode(catalog_data, trusted=True))),
+        },
+    }
+
+
+def main():
+    """
+        Provides benchmarks
+    """
+    n = 1_000_000
+
+    for codec, results in benchmark_codecs(n).items():
+        print(
+            f"{codec}: Size: {results['size']} bytes, Encode Time: {results['encode']:.5f}s, "
+            f"Decode Time: {results['decode']:.5f}s, "
+            f"Decode + Materialize Time: {results['decode + materialize']:.5f}s"
+        )
+
+
+if __name__ == '__main__':
+    main()
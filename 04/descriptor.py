@@ -3,31 +3,91 @@ This module defines descriptors and a `MusicalInstrument` class to represent mus
 The descriptors are used to validate specific attributes such as instrument type, material,
 and sound register. The `MusicalInstrument` class uses these descriptors to ensure that
 each musical instrument created is valid based on predefined settings.
+
+`MusicalInstrument` stores its fields in slots generated by `SlottedDescriptorMeta`,
+so `BaseDescriptor.__get__` and `__set__` are not called for it, and class-level
+access such as `MusicalInstrument.instrument_type` returns the slot member
+descriptor instead of None. The descriptors are available in `__descriptors__`.
 """
 
-import settings
+from collections.abc import Callable
+from typing import Any
+
 from exceptions import WrongInstrumentType, WrongMaterial, WrongSoundRegister
+from settings_registry import CODE_BITS, CODE_MASK, REGISTRY, CodeTable
+
+
+MAX_INTERNED_RECORDS = 4096
+
+_RECORDS: dict[int, int] = {}
+
+
+def intern_record(record: int) -> int:
+    """
+        Returns a shared int object equal to a packed record. There are few distinct
+        records, so instances storing them share the int objects like small ints.
+        Once `MAX_INTERNED_RECORDS` records are interned, new ones are returned as is.
+    """
+    shared = _RECORDS.get(record)
+    if shared is not None:
+        return shared
+    if len(_RECORDS) < MAX_INTERNED_RECORDS:
+        _RECORDS[record] = record
+    return record
 
 
 class BaseDescriptor:
     """
        Base class for descriptors that validate attributes.
+       `error` is the exception raised by `validate` for an invalid value, `setting` is
+       the name of the allowed values in the current `settings_registry.REGISTRY` snapshot.
+
+       In encoded mode the value is stored as a 1-byte code from `code_table()`
+       inside the packed int `record` of the instance, at the offset given by the
+       position of the descriptor among the encoded fields of the class.
     """
+    error: type[Exception] = ValueError
+    setting: str = ''
 
-    def __init__(self) -> None:
+    def __init__(self, encoded: bool = False) -> None:
         """
         Initializes the BaseDescriptor. `_name` is initially set to None and
         later assigned in `__set_name__`.
+        :param encoded: Store values as codes in the packed `record` of the instance.
         """
         self._name: str = ''
+        self.encoded = encoded
+        self.shift = 0
 
     def __set_name__(self, class_type: type, name: str) -> None:
         """
-            Sets the name of the descriptor's hidden attribute.
+            Sets the name of the descriptor's hidden attribute, or the offset of its code
+            in the packed record in encoded mode.
             :param class_type: The class the descriptor is defined on.
             :param name: The name of the descriptor.
         """
         self._name = f'_hidden_{name}'
+        if self.encoded:
+            position = 0
+            for value in vars(class_type).values():
+                if value is self:
+                    break
+                if isinstance(value, BaseDescriptor) and value.encoded:
+                    position += 1
+            self.shift = position * CODE_BITS
+
+    def code_table(self) -> CodeTable:
+        """
+            Returns the append-only table of codes of the setting, which also decodes
+            values removed from the allowed set by a reload.
+        """
+        return REGISTRY.code_table(self.setting)
+
+    def encoder(self) -> dict[str, int]:
+        """
+            Returns the codes of the currently allowed values.
+        """
+        return REGISTRY.snapshot.encoders[self.setting]
 
     def __get__(self, obj: object, class_type: type) -> object:
         """
@@ -38,6 +98,8 @@ class BaseDescriptor:
         """
         if obj is None:
             return None
+        if self.encoded:
+            return self.code_table().values[(obj.record >> self.shift) & CODE_MASK]
         return getattr(obj, self._name)
 
     def __set__(self, obj: object, value: str | int) -> None:
@@ -46,56 +108,196 @@ class BaseDescriptor:
             :param obj: The instance of the class.
             :param value: The value to be set after validation.
         """
+        if self.encoded:
+            obj.record = intern_record(self.encode(value) << self.shift | obj.record & ~(CODE_MASK << self.shift))
+            return
         self.validate(value)
         setattr(obj, self._name, value)
 
+    def encode(self, value: str) -> int:
+        """
+            Validates a value and returns its code.
+            :param value: The value to be encoded.
+            :raises error: if the value is not allowed.
+        """
+        code = self.encoder().get(value)
+        if code is None:
+            raise self.error
+        return code
+
     def validate(self, value: str | int) -> None:
         """
-            Abstract method for validation, to be implemented in subclasses.
+            Checks that a value is allowed by the `setting` of the current settings snapshot.
             :param value: The value to be validated.
-            :raises NotImplementedError: if not overridden by subclasses.
+            :raises error: if the value is not allowed.
         """
-        raise NotImplementedError
+        if value not in REGISTRY.snapshot.allowed[self.setting]:
+            raise self.error
 
 
 class InstrumentType(BaseDescriptor):
     """
         Descriptor for validating the type of a musical instrument.
     """
-
-    def validate(self, value: str | int) -> None:
-        if value not in settings.INSTRUMENT_ALLOWED_TYPES:
-            raise WrongInstrumentType
+    error = WrongInstrumentType
+    setting = 'INSTRUMENT_ALLOWED_TYPES'
 
 
 class Material(BaseDescriptor):
     """
         Descriptor for validating the material of a musical instrument.
     """
-
-    def validate(self, value: str | int) -> None:
-        if value not in settings.ALLOWED_MATERIALS:
-            raise WrongMaterial
+    error = WrongMaterial
+    setting = 'ALLOWED_MATERIALS'
 
 
 class SoundRegister(BaseDescriptor):
     """
         Descriptor for validating the sound register of a musical instrument.
     """
+    error = WrongSoundRegister
+    setting = 'SOUND_ALLOWED_REGISTERS'
+
+
+FieldCheck = tuple[str, type[Exception], Callable[[Any], None] | None]
+
+
+def _field_check(descriptor: BaseDescriptor) -> FieldCheck:
+    """
+        Returns the setting and error of a descriptor, and its `validate` if a subclass
+        overrides it. Fields using `BaseDescriptor.validate` are checked inline.
+    """
+    validate = None if type(descriptor).validate is BaseDescriptor.validate else descriptor.validate
+    return descriptor.setting, descriptor.error, validate
+
+
+def _generated_init(fields: dict[str, FieldCheck], slot_setters: tuple[Callable[[Any, Any], None], ...]):
+    """
+        Builds an `__init__` taking the fields in declaration order. Like `dataclasses`, it
+        generates straight-line code: the values are checked against one settings snapshot
+        and stored through the slot members, so an instance is created in a single
+        Python-level call.
+    """
+    namespace: dict[str, Any] = {'_REGISTRY': REGISTRY}
+    lines = [f'def __init__(self, {", ".join(fields)}):', '    _allowed = _REGISTRY.snapshot.allowed']
+    for index, ((field, (setting, error, validate)), set_slot) in enumerate(zip(fields.items(), slot_setters)):
+        namespace[f'_error_{index}'] = error
+        namespace[f'_set_{index}'] = set_slot
+        if validate is not None:
+            namespace[f'_validate_{index}'] = validate
+            lines.append(f'    _validate_{index}({field})')
+        else:
+            lines.append(f'    if {field} not in _allowed[{setting!r}]:')
+            lines.append(f'        raise _error_{index}')
+        lines.append(f'    _set_{index}(self, {field})')
+    exec('\n'.join(lines), namespace)  # pylint: disable=exec-used
+    return namespace['__init__']
+
+
+class SlottedDescriptorMeta(type):
+    """
+        A metaclass storing the values of `BaseDescriptor` fields in `__slots__` members
+        generated at class creation instead of `_hidden_<name>` attributes in the instance `__dict__`.
 
-    def validate(self, value: int | str) -> None:
-        if value not in settings.SOUND_ALLOWED_REGISTERS:
-            raise WrongSoundRegister
+        The slot members take the place of the descriptors, so reads go straight to the slot
+        without a Python-level call. The descriptors are kept in `__descriptors__`, values are
+        checked only on set, against the `setting` of the descriptor (or by its `validate` if
+        a subclass overrides it), in the generated `__setattr__`.
 
+        A class that does not define `__init__` gets one taking the fields in declaration
+        order, inherited fields first. It checks all values against one settings snapshot
+        and writes them through the slot members, without going through `__setattr__`.
 
-class MusicalInstrument:
+        The descriptors' `__get__` and `__set__` are never called: reading a field on the
+        class returns the slot member (`types.MemberDescriptorType`), not None, and reading
+        an unset field on an instance raises AttributeError.
+    """
+
+    def __new__(mcs, name: str, bases: tuple, class_dict: dict[str, Any]) -> Any:
+        """
+            Create a new class, replacing descriptor fields with slots.
+
+            :param mcs: The metaclass (SlottedDescriptorMeta).
+            :param name: The name of the class being created.
+            :param bases: The base classes of the class being created.
+            :param class_dict: The class's attribute dictionary.
+            :return: The newly created class.
+        """
+        descriptors = {attr: value for attr, value in class_dict.items() if isinstance(value, BaseDescriptor)}
+        slotted_class_dict = {attr: value for attr, value in class_dict.items() if attr not in descriptors}
+        if descriptors or '__slots__' in class_dict:
+            slots = class_dict.get('__slots__', ())
+            slots = (slots,) if isinstance(slots, str) else tuple(slots)
+            slotted_class_dict['__slots__'] = slots + tuple(descriptors)
+
+        for base in reversed(bases):
+            descriptors = {**getattr(base, '__descriptors__', {}), **descriptors}
+        slotted_class_dict['__descriptors__'] = descriptors
+        checks = {attr: _field_check(descriptor) for attr, descriptor in descriptors.items()}
+
+        def slotted_setattr(self, key: str, value: Any, object_setattr=object.__setattr__) -> None:
+            """
+                A `__setattr__` method checking values of descriptor fields before
+                storing them in their slots.
+                :param self: The instance of the class.
+                :param key: The attribute name being set.
+                :param value: The value being set to the attribute.
+            """
+            check = checks.get(key)
+            if check is not None:
+                setting, error, validate = check
+                if validate is not None:
+                    validate(value)
+                elif value not in REGISTRY.snapshot.allowed[setting]:
+                    raise error
+            object_setattr(self, key, value)
+
+        slotted_class_dict['__setattr__'] = slotted_setattr
+        class_type = super().__new__(mcs, name, bases, slotted_class_dict)
+        for attr, descriptor in descriptors.items():
+            descriptor.__set_name__(class_type, attr)
+        if '__init__' not in class_dict:
+            slot_setters = tuple(getattr(class_type, attr).__set__ for attr in descriptors)
+            class_type.__init__ = _generated_init(checks, slot_setters)
+            class_type.__init__.__qualname__ = f'{class_type.__qualname__}.__init__'
+        return class_type
+
+
+class MusicalInstrument(metaclass=SlottedDescriptorMeta):
     """
         Represents a musical instrument with specific type, material, and sound register.
+        Values are stored in slots, see `SlottedDescriptorMeta`, which also generates
+        `__init__(instrument_type, material, sound_register)`. Class-level access to
+        a field returns its slot member, e.g. `MusicalInstrument.instrument_type.__get__(instrument)`.
     """
     instrument_type = InstrumentType()
     material = Material()
     sound_register = SoundRegister()
 
+    def __str__(self) -> str:
+        """
+            Returns a string representation of the musical instrument.
+            :return: String describing the instrument's type, material, and sound register.
+        """
+        return (f"Instrument: Type - {self.instrument_type}, Material - {self.material}, "
+                f"Sound Register - {self.sound_register}")
+
+
+ENCODED_FIELDS = ('instrument_type', 'material', 'sound_register')
+
+
+class EncodedMusicalInstrument:
+    """
+        A musical instrument stored as a single int `record` packing 1-byte codes of
+        the type, material and sound register. Values are decoded on read, records
+        can be compared or filtered as integers.
+    """
+    __slots__ = ('record',)
+
+    instrument_type = InstrumentType(encoded=True)
+    material = Material(encoded=True)
+    sound_register = SoundRegister(encoded=True)
+
     def __init__(self, instrument_type: str, material: str, sound_register: str) -> None:
         """
             Initializes the musical instrument with the given type, material, and sound register.
@@ -103,9 +305,50 @@ class MusicalInstrument:
             :param material: Material the instrument is made of.
             :param sound_register: Sound register of the instrument.
         """
-        self.instrument_type = instrument_type
-        self.material = material
-        self.sound_register = sound_register
+        self.record = self.pack(instrument_type, material, sound_register)
+
+    @classmethod
+    def pack(cls, instrument_type: str, material: str, sound_register: str) -> int:
+        """
+            Validates values and packs them into a record.
+            :return: The packed record.
+        """
+        record = 0
+        for field, value in zip(ENCODED_FIELDS, (instrument_type, material, sound_register)):
+            descriptor = vars(cls)[field]
+            record |= descriptor.encode(value) << descriptor.shift
+        return intern_record(record)
+
+    @classmethod
+    def unpack(cls, record: int) -> tuple[str, str, str]:
+        """
+            Decodes a packed record.
+            :return: The type, material and sound register.
+        """
+        descriptors = [vars(cls)[field] for field in ENCODED_FIELDS]
+        return tuple(
+            descriptor.code_table().decode((record >> descriptor.shift) & CODE_MASK) for descriptor in descriptors
+        )
+
+    @classmethod
+    def from_record(cls, record: int) -> 'EncodedMusicalInstrument':
+        """
+            Creates an instrument from a packed record without decoding it. The record
+            is shared with instruments holding an equal interned record, but not interned
+            itself, since it may come from untrusted input.
+            :param record: A record created by `pack`.
+        """
+        instrument = cls.__new__(cls)
+        instrument.record = _RECORDS.get(record, record)
+        return instrument
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EncodedMusicalInstrument):
+            return self.record == other.record
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.record)
 
     def __str__(self) -> str:
         """
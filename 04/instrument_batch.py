@@ -0,0 +1,188 @@
+"""
+This module provides bulk construction of `MusicalInstrument` records.
+
+Instead of creating one validated object per row, `InstrumentBatch` validates whole
+columns against the encoders of one settings snapshot: a value is valid if it has a
+code. Valid rows are kept as one `bytearray` of 1-byte codes per field, invalid
+rows are collected with their reasons instead of raising an exception per row.
+Equality filters compare codes, and `MusicalInstrument` objects are only created
+when a row is accessed, without validating its values again.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from functools import reduce
+from itertools import compress, repeat
+from operator import and_, is_not, not_
+
+from descriptor import CODE_BITS, EncodedMusicalInstrument, MusicalInstrument
+from settings_registry import REGISTRY
+
+FIELDS = tuple(MusicalInstrument.__descriptors__)
+
+
+def _trusted_instrument(values: Iterable[str]) -> MusicalInstrument:
+    """
+        Creates a `MusicalInstrument` from already validated values, bypassing the descriptors.
+    """
+    instrument = MusicalInstrument.__new__(MusicalInstrument)
+    for field, value in zip(FIELDS, values):
+        object.__setattr__(instrument, field, value)
+    return instrument
+
+
+def _all(masks: list[list[bool]]) -> list[bool]:
+    """
+        Combines boolean masks element-wise with `and`.
+    """
+    return reduce(lambda left, right: list(map(and_, left, right)), masks)
+
+
+def _rejections(columns: list[Sequence[str]], masks: list[list[bool]]) -> list[tuple[int, str]]:
+    """
+        Describes the first invalid field of every invalid row.
+
+        :return: (input index, reason) pairs ordered by index.
+    """
+    reasons = {}
+    for field, column, mask in reversed(list(zip(FIELDS, columns, masks))):
+        error = MusicalInstrument.__descriptors__[field].error
+        for index in compress(range(len(mask)), map(not_, mask)):
+            reasons[index] = f'{error.__name__}: {field} {column[index]!r} is not allowed'
+    return sorted(reasons.items())
+
+
+class InstrumentBatch:
+    """
+        A columnar container of validated musical instrument rows, stored as codes.
+    """
+
+    def __init__(self, codes: dict[str, bytearray], source_indexes: Sequence[int], rejected: list[tuple[int, str]]):
+        """
+            Wraps encoded columns. Use `from_columns` or `from_rows` instead of calling
+            the constructor directly.
+
+            :param codes: Codes of the valid values by field name, all of the same length.
+            :param source_indexes: Index of every valid row in the input.
+            :param rejected: (input index, reason) pairs of the invalid rows.
+        """
+        self._codes = codes
+        self._tables = {field: MusicalInstrument.__descriptors__[field].code_table() for field in FIELDS}
+        self._source_indexes = source_indexes
+        self._rejected = rejected
+
+    @classmethod
+    def from_columns(cls, instrument_types: Sequence[str], materials: Sequence[str],
+                     sound_registers: Sequence[str]) -> InstrumentBatch:
+        """
+            Validates and encodes columns of instrument values.
+
+            :param instrument_types: Types of the instruments.
+            :param materials: Materials of the instruments.
+            :param sound_registers: Sound registers of the instruments.
+            :return: A batch with the valid rows and the rejected ones.
+            :raises ValueError: if the columns have different lengths.
+        """
+        columns = [instrument_types, materials, sound_registers]
+        length = len(instrument_types)
+        if any(len(column) != length for column in columns):
+            raise ValueError('Columns must have the same length')
+
+        encoders = REGISTRY.snapshot.encoders
+        descriptors = [MusicalInstrument.__descriptors__[field] for field in FIELDS]
+        encoded = [list(map(encoders[descriptor.setting].get, column))
+                   for descriptor, column in zip(descriptors, columns)]
+        masks = [list(map(is_not, codes, repeat(None))) for codes in encoded]
+        valid = _all(masks)
+        if all(valid):
+            return cls(dict(zip(FIELDS, map(bytearray, encoded))), range(length), [])
+
+        return cls(
+            {field: bytearray(compress(codes, valid)) for field, codes in zip(FIELDS, encoded)},
+            list(compress(range(length), valid)),
+            _rejections(columns, masks),
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[str, str, str]]) -> InstrumentBatch:
+        """
+            Validates rows of (instrument type, material, sound register) values.
+
+            :param rows: An iterable of tuples.
+            :return: A batch with the valid rows and the rejected ones.
+            :raises ValueError: if a row does not have exactly one value per field.
+        """
+        columns = list(zip(*rows, strict=True)) or [()] * len(FIELDS)
+        if len(columns) != len(FIELDS):
+            raise ValueError(f'Rows must have {len(FIELDS)} values')
+        return cls.from_columns(*columns)
+
+    @property
+    def rejected(self) -> list[tuple[int, str]]:
+        """Returns (input index, reason) pairs of the invalid rows."""
+        return self._rejected
+
+    @property
+    def source_indexes(self) -> Sequence[int]:
+        """Returns the input index of every valid row."""
+        return self._source_indexes
+
+    def codes(self, field: str) -> bytearray:
+        """
+            Returns the codes of a field, see `CodeTable`.
+
+            :param field: One of `FIELDS`.
+        """
+        return self._codes[field]
+
+    def column(self, field: str) -> list[str]:
+        """
+            Returns the decoded values of a field.
+
+            :param field: One of `FIELDS`.
+        """
+        return list(map(self._tables[field].values.__getitem__, self._codes[field]))
+
+    def select(self, **conditions: str) -> list[int]:
+        """
+            Finds rows by field values, comparing codes instead of strings.
+
+            :param conditions: Required values by field name.
+            :return: Positions of the matching rows.
+        """
+        masks = []
+        for field, value in conditions.items():
+            code = self._tables[field].encode(value)
+            if code is None:
+                return []
+            masks.append(list(map(code.__eq__, self._codes[field])))
+        if not masks:
+            return list(range(len(self)))
+        return list(compress(range(len(self)), _all(masks)))
+
+    def records(self) -> array:
+        """
+            Returns the rows packed into `EncodedMusicalInstrument` records, 4 bytes per row.
+        """
+        shifts = [vars(EncodedMusicalInstrument)[field].shift for field in FIELDS]
+        if shifts != [position * CODE_BITS for position in range(len(FIELDS))]:
+            raise ValueError('Record layout does not match the batch fields')
+        packed = map(bytes, zip(*(self._codes[field] for field in FIELDS)))
+        return array('I', map(int.from_bytes, packed, repeat('little')))
+
+    def __len__(self) -> int:
+        return len(self._source_indexes)
+
+    def __getitem__(self, index: int) -> MusicalInstrument:
+        """
+            Materializes the `MusicalInstrument` of a valid row.
+        """
+        return _trusted_instrument(self._tables[field].values[self._codes[field][index]] for field in FIELDS)
+
+    def __iter__(self) -> Iterator[MusicalInstrument]:
+        """
+            Materializes `MusicalInstrument` objects one by one.
+        """
+        return map(_trusted_instrument, zip(*map(self.column, FIELDS)))
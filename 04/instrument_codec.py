@@ -0,0 +1,220 @@
+"""
+This module provides a compact binary format for collections of `MusicalInstrument`.
+
+A catalog consists of:
+1. A fixed header: magic, format version, settings digest, record count and the size
+   of the code section.
+2. The code section: the codes of the allowed values of every field as JSON, padded
+   to 4 bytes.
+3. Fixed-width records: one little-endian 4-byte `EncodedMusicalInstrument` record
+   per instrument, one 1-byte code per field.
+
+The settings digest identifies the allowed values and their codes. Registry version
+numbers are local to a process, so a digest computed from the settings themselves
+is what two services can compare. When the digest of a catalog matches the local
+settings, the records are used in place through a `memoryview`. A trusted catalog
+is not validated at all, an untrusted one is validated column by column on bytes,
+without creating objects. Catalogs written with different settings are translated
+to the local codes and always validated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+
+from descriptor import CODE_BITS, CODE_MASK, EncodedMusicalInstrument, MusicalInstrument
+from instrument_batch import FIELDS, _trusted_instrument
+from settings_registry import REGISTRY, SettingsSnapshot
+
+MAGIC = b'MINS'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHxx8sII')
+RECORD_SIZE = 4
+
+_DIGESTS: dict[int, tuple[bytes, bytes]] = {}
+
+
+def _code_section(snapshot: SettingsSnapshot) -> tuple[bytes, bytes]:
+    """
+        Returns the digest and the padded code section of a settings snapshot,
+        computed once per snapshot version.
+    """
+    cached = _DIGESTS.get(snapshot.version)
+    if cached is None:
+        codes = {
+            field: dict(sorted(snapshot.encoders[MusicalInstrument.__descriptors__[field].setting].items()))
+            for field in FIELDS
+        }
+        section = json.dumps(codes, separators=(',', ':')).encode()
+        section += b' ' * (-len(section) % RECORD_SIZE)
+        cached = _DIGESTS[snapshot.version] = hashlib.blake2b(section, digest_size=8).digest(), section
+    return cached
+
+
+def _shifts() -> list[int]:
+    """
+        Returns the offsets of the field codes in a record.
+    """
+    return [vars(EncodedMusicalInstrument)[field].shift for field in FIELDS]
+
+
+def encode(instruments: Iterable[MusicalInstrument | EncodedMusicalInstrument]) -> bytes:
+    """
+        Serializes instruments into a catalog.
+        :param instruments: Instruments, or a single-element list for one instrument.
+        :return: The catalog bytes.
+        :raises WrongInstrumentType, WrongMaterial, WrongSoundRegister: if a value is not
+        allowed by the current settings.
+    """
+    snapshot = REGISTRY.snapshot
+    digest, section = _code_section(snapshot)
+    descriptors = [MusicalInstrument.__descriptors__[field] for field in FIELDS]
+    columns = [(field, snapshot.encoders[descriptor.setting], shift, descriptor.error)
+               for field, descriptor, shift in zip(FIELDS, descriptors, _shifts())]
+
+    records = array('I')
+    for instrument in instruments:
+        record = 0
+        for field, encoder, shift, error in columns:
+            code = encoder.get(getattr(instrument, field))
+            if code is None:
+                raise error
+            record |= code << shift
+        records.append(record)
+    if sys.byteorder == 'big':
+        records.byteswap()
+    return HEADER.pack(MAGIC, FORMAT_VERSION, digest, len(records), len(section)) + section + records.tobytes()
+
+
+class InstrumentCatalog:
+    """
+        Instruments decoded from a catalog, as packed records in the local codes.
+        Instruments are created only when accessed.
+    """
+
+    def __init__(self, records: memoryview | array) -> None:
+        """
+            Wraps validated records. Use `decode` instead of calling the constructor directly.
+            :param records: `EncodedMusicalInstrument` records.
+        """
+        self._records = records
+
+    @property
+    def records(self) -> memoryview | array:
+        """Returns the packed records, a view of the decoded bytes when possible."""
+        return self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index: int) -> MusicalInstrument:
+        """
+            Materializes an instrument without validating it again.
+        """
+        return _trusted_instrument(EncodedMusicalInstrument.unpack(self._records[index]))
+
+    def __iter__(self) -> Iterator[MusicalInstrument]:
+        """
+            Materializes instruments one by one, decoding every distinct record once.
+        """
+        unpacked = {}
+        for record in self._records:
+            values = unpacked.get(record)
+            if values is None:
+                values = unpacked[record] = EncodedMusicalInstrument.unpack(record)
+            yield _trusted_instrument(values)
+
+
+def _parse(data: bytes | bytearray | memoryview) -> tuple[bytes, dict, memoryview]:
+    """
+        Splits a catalog into the digest, the code section and the record bytes.
+        :raises ValueError: if the data is not a catalog of a supported version.
+    """
+    view = memoryview(data).cast('B')
+    if len(view) < HEADER.size:
+        raise ValueError('Catalog is truncated')
+    magic, version, digest, count, section_size = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError('Not an instrument catalog')
+    if version != FORMAT_VERSION:
+        raise ValueError(f'Unsupported catalog format version {version}')
+    start = HEADER.size + section_size
+    if len(view) != start + count * RECORD_SIZE or section_size % RECORD_SIZE:
+        raise ValueError('Catalog is truncated or has a wrong size')
+    section = view[HEADER.size:start]
+    if hashlib.blake2b(section, digest_size=8).digest() != digest:
+        raise ValueError('Catalog codes do not match the settings digest')
+    codes = json.loads(bytes(section))
+    if not isinstance(codes, dict) or set(codes) != set(FIELDS) or not all(
+            isinstance(codes[field], dict) and all(isinstance(code, int) and 0 <= code <= CODE_MASK
+                                                   for code in codes[field].values()) for field in FIELDS):
+        raise ValueError('Catalog has a malformed code section')
+    return digest, codes, view[start:]
+
+
+def _validate(records: memoryview, allowed_codes: list[bytes]) -> None:
+    """
+        Checks that every byte of the records is an allowed code of its field.
+        :raises WrongInstrumentType, WrongMaterial, WrongSoundRegister: for a wrong code.
+        :raises ValueError: if the unused byte of a record is not zero.
+    """
+    for index, (field, codes) in enumerate(zip(FIELDS, allowed_codes)):
+        if bytes(records[index::RECORD_SIZE]).translate(None, codes):
+            raise MusicalInstrument.__descriptors__[field].error
+    if bytes(records[len(FIELDS)::RECORD_SIZE]).translate(None, b'\0'):
+        raise ValueError('Catalog records have unknown fields')
+
+
+def _translate(records: memoryview, codes: dict[str, dict[str, int]], encoders: list[dict[str, int]]) -> memoryview:
+    """
+        Validates records written with other codes and converts them to the local codes.
+        :param records: The record bytes.
+        :param codes: Codes of the catalog by field.
+        :param encoders: Local codes of the allowed values by field.
+        :return: The converted record bytes.
+    """
+    _validate(records, [bytes(code for value, code in codes[field].items() if value in encoder)
+                        for field, encoder in zip(FIELDS, encoders)])
+    translated = bytearray(len(records))
+    for index, (field, encoder) in enumerate(zip(FIELDS, encoders)):
+        local_codes = bytearray(CODE_MASK + 1)
+        for value, code in codes[field].items():
+            local_codes[code] = encoder.get(value, 0)
+        translated[index::RECORD_SIZE] = bytes(records[index::RECORD_SIZE]).translate(local_codes)
+    return memoryview(translated)
+
+
+def decode(data: bytes | bytearray | memoryview, trusted: bool = False) -> InstrumentCatalog:
+    """
+        Deserializes a catalog.
+        :param data: Catalog bytes created by `encode`.
+        :param trusted: Skip the validation of the records if the catalog was written with
+        the same settings.
+        :return: The instruments.
+        :raises ValueError: if the data is not a valid catalog.
+        :raises WrongInstrumentType, WrongMaterial, WrongSoundRegister: if a value is not
+        allowed by the current settings.
+    """
+    if _shifts() != [position * CODE_BITS for position in range(len(FIELDS))]:
+        raise ValueError('Record layout does not match the catalog fields')
+    digest, codes, records = _parse(data)
+    snapshot = REGISTRY.snapshot
+    encoders = [snapshot.encoders[MusicalInstrument.__descriptors__[field].setting] for field in FIELDS]
+
+    if digest == _code_section(snapshot)[0]:
+        if not trusted:
+            _validate(records, [bytes(encoder.values()) for encoder in encoders])
+        local = records
+    else:
+        local = _translate(records, codes, encoders)
+
+    if sys.byteorder == 'big':
+        swapped = array('I', local.tobytes())
+        swapped.byteswap()
+        return InstrumentCatalog(swapped)
+    return InstrumentCatalog(local.cast('I'))
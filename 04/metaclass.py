@@ -1,17 +1,28 @@
 """
 This module defines a custom metaclass `CustomMeta` which modifies class attribute names
 by adding a 'custom_' prefix, unless the attribute is a magic method or already has the prefix.
+
+Translated names are cached per class in `__custom_names__`, so repeated assignments of
+the same attribute cost one dict lookup instead of the prefix checks and string formatting.
 """
 
+import sys
 from typing import Any
 
+NAME_CACHE_SIZE = 1024
+
 
 class CustomMeta(type):
     """
         A metaclass that prefixes all non-magic attributes of a class with 'custom_'.
         Also modifies the `__setattr__` method to ensure attributes are set with the same prefix.
+
+        With the `slots=True` class keyword, the annotated fields of the class are stored
+        in prefixed `__slots__` instead of the instance `__dict__`; a declared `__slots__`
+        is prefixed as well. Slotted fields cannot have class-level default values,
+        they have to be set in `__init__`.
     """
-    def __new__(mcs, name: str, bases: tuple, class_dict: dict[str, Any]) -> Any:
+    def __new__(mcs, name: str, bases: tuple, class_dict: dict[str, Any], slots: bool = False) -> Any:
         """
             Create a new class by prefixing non-magic attributes with 'custom_'.
             Overrides the `__setattr__` method to ensure attributes are set with the 'custom_' prefix.
@@ -20,9 +31,30 @@ class CustomMeta(type):
             :param name: The name of the class being created.
             :param bases: The base classes of the class being created.
             :param class_dict: The class's attribute dictionary.
+            :param slots: Generate `__slots__` from the annotated fields.
             :return: The newly created class.
+            :raises TypeError: if a slotted field has a default value.
         """
         custom_class_dict = mcs.add_custom_prefix_to_attributes(class_dict)
+        if slots and '__slots__' not in class_dict:
+            custom_class_dict['__slots__'] = tuple(class_dict.get('__annotations__', {}))
+        if '__slots__' in custom_class_dict:
+            declared = custom_class_dict['__slots__']
+            declared = (declared,) if isinstance(declared, str) else declared
+            custom_class_dict['__slots__'] = tuple(mcs.translate_name(slot) for slot in declared)
+            with_defaults = [slot for slot in custom_class_dict['__slots__'] if slot in custom_class_dict]
+            if with_defaults:
+                raise TypeError(
+                    f'Slotted fields of {name} cannot have default values: {", ".join(with_defaults)}; '
+                    'set them in __init__'
+                )
+
+        names = {}
+        for base in reversed(bases):
+            names.update(getattr(base, '__custom_names__', {}))
+        for attr_name in (*class_dict, *custom_class_dict.get('__slots__', ())):
+            names[attr_name] = names[mcs.translate_name(attr_name)] = mcs.translate_name(attr_name)
+        custom_class_dict['__custom_names__'] = names
 
         def custom_setattr(self, key: str, value: Any) -> None:
             """
@@ -32,13 +64,20 @@ class CustomMeta(type):
                 :param key: The attribute name being set.
                 :param value: The value being set to the attribute.
             """
-            if not mcs.is_magic_attr(key) and not key.startswith('custom_'):
-                key = f'custom_{key}'
-            super(type(self), self).__setattr__(key, value)
+            try:
+                key = names[key]
+            except KeyError:
+                translated = mcs.translate_name(key)
+                if len(names) < NAME_CACHE_SIZE:
+                    names[key] = translated
+                key = translated
+            next_setattr(self, key, value)
 
         custom_class_dict['__setattr__'] = custom_setattr
 
-        return super().__new__(mcs, name, bases, custom_class_dict)
+        class_type = super().__new__(mcs, name, bases, custom_class_dict)
+        next_setattr = super(class_type, class_type).__setattr__
+        return class_type
 
     @staticmethod
     def is_magic_attr(attr_name: str) -> bool:
@@ -50,6 +89,18 @@ class CustomMeta(type):
         """
         return attr_name.startswith('__') and attr_name.endswith('__')
 
+    @staticmethod
+    def translate_name(attr_name: str) -> str:
+        """
+            Returns the interned name an attribute is stored under.
+
+            :param attr_name: The name of the attribute.
+            :return: The name itself for magic and already prefixed names, otherwise the prefixed name.
+        """
+        if CustomMeta.is_magic_attr(attr_name) or attr_name.startswith('custom_'):
+            return sys.intern(attr_name)
+        return sys.intern(f'custom_{attr_name}')
+
     @staticmethod
     def add_custom_prefix_to_attributes(class_dict: dict[str, Any]) -> dict[str, Any]:
         """
@@ -0,0 +1,232 @@
+"""
+This module provides a registry of the validation settings that can be reloaded
+while the process is running.
+
+The allowed sets are loaded from `settings` and, on reload, from a JSON file with
+the same names:
+
+    {"INSTRUMENT_ALLOWED_TYPES": [...], "ALLOWED_MATERIALS": [...], "SOUND_ALLOWED_REGISTERS": [...]}
+
+Every load compiles the sets into frozensets and codes into a new immutable
+`SettingsSnapshot` with the next version number, which replaces the previous one
+in a single attribute assignment. Readers take `registry.snapshot` without any lock
+and always see a consistent set of values; only reloads are serialized.
+
+Code tables are append-only: values added by a reload get new codes, removed values
+keep theirs (they are only absent from the encoders of newer snapshots), so data
+encoded with an older snapshot stays decodable.
+
+A reload is triggered by a signal (`install_signal_handler`, SIGHUP by default) or by
+polling the modification time of the file (`start_polling`).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import threading
+from collections.abc import Iterable, Mapping
+from typing import NamedTuple
+
+import settings
+
+SETTING_NAMES = ('INSTRUMENT_ALLOWED_TYPES', 'ALLOWED_MATERIALS', 'SOUND_ALLOWED_REGISTERS')
+CODE_BITS = 8
+CODE_MASK = (1 << CODE_BITS) - 1
+
+
+class CodeTable:
+    """
+        An append-only table of 1-byte codes for a small closed set of values.
+    """
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        """
+            Assigns codes to the values in sorted order.
+            :param values: The initial values.
+            :raises ValueError: if there are more values than 1-byte codes.
+        """
+        self.values: tuple[str, ...] = ()
+        self.codes: dict[str, int] = {}
+        self.extend(values)
+
+    def extend(self, values: Iterable[str]) -> None:
+        """
+            Assigns the next codes to new values in sorted order, existing codes never change.
+            :param values: Values to add, known values are skipped.
+            :raises ValueError: if there are more values than 1-byte codes.
+        """
+        new_values = sorted(set(values) - self.codes.keys())
+        if len(self.values) + len(new_values) > CODE_MASK + 1:
+            raise ValueError(f'Cannot encode {len(self.values) + len(new_values)} values in {CODE_BITS} bits')
+        for value in new_values:
+            self.codes[value] = len(self.values)
+            self.values += (value,)
+
+    def encode(self, value: str) -> int | None:
+        """
+            Returns the code of a value, or None if the value is not in the table.
+        """
+        return self.codes.get(value)
+
+    def decode(self, code: int) -> str:
+        """
+            Returns the value of a code.
+        """
+        return self.values[code]
+
+
+def _compile_setting(name: str, values: object) -> frozenset[str]:
+    """
+        Checks that a setting is a collection of strings and freezes it.
+        :param name: The name of the setting.
+        :param values: The allowed values, e.g. a list read from JSON.
+        :raises TypeError: if the setting is not a list, tuple or set of strings.
+    """
+    if not isinstance(values, (list, tuple, set, frozenset)):
+        raise TypeError(f'{name} must be a list of strings, not {type(values).__name__}')
+    for value in values:
+        if not isinstance(value, str):
+            raise TypeError(f'{name} must contain only strings, not {type(value).__name__}')
+    return frozenset(values)
+
+
+class SettingsSnapshot(NamedTuple):
+    """
+        An immutable version of the settings.
+    """
+    version: int
+    allowed: dict[str, frozenset[str]]
+    encoders: dict[str, dict[str, int]]
+
+
+class SettingsRegistry:
+    """
+        Holds the current `SettingsSnapshot` and replaces it atomically on reload.
+    """
+
+    def __init__(self, values: Mapping[str, Iterable[str]]) -> None:
+        """
+            Initializes the registry with version 1 of the settings.
+            :param values: Allowed values by setting name, see `SETTING_NAMES`.
+        """
+        self._lock = threading.Lock()
+        self._tables = {name: CodeTable() for name in SETTING_NAMES}
+        self._path: str | None = None
+        self._mtime: int | None = None
+        self._polling: tuple[threading.Thread, threading.Event] | None = None
+        self.last_error: Exception | None = None
+        self.snapshot = SettingsSnapshot(0, {}, {})
+        self.update(values)
+
+    def code_table(self, name: str) -> CodeTable:
+        """
+            Returns the append-only code table of a setting.
+        """
+        return self._tables[name]
+
+    def update(self, values: Mapping[str, Iterable[str]]) -> SettingsSnapshot:
+        """
+            Compiles new settings and swaps them in.
+            :param values: Allowed values by setting name, see `SETTING_NAMES`.
+            :return: The new snapshot.
+            :raises ValueError: if a setting is missing or has too many values.
+            :raises TypeError: if a setting is not a collection of strings.
+            The current snapshot and the code tables are kept if an error is raised.
+        """
+        missing = [name for name in SETTING_NAMES if name not in values]
+        if missing:
+            raise ValueError(f'Missing settings: {", ".join(missing)}')
+        allowed = {name: _compile_setting(name, values[name]) for name in SETTING_NAMES}
+
+        with self._lock:
+            for name in SETTING_NAMES:
+                if len(self._tables[name].codes.keys() | allowed[name]) > CODE_MASK + 1:
+                    raise ValueError(f'Too many values of {name} for {CODE_BITS}-bit codes')
+            for name in SETTING_NAMES:
+                self._tables[name].extend(allowed[name])
+            encoders = {
+                name: {value: self._tables[name].codes[value] for value in allowed[name]} for name in SETTING_NAMES
+            }
+            self.snapshot = SettingsSnapshot(self.snapshot.version + 1, allowed, encoders)
+            return self.snapshot
+
+    def load(self, path: str) -> SettingsSnapshot:
+        """
+            Loads settings from a JSON file and remembers it for `reload`.
+            :param path: Path to the file.
+            :return: The new snapshot.
+            :raises OSError: if the file cannot be read.
+            :raises ValueError: if the file is not valid JSON or misses a setting.
+            :raises TypeError: if a setting is not a list of strings.
+        """
+        mtime = os.stat(path).st_mtime_ns
+        with open(path, encoding='utf-8') as file:
+            values = json.load(file)
+        if not isinstance(values, dict):
+            raise ValueError(f'{path} must contain a JSON object')
+        snapshot = self.update(values)
+        self._path, self._mtime = path, mtime
+        return snapshot
+
+    def reload(self, only_if_modified: bool = False) -> bool:
+        """
+            Reloads the file passed to `load`. Errors are stored in `last_error` instead of
+            being raised, so a broken file never replaces valid settings.
+            :param only_if_modified: Skip the reload if the modification time did not change.
+            :return: True if a new snapshot was swapped in.
+        """
+        if self._path is None:
+            return False
+        try:
+            if only_if_modified and os.stat(self._path).st_mtime_ns == self._mtime:
+                return False
+            self.load(self._path)
+        except (OSError, ValueError, TypeError) as error:
+            self.last_error = error
+            return False
+        self.last_error = None
+        return True
+
+    def start_polling(self, path: str, interval: float = 1.0) -> None:
+        """
+            Loads a file and reloads it in a background thread whenever its modification time changes.
+            :param path: Path to the file.
+            :param interval: Seconds between the checks.
+        """
+        self.load(path)
+        self.stop_polling()
+        stopped = threading.Event()
+
+        def poll() -> None:
+            while not stopped.wait(interval):
+                self.reload(only_if_modified=True)
+
+        thread = threading.Thread(target=poll, name='settings-poller', daemon=True)
+        self._polling = thread, stopped
+        thread.start()
+
+    def stop_polling(self) -> None:
+        """
+            Stops the polling thread started by `start_polling`.
+        """
+        if self._polling is not None:
+            thread, stopped = self._polling
+            stopped.set()
+            thread.join()
+            self._polling = None
+
+    def install_signal_handler(self, path: str, signum: int = signal.SIGHUP) -> None:
+        """
+            Loads a file and reloads it when the process receives a signal. Must be called
+            from the main thread. The reload runs in a separate thread, so the handler never
+            waits for the lock held by an interrupted reload.
+            :param path: Path to the file.
+            :param signum: The signal number.
+        """
+        self.load(path)
+        signal.signal(signum, lambda *_: threading.Thread(target=self.reload).start())
+
+
+REGISTRY = SettingsRegistry({name: getattr(settings, name) for name in SETTING_NAMES})
@@ -0,0 +1,30 @@
+"""
+Unit tests for the attribute-access benchmark suite.
+"""
+
+from benchmark_attributes import CLASSES, FIELDS, NEW_VALUES, benchmark_attribute_write, run_benchmarks
+
+
+def test_every_class_is_measured():
+    """
+    Test that every class gets statistics for every measurement and slotted classes use less memory.
+    """
+    results = run_benchmarks(CLASSES, n=50, repetitions=2)
+    assert set(results) == set(CLASSES)
+    for result in results.values():
+        for measurement in ('creation', 'read', 'write'):
+            assert result[measurement]['min'] <= result[measurement]['mean']
+            assert result[measurement]['stdev'] >= 0
+    assert results['SlotsInstrument']['bytes_per_instance'] < results['PlainInstrument']['bytes_per_instance']
+    assert results['MusicalInstrument']['bytes_per_instance'] < results['DescriptorInstrument']['bytes_per_instance']
+
+
+def test_classes_store_the_same_values():
+    """
+    Test that the benchmarked classes read back the values written to them.
+    """
+    for cls, fields in CLASSES.values():
+        instance = cls('string', 'wood', 'medium')
+        benchmark_attribute_write([instance])
+        assert tuple(getattr(instance, field) for field in fields) == NEW_VALUES
+    assert len(FIELDS) == len(NEW_VALUES)
@@ -3,8 +3,14 @@ Unit tests for the `MusicalInstrument` class and its associated exception handli
 These tests cover the validation of instrument attributes and how they are managed using descriptors.
 """
 
+import inspect
+import pickle
+import sys
+import types
+
 import pytest
-from descriptor import MusicalInstrument
+import descriptor
+from descriptor import CodeTable, EncodedMusicalInstrument, InstrumentType, Material, MusicalInstrument, SoundRegister
 from exceptions import WrongInstrumentType, WrongMaterial, WrongSoundRegister
 
 
@@ -93,3 +99,156 @@ def test_independent_objects_all_attributes():
     assert instrument2.instrument_type == 'wind'
     assert instrument2.material == 'metal'
     assert instrument2.sound_register == 'high'
+
+
+class DictInstrument:
+    """
+    The same fields as `MusicalInstrument`, stored by the descriptors in the instance `__dict__`.
+    """
+    instrument_type = InstrumentType()
+    material = Material()
+    sound_register = SoundRegister()
+
+    def __init__(self, instrument_type: str, material: str, sound_register: str) -> None:
+        self.instrument_type = instrument_type
+        self.material = material
+        self.sound_register = sound_register
+
+
+def test_values_are_stored_in_slots():
+    """
+    Test that `MusicalInstrument` has no instance `__dict__` and takes less memory
+    than the same class storing values in `__dict__`.
+    """
+    instrument = MusicalInstrument('string', 'wood', 'medium')
+    assert not hasattr(instrument, '__dict__')
+    assert MusicalInstrument.__slots__ == ('instrument_type', 'material', 'sound_register')
+    assert set(MusicalInstrument.__descriptors__) == set(MusicalInstrument.__slots__)
+    with pytest.raises(AttributeError):
+        instrument.color = 'red'
+
+    dict_instrument = DictInstrument('string', 'wood', 'medium')
+    assert dict_instrument.material == 'wood'
+    assert sys.getsizeof(instrument) < sys.getsizeof(dict_instrument) + sys.getsizeof(dict_instrument.__dict__)
+
+
+def test_slotted_subclass_and_pickle():
+    """
+    Test that subclasses keep the validation and that instances survive pickling.
+    """
+    class Violin(MusicalInstrument):
+        """
+        A subclass adding a regular attribute.
+        """
+        def __init__(self, material: str) -> None:
+            super().__init__('string', material, 'high')
+            self.maker = 'Stradivari'
+
+    violin = Violin('wood')
+    assert violin.maker == 'Stradivari'
+    with pytest.raises(WrongMaterial):
+        violin.material = 'glass'
+
+    instrument = pickle.loads(pickle.dumps(MusicalInstrument('wind', 'metal', 'low')))
+    assert str(instrument) == "Instrument: Type - wind, Material - metal, Sound Register - low"
+
+
+def test_generated_init():
+    """
+    Test the `__init__` generated for slotted classes: field order, keywords, inherited
+    fields and descriptors overriding `validate`.
+    """
+    assert str(inspect.signature(MusicalInstrument)) == '(instrument_type, material, sound_register)'
+    instrument = MusicalInstrument(sound_register='low', material='metal', instrument_type='wind')
+    assert (instrument.instrument_type, instrument.material, instrument.sound_register) == ('wind', 'metal', 'low')
+    with pytest.raises(TypeError):
+        MusicalInstrument('string', 'wood')
+    with pytest.raises(WrongSoundRegister):
+        MusicalInstrument('string', 'wood', 'ultra-high')
+
+    class StrictMaterial(Material):
+        """
+        A material descriptor rejecting plastic.
+        """
+        def validate(self, value: str | int) -> None:
+            super().validate(value)
+            if value == 'plastic':
+                raise WrongMaterial
+
+    class Drum(MusicalInstrument):
+        """
+        A subclass adding a field.
+        """
+        skin = StrictMaterial()
+
+    drum = Drum('percussion', 'wood', 'low', 'metal')
+    assert drum.skin == 'metal'
+    with pytest.raises(WrongMaterial):
+        Drum('percussion', 'wood', 'low', 'plastic')
+    with pytest.raises(WrongMaterial):
+        drum.skin = 'plastic'
+
+
+def test_encoded_instrument():
+    """
+    Test that the encoded mode stores one packed record, decodes values on read and validates on set.
+    """
+    instrument = EncodedMusicalInstrument('string', 'wood', 'medium')
+    assert not hasattr(instrument, '__dict__')
+    assert str(instrument) == "Instrument: Type - string, Material - wood, Sound Register - medium"
+    assert instrument.record == EncodedMusicalInstrument.pack('string', 'wood', 'medium')
+    assert EncodedMusicalInstrument.unpack(instrument.record) == ('string', 'wood', 'medium')
+
+    instrument.material = 'metal'
+    assert instrument.material == 'metal'
+    assert instrument.instrument_type == 'string'
+    assert instrument == EncodedMusicalInstrument('string', 'metal', 'medium')
+    assert instrument != EncodedMusicalInstrument('wind', 'metal', 'medium')
+    with pytest.raises(WrongMaterial):
+        instrument.material = 'glass'
+    with pytest.raises(WrongSoundRegister):
+        EncodedMusicalInstrument('string', 'wood', 'ultra-high')
+    assert instrument.material == 'metal'
+
+    other = EncodedMusicalInstrument.from_record(EncodedMusicalInstrument.pack('string', 'metal', 'medium'))
+    assert other.record is instrument.record
+    assert sys.getsizeof(instrument) < sys.getsizeof(MusicalInstrument('string', 'wood', 'medium'))
+
+
+def test_class_level_access_returns_slot_members():
+    """
+    Test that fields of `MusicalInstrument` read on the class are slot members
+    reading the instance value, and the descriptors are kept in `__descriptors__`.
+    """
+    instrument = MusicalInstrument('string', 'wood', 'medium')
+    assert isinstance(MusicalInstrument.instrument_type, types.MemberDescriptorType)
+    assert MusicalInstrument.instrument_type.__get__(instrument) == 'string'  # pylint: disable=unnecessary-dunder-call
+    assert isinstance(MusicalInstrument.__descriptors__['instrument_type'], InstrumentType)
+    assert not hasattr(instrument, '__dict__')
+    assert EncodedMusicalInstrument.instrument_type is None
+
+
+def test_interned_records_are_bounded(monkeypatch):
+    """
+    Test that records from untrusted input are not interned and interning stops at the cap.
+    """
+    monkeypatch.setattr(descriptor, '_RECORDS', {})
+    monkeypatch.setattr(descriptor, 'MAX_INTERNED_RECORDS', 1)
+    record = EncodedMusicalInstrument.pack('string', 'wood', 'medium')
+    assert EncodedMusicalInstrument.from_record(record + 0).record is record
+    EncodedMusicalInstrument.from_record(0xFFFFFF)
+    assert descriptor.intern_record(0xFFFFFE) == 0xFFFFFE
+    assert descriptor._RECORDS == {record: record}  # pylint: disable=protected-access
+
+
+def test_code_table():
+    """
+    Test that codes are assigned in sorted order and limited to one byte.
+    """
+    table = CodeTable({'wood', 'metal', 'plastic'})
+    assert table.values == ('metal', 'plastic', 'wood')
+    assert table.encode('plastic') == 1
+    assert table.encode('glass') is None
+    assert table.decode(2) == 'wood'
+    with pytest.raises(ValueError):
+        CodeTable(str(value) for value in range(257))
@@ -0,0 +1,91 @@
+"""
+Unit tests for the columnar bulk construction of `MusicalInstrument` records.
+"""
+
+import pytest
+from exceptions import WrongMaterial
+from descriptor import EncodedMusicalInstrument
+from instrument_batch import InstrumentBatch
+
+
+def test_all_rows_valid():
+    """
+    Test that valid columns are kept as they are and materialize equal instruments.
+    """
+    batch = InstrumentBatch.from_columns(['string', 'wind'], ['wood', 'metal'], ['medium', 'high'])
+    assert len(batch) == 2
+    assert not batch.rejected
+    assert list(batch.source_indexes) == [0, 1]
+    assert batch.column('material') == ['wood', 'metal']
+    assert str(batch[1]) == "Instrument: Type - wind, Material - metal, Sound Register - high"
+    assert [instrument.instrument_type for instrument in batch] == ['string', 'wind']
+
+
+def test_invalid_rows_are_rejected_with_reasons():
+    """
+    Test that invalid rows are collected with the first invalid field instead of raising.
+    """
+    batch = InstrumentBatch.from_rows([
+        ('string', 'wood', 'medium'),
+        ('electronic', 'glass', 'medium'),
+        ('wind', 'glass', 'high'),
+        ('keyboard', 'plastic', 'ultra-high'),
+        ('percussion', 'metal', 'low'),
+    ])
+    assert len(batch) == 2
+    assert batch.source_indexes == [0, 4]
+    assert [index for index, _ in batch.rejected] == [1, 2, 3]
+    assert batch.rejected[0][1].startswith('WrongInstrumentType')
+    assert batch.rejected[1][1] == "WrongMaterial: material 'glass' is not allowed"
+    assert batch.rejected[2][1].startswith('WrongSoundRegister')
+    assert [str(instrument) for instrument in batch][1] == (
+        "Instrument: Type - percussion, Material - metal, Sound Register - low"
+    )
+
+
+def test_materialized_instruments_validate_changes():
+    """
+    Test that lazily created instruments still validate assignments.
+    """
+    instrument = InstrumentBatch.from_rows([('string', 'wood', 'medium')])[0]
+    instrument.material = 'metal'
+    assert instrument.material == 'metal'
+    with pytest.raises(WrongMaterial):
+        instrument.material = 'glass'
+
+
+def test_wrong_shapes():
+    """
+    Test empty input and that columns or rows of wrong shapes are rejected.
+    """
+    assert len(InstrumentBatch.from_rows([])) == 0
+    with pytest.raises(ValueError):
+        InstrumentBatch.from_columns(['string'], ['wood', 'metal'], ['medium'])
+    with pytest.raises(ValueError):
+        InstrumentBatch.from_rows([('string', 'wood', 'medium'), ('string', 'wood')])
+    with pytest.raises(ValueError):
+        InstrumentBatch.from_rows([('string', 'wood')])
+
+
+def test_encoded_columns_and_filters():
+    """
+    Test that columns are stored as 1-byte codes, filtered by codes and packed into records.
+    """
+    batch = InstrumentBatch.from_rows([
+        ('string', 'wood', 'high'),
+        ('wind', 'metal', 'low'),
+        ('string', 'metal', 'high'),
+    ])
+    assert isinstance(batch.codes('material'), bytearray)
+    assert len(batch.codes('material')) == 3
+    assert batch.select(instrument_type='string') == [0, 2]
+    assert batch.select(instrument_type='string', material='metal') == [2]
+    assert not batch.select(material='glass')
+    assert batch.select() == [0, 1, 2]
+
+    records = batch.records()
+    assert records.itemsize == 4
+    assert [EncodedMusicalInstrument.unpack(record) for record in records] == [
+        ('string', 'wood', 'high'), ('wind', 'metal', 'low'), ('string', 'metal', 'high'),
+    ]
+    assert str(EncodedMusicalInstrument.from_record(records[1])) == str(batch[1])
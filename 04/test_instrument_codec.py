@@ -0,0 +1,107 @@
+"""
+Unit tests for the binary catalog format of `MusicalInstrument` collections.
+"""
+
+import hashlib
+import json
+
+import pytest
+from descriptor import EncodedMusicalInstrument, MusicalInstrument
+from exceptions import WrongMaterial
+from instrument_codec import FORMAT_VERSION, HEADER, MAGIC, decode, encode
+from settings_registry import REGISTRY
+
+INSTRUMENTS = [
+    MusicalInstrument('string', 'wood', 'medium'),
+    MusicalInstrument('wind', 'metal', 'high'),
+    MusicalInstrument('percussion', 'plastic', 'low'),
+]
+
+
+def catalog(codes: dict, records: list[tuple[int, int, int]]) -> bytes:
+    """
+    Builds a catalog written with other codes, as a service with other settings would.
+    """
+    section = json.dumps(codes).encode()
+    section += b' ' * (-len(section) % 4)
+    digest = hashlib.blake2b(section, digest_size=8).digest()
+    return (HEADER.pack(MAGIC, FORMAT_VERSION, digest, len(records), len(section)) + section
+            + b''.join(bytes(record) + b'\0' for record in records))
+
+
+@pytest.fixture(name='global_settings')
+def fixture_global_settings():
+    """
+    Restores the settings of the global registry after a test.
+    """
+    allowed = REGISTRY.snapshot.allowed
+    yield REGISTRY
+    REGISTRY.update(allowed)
+
+
+def test_round_trip():
+    """
+    Test that instruments survive a round trip and records are read in place.
+    """
+    data = encode(INSTRUMENTS + [EncodedMusicalInstrument('keyboard', 'wood', 'high')])
+    decoded = decode(data)
+    assert len(decoded) == 4
+    assert [str(instrument) for instrument in decoded][:3] == [str(instrument) for instrument in INSTRUMENTS]
+    assert decoded[3].instrument_type == 'keyboard'
+    assert decoded.records.obj is data
+    assert list(decoded.records)[:3] == [EncodedMusicalInstrument(instrument.instrument_type, instrument.material,
+                                                                  instrument.sound_register).record
+                                         for instrument in INSTRUMENTS]
+
+    assert len(decode(encode([]))) == 0
+    assert str(decode(encode(INSTRUMENTS[:1]))[0]) == str(INSTRUMENTS[0])
+
+
+def test_untrusted_records_are_validated():
+    """
+    Test that corrupted codes are rejected unless the source is trusted.
+    """
+    data = bytearray(encode(INSTRUMENTS))
+    data[-3] = 200
+    with pytest.raises(WrongMaterial):
+        decode(data)
+    assert len(decode(data, trusted=True)) == 3
+
+    data[-3], data[-1] = data[-7], 1
+    with pytest.raises(ValueError):
+        decode(data)
+
+
+def test_malformed_catalogs():
+    """
+    Test that wrong magic, version, size and codes are reported as ValueError.
+    """
+    data = encode(INSTRUMENTS)
+    for broken in (b'JSON' + data[4:], data[:4] + b'\x09' + data[5:], data[:-1], data[:10],
+                   data[:HEADER.size] + data[HEADER.size:].replace(b'wood', b'wool')):
+        with pytest.raises(ValueError):
+            decode(broken)
+
+
+def test_catalog_from_other_settings(global_settings):
+    """
+    Test that catalogs written with other codes are translated and validated
+    even if the source is trusted.
+    """
+    codes = {
+        'instrument_type': {'string': 7, 'wind': 1},
+        'material': {'wood': 3, 'glass': 0},
+        'sound_register': {'low': 2},
+    }
+    decoded = decode(catalog(codes, [(7, 3, 2), (1, 3, 2)]), trusted=True)
+    assert [str(instrument) for instrument in decoded] == [
+        "Instrument: Type - string, Material - wood, Sound Register - low",
+        "Instrument: Type - wind, Material - wood, Sound Register - low",
+    ]
+    with pytest.raises(WrongMaterial):
+        decode(catalog(codes, [(7, 0, 2)]), trusted=True)
+
+    global_settings.update({**global_settings.snapshot.allowed, 'ALLOWED_MATERIALS': {'glass', 'wood'}})
+    assert decode(catalog(codes, [(7, 0, 2)]))[0].material == 'glass'
+    with pytest.raises(WrongMaterial):
+        encode(INSTRUMENTS[1:2])
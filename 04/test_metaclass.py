@@ -124,3 +124,81 @@ def test_with_initial_value():
         _ = inst.val
     with pytest.raises(AttributeError):
         _ = inst.x
+
+
+class CustomSubclass(CustomClass):
+    """
+    A subclass of a `CustomMeta` class.
+    """
+    y = 1
+
+
+class SlottedPoint(metaclass=CustomMeta, slots=True):
+    """
+    A `CustomMeta` class storing its annotated fields in slots.
+    """
+    x: int
+    y: int
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def test_subclass_attributes():
+    """
+    Test that instances of subclasses are prefixed without recursing through the base `__setattr__`.
+    """
+    inst = CustomSubclass(5)
+    inst.z = 3
+    assert inst.custom_val == 5
+    assert inst.custom_z == 3
+    assert inst.custom_y == 1
+    assert inst.custom_x == 50
+
+
+def test_translated_names_are_cached():
+    """
+    Test that names are translated once per class and shared with subclasses.
+    """
+    inst = CustomClass()
+    inst.cached_name = 1
+    inst.cached_name = 2
+    assert CustomClass.__custom_names__['cached_name'] == 'custom_cached_name'
+    assert CustomClass.__custom_names__['custom_val'] == 'custom_val'
+    assert CustomSubclass.__custom_names__['line'] == 'custom_line'
+    assert inst.custom_cached_name == 2
+
+
+def test_slots():
+    """
+    Test that `slots=True` stores the prefixed annotated fields in slots.
+    """
+    point = SlottedPoint(1, 2)
+    assert SlottedPoint.__slots__ == ('custom_x', 'custom_y')
+    assert not hasattr(point, '__dict__')
+    point.x = 3
+    assert (point.custom_x, point.custom_y) == (3, 2)
+    with pytest.raises(AttributeError):
+        point.z = 4
+
+
+def test_slotted_field_with_default_is_rejected():
+    """
+    Test that a default value of a slotted field raises a clear TypeError instead of
+    the ValueError of conflicting slots.
+    """
+    with pytest.raises(TypeError, match='custom_x'):
+        class DefaultPoint(metaclass=CustomMeta, slots=True):  # pylint: disable=unused-variable
+            """
+            A slotted class with a default value.
+            """
+            x: int = 5
+
+    with pytest.raises(TypeError, match='custom_y'):
+        class DeclaredSlots(metaclass=CustomMeta):  # pylint: disable=unused-variable
+            """
+            A class declaring a slot with a default value.
+            """
+            __slots__ = ('y',)  # pylint: disable=class-variable-slots-conflict
+            y = 1
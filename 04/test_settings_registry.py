@@ -0,0 +1,186 @@
+"""
+This module contains tests for the settings registry: atomic versioned snapshots,
+append-only codes, reloading from a file by polling or signal, and descriptors
+following the reloaded settings.
+"""
+
+import json
+import os
+import signal
+import time
+
+import pytest
+
+from descriptor import EncodedMusicalInstrument, MusicalInstrument
+from exceptions import WrongMaterial
+from instrument_batch import InstrumentBatch
+from settings_registry import REGISTRY, SETTING_NAMES, SettingsRegistry
+
+SETTINGS = {
+    'INSTRUMENT_ALLOWED_TYPES': ['string', 'wind'],
+    'ALLOWED_MATERIALS': ['wood', 'metal'],
+    'SOUND_ALLOWED_REGISTERS': ['high', 'low'],
+}
+
+
+def write_settings(path, **changes) -> None:
+    """
+        Writes SETTINGS with changes to a JSON file and moves its modification time forward.
+    """
+    path.write_text(json.dumps({**SETTINGS, **changes}))
+    mtime = time.time_ns() + 10 ** 9 * (1 + len(changes))
+    os.utime(path, ns=(mtime, mtime))
+
+
+def wait_for(condition, timeout=5.0) -> bool:
+    """
+        Waits until a condition is true.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture(name='global_settings')
+def fixture_global_settings():
+    """
+        Restores the settings of the global registry after a test.
+    """
+    allowed = REGISTRY.snapshot.allowed
+    yield REGISTRY
+    REGISTRY.update(allowed)
+
+
+def test_update_swaps_versioned_snapshot():
+    """
+        Test that an update creates a new snapshot and a failed one keeps the current one.
+    """
+    registry = SettingsRegistry(SETTINGS)
+    first = registry.snapshot
+    assert first.version == 1
+    assert first.allowed['ALLOWED_MATERIALS'] == frozenset({'wood', 'metal'})
+
+    second = registry.update({**SETTINGS, 'ALLOWED_MATERIALS': ['glass']})
+    assert registry.snapshot is second
+    assert second.version == 2
+    assert first.allowed['ALLOWED_MATERIALS'] == frozenset({'wood', 'metal'})
+
+    with pytest.raises(ValueError):
+        registry.update({'ALLOWED_MATERIALS': ['wood']})
+    with pytest.raises(ValueError):
+        registry.update({**SETTINGS, 'ALLOWED_MATERIALS': [str(value) for value in range(300)]})
+    assert registry.snapshot is second
+
+
+def test_codes_are_append_only():
+    """
+        Test that reloads never change existing codes and keep removed values decodable.
+    """
+    registry = SettingsRegistry(SETTINGS)
+    table = registry.code_table('ALLOWED_MATERIALS')
+    assert table.values == ('metal', 'wood')
+
+    snapshot = registry.update({**SETTINGS, 'ALLOWED_MATERIALS': ['wood', 'glass', 'bone']})
+    assert table.values == ('metal', 'wood', 'bone', 'glass')
+    assert snapshot.encoders['ALLOWED_MATERIALS'] == {'wood': 1, 'bone': 2, 'glass': 3}
+    assert table.decode(0) == 'metal'
+    assert set(registry.snapshot.allowed) == set(SETTING_NAMES)
+
+
+def test_reload_from_file(tmp_path):
+    """
+        Test loading a file, reloading it only when modified, and keeping the settings
+        when the file is broken.
+    """
+    path = tmp_path / 'settings.json'
+    write_settings(path)
+    registry = SettingsRegistry(SETTINGS)
+    registry.load(str(path))
+    version = registry.snapshot.version
+    assert not registry.reload(only_if_modified=True)
+
+    write_settings(path, ALLOWED_MATERIALS=['glass'])
+    assert registry.reload(only_if_modified=True)
+    assert registry.snapshot.version == version + 1
+    assert registry.snapshot.allowed['ALLOWED_MATERIALS'] == {'glass'}
+
+    path.write_text('{"ALLOWED_MATERIALS": ')
+    assert not registry.reload()
+    assert isinstance(registry.last_error, ValueError)
+    assert registry.snapshot.allowed['ALLOWED_MATERIALS'] == {'glass'}
+
+
+@pytest.mark.parametrize('materials', ['wood', 42, ['wood', 1], {'wood': 1}])
+def test_wrong_setting_types_are_rejected(tmp_path, materials):
+    """
+        Test that a setting which is not a list of strings neither replaces the settings
+        nor adds codes, and stops neither reloads nor the polling thread.
+    """
+    path = tmp_path / 'settings.json'
+    write_settings(path)
+    registry = SettingsRegistry(SETTINGS)
+    registry.start_polling(str(path), interval=0.01)
+    try:
+        snapshot = registry.snapshot
+        codes = registry.code_table('ALLOWED_MATERIALS').values
+        with pytest.raises(TypeError):
+            registry.update({**SETTINGS, 'ALLOWED_MATERIALS': materials})
+
+        write_settings(path, ALLOWED_MATERIALS=materials)
+        assert not registry.reload()
+        assert isinstance(registry.last_error, TypeError)
+        time.sleep(0.05)
+        assert registry._polling[0].is_alive()  # pylint: disable=protected-access
+        assert registry.snapshot is snapshot
+        assert registry.code_table('ALLOWED_MATERIALS').values == codes
+    finally:
+        registry.stop_polling()
+
+
+def test_polling_and_signal(tmp_path):
+    """
+        Test that a modified file is picked up by the polling thread and on SIGHUP.
+    """
+    path = tmp_path / 'settings.json'
+    write_settings(path)
+    registry = SettingsRegistry(SETTINGS)
+
+    registry.start_polling(str(path), interval=0.01)
+    try:
+        write_settings(path, ALLOWED_MATERIALS=['glass'])
+        assert wait_for(lambda: 'glass' in registry.snapshot.allowed['ALLOWED_MATERIALS'])
+    finally:
+        registry.stop_polling()
+
+    previous_handler = signal.getsignal(signal.SIGHUP)
+    registry.install_signal_handler(str(path))
+    try:
+        write_settings(path, ALLOWED_MATERIALS=['bone'], SOUND_ALLOWED_REGISTERS=['low'])
+        os.kill(os.getpid(), signal.SIGHUP)
+        assert wait_for(lambda: 'bone' in registry.snapshot.allowed['ALLOWED_MATERIALS'])
+    finally:
+        signal.signal(signal.SIGHUP, previous_handler)
+
+
+def test_descriptors_follow_reloads(global_settings):
+    """
+        Test that validation and encoding use the current settings without a restart,
+        and that records encoded before a reload can still be decoded.
+    """
+    wooden = EncodedMusicalInstrument('string', 'wood', 'low')
+    with pytest.raises(WrongMaterial):
+        MusicalInstrument('string', 'glass', 'low')
+
+    global_settings.update({**global_settings.snapshot.allowed, 'ALLOWED_MATERIALS': {'glass'}})
+    assert MusicalInstrument('string', 'glass', 'low').material == 'glass'
+    assert EncodedMusicalInstrument('string', 'glass', 'low').material == 'glass'
+    assert wooden.material == 'wood'
+    with pytest.raises(WrongMaterial):
+        EncodedMusicalInstrument('string', 'wood', 'low')
+
+    batch = InstrumentBatch.from_rows([('string', 'glass', 'low'), ('string', 'wood', 'low')])
+    assert batch.column('material') == ['glass']
+    assert batch.source_indexes == [0]
@@ -0,0 +1,251 @@
+"""
+This script replays a recorded key trace against LRUCache to choose its capacity
+and eviction policy.
+
+A trace file has one request per line, either:
+- a key, optionally followed by the size of the value in bytes (1 by default);
+- a line of the log written by `09/lru_cache.py`: every `GET - Try to find: <key>` line
+  is a read request, its size is the length of the latest value set for the key; every
+  `SET - Try to set: <key>=<value>` line is a write. Other log lines are skipped.
+
+A read request gets the key and sets it on a miss. A write sets the key without being
+counted as a request, so a cache-aside SET after a GET miss is not a hit. For every
+policy and capacity the script reports the hit ratio, the byte hit ratio (bytes of the
+hits over all requested bytes) and the replay throughput. For LRU the whole hit-ratio
+curve is also computed in a single pass from stack distances: a read hits an LRU cache
+of capacity C exactly when fewer than C distinct keys were read or written since the
+previous access to its key.
+
+Example:
+    python cache_simulator.py trace.txt --capacities 100 1000 10000 --policies lru arc w-tinylfu
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from bisect import bisect_right
+from collections.abc import Hashable, Iterable
+from dataclasses import asdict, dataclass
+from itertools import accumulate
+from typing import NamedTuple
+
+from eviction_policies import POLICIES
+from lru_cache import LRUCache
+
+LOG_REQUEST = re.compile(r' - (?:GET - Try to find: (?P<get>.*)|SET - Try to set: (?P<set>.*))$')
+LOG_LINE = re.compile(r'^\d{4}-\d{2}-\d{2} [\d:,]+ - [A-Z]+ - ')
+STACK_DISTANCE = 'lru (stack distance)'
+
+
+class Request(NamedTuple):
+    """An access of a trace: a read request, or a write that is not counted as a request."""
+    key: Hashable
+    size: int = 1
+    write: bool = False
+
+
+@dataclass
+class SimulationResult:
+    """Measurements of one policy and capacity on a trace."""
+    policy: str
+    capacity: int
+    hit_ratio: float
+    byte_hit_ratio: float
+    ops_per_sec: float
+
+
+def parse_trace(lines: Iterable[str]) -> list[Request]:
+    """
+    Parse the requests of a trace.
+
+    Args:
+        lines: Lines of a key-per-line trace or of a cache log.
+
+    Returns:
+        The accesses in trace order.
+
+    Raises:
+        ValueError: If the size of a request is not an integer.
+    """
+    requests = []
+    logged_sizes = {}
+    for line in lines:
+        line = line.rstrip('\n')
+        if LOG_LINE.match(line):
+            match = LOG_REQUEST.search(line)
+            if match is None:
+                continue
+            if match['get'] is not None:
+                requests.append(Request(match['get'], logged_sizes.get(match['get'], 1)))
+            else:
+                key, _, value = match['set'].partition('=')
+                logged_sizes[key] = len(value)
+                requests.append(Request(key, len(value), write=True))
+        elif line.strip():
+            key, *size = line.split()
+            requests.append(Request(key, int(size[0]) if size else 1))
+    return requests
+
+
+class FenwickTree:
+    """A binary indexed tree of integers with point updates and prefix sums in O(log n)."""
+
+    def __init__(self, size: int):
+        self.__tree = [0] * (size + 1)
+
+    def add(self, index: int, delta: int) -> None:
+        """Adds a delta to the value at a 0-based index."""
+        index += 1
+        while index < len(self.__tree):
+            self.__tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, stop: int) -> int:
+        """Returns the sum of the values at indexes below `stop`."""
+        total = 0
+        while stop > 0:
+            total += self.__tree[stop]
+            stop -= stop & -stop
+        return total
+
+
+def stack_distances(trace: list[Request]) -> list[int | None]:
+    """
+    Compute the LRU stack distance of every access: the number of distinct keys
+    accessed since the previous access to the same key, plus one.
+
+    The tree marks the position of the latest request of every key, so the distinct
+    keys between two requests are the marks between their positions.
+
+    Returns:
+        The distance of every access, None for the first access to a key.
+    """
+    tree = FenwickTree(len(trace))
+    latest = {}
+    distances = []
+    for position, (key, *_) in enumerate(trace):
+        previous = latest.get(key)
+        if previous is None:
+            distances.append(None)
+        else:
+            distances.append(tree.prefix_sum(position) - tree.prefix_sum(previous + 1) + 1)
+            tree.add(previous, -1)
+        tree.add(position, 1)
+        latest[key] = position
+    return distances
+
+
+def lru_curve(trace: list[Request], capacities: list[int]) -> list[SimulationResult]:
+    """
+    Compute LRU hit ratios of all capacities in one pass over the trace.
+
+    Args:
+        trace: The accesses.
+        capacities: Capacities to report.
+
+    Returns:
+        A result per capacity; the throughput is the one of the single pass.
+    """
+    start_time = time.perf_counter()
+    reuses = sorted((distance, request.size) for distance, request in zip(stack_distances(trace), trace)
+                    if distance is not None and not request.write)
+    elapsed = time.perf_counter() - start_time
+    distances = [distance for distance, _ in reuses]
+    hit_bytes = [0, *accumulate(size for _, size in reuses)]
+    reads = [request for request in trace if not request.write]
+    total_bytes = sum(request.size for request in reads)
+
+    results = []
+    for capacity in capacities:
+        hits = bisect_right(distances, capacity)
+        results.append(SimulationResult(
+            STACK_DISTANCE, capacity,
+            hits / len(reads) if reads else 0.0,
+            hit_bytes[hits] / total_bytes if total_bytes else 0.0,
+            len(trace) / elapsed if elapsed else float('inf'),
+        ))
+    return results
+
+
+def simulate(trace: list[Request], policy: str, capacity: int) -> SimulationResult:
+    """
+    Replay a trace against an LRUCache with a policy.
+
+    Args:
+        trace: The accesses.
+        policy: A name from `eviction_policies.POLICIES`.
+        capacity: The capacity of the cache.
+
+    Returns:
+        The hit ratio, byte hit ratio and requests per second.
+    """
+    cache = LRUCache(capacity, policy=policy)
+    hit_bytes = 0
+    start_time = time.perf_counter()
+    for key, size, write in trace:
+        if write or cache.get(key) is None:
+            cache.set(key, size)
+        else:
+            hit_bytes += size
+    elapsed = time.perf_counter() - start_time
+    reads = [request for request in trace if not request.write]
+    total_bytes = sum(request.size for request in reads)
+    return SimulationResult(
+        policy, capacity,
+        cache.stats.hits / len(reads) if reads else 0.0,
+        hit_bytes / total_bytes if total_bytes else 0.0,
+        len(trace) / elapsed if elapsed else float('inf'),
+    )
+
+
+def default_capacities(trace: list[Request]) -> list[int]:
+    """Return powers of two up to the number of distinct keys of the trace."""
+    distinct = len({request.key for request in trace})
+    capacities = [1 << power for power in range(distinct.bit_length())]
+    if distinct not in capacities:
+        capacities.append(distinct)
+    return capacities
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """
+        Provides the simulation
+    """
+    parser = argparse.ArgumentParser(description="Replay a key trace against LRUCache policies and capacities.")
+    parser.add_argument("trace", help="A key-per-line trace or a cache log, '-' for stdin.")
+    parser.add_argument("--capacities", type=int, nargs="+",
+                        help="Capacities to simulate, powers of two up to the number of keys by default.")
+    parser.add_argument("--policies", nargs="+", choices=list(POLICIES), default=list(POLICIES))
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args(arguments)
+
+    if args.trace == '-':
+        trace = parse_trace(sys.stdin)
+    else:
+        with open(args.trace, encoding='utf-8') as file:
+            trace = parse_trace(file)
+    capacities = args.capacities or default_capacities(trace)
+
+    results = lru_curve(trace, capacities)
+    results += [simulate(trace, policy, capacity) for policy in args.policies for capacity in capacities]
+    writes = sum(request.write for request in trace)
+    if args.json:
+        print(json.dumps(
+            {'requests': len(trace) - writes, 'writes': writes, 'results': [asdict(result) for result in results]},
+            indent=2,
+        ))
+    else:
+        print(f"Requests: {len(trace) - writes}, writes: {writes}, "
+              f"distinct keys: {len({request.key for request in trace})}")
+        for result in results:
+            print(
+                f"{result.policy} capacity={result.capacity}: Hit Ratio: {result.hit_ratio:.4f}, "
+                f"Byte Hit Ratio: {result.byte_hit_ratio:.4f}, {result.ops_per_sec:.0f} ops/s"
+            )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
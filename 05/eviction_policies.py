@@ -0,0 +1,394 @@
+"""
+This module provides eviction policies for LRUCache. A policy tracks the keys of the
+cache, not the values, and decides which key is evicted when the cache is full:
+- LRUPolicy: least recently used.
+- SievePolicy: SIEVE, a FIFO queue with visited bits and a hand that keeps survivors in place.
+- ClockPolicy: CLOCK, a circular buffer with reference bits.
+- TwoQueuePolicy: 2Q, a FIFO for new keys, a ghost FIFO of their evicted keys and an LRU
+  for keys seen again.
+- ARCPolicy: Adaptive Replacement Cache, balancing recency and frequency with ghost lists.
+- WTinyLFUPolicy: W-TinyLFU, a small LRU window and a segmented LRU main area; keys leaving
+  the window are admitted only if they are more frequent than the main victim, estimated by
+  a count-min sketch behind a doorkeeper Bloom filter.
+
+Policies scan-resistant by design (SIEVE, 2Q, ARC, W-TinyLFU) keep the hot keys when a
+long sequence of keys is accessed only once.
+"""
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+_SENTINEL = object()
+
+
+class EvictionPolicy:
+    """
+        Base class for eviction policies. The cache calls the methods under its lock:
+        `insert` for a new key, `record_access` for a hit or an overwrite, `record_miss`
+        for a missing key, `remove` for a key removed by the cache (e.g. expired), and
+        `evict` to choose and forget the next victim. Room for a new key is made before
+        it is inserted: `prepare_insert` announces the key, then `evict` is called until
+        the key fits, then `insert` adds it, so a new key is never its own victim.
+    """
+    name = ''
+
+    def __init__(self, capacity: int):
+        """
+            Args:
+                capacity (int): The capacity of the cache, used to size internal structures.
+        """
+        self.capacity = capacity
+
+    def record_access(self, key: Hashable) -> None:
+        """Marks a cached key as accessed."""
+        raise NotImplementedError
+
+    def record_miss(self, key: Hashable) -> None:
+        """Notes an access to a key that is not cached."""
+
+    def prepare_insert(self, key: Hashable) -> None:
+        """Notes a new key before the evictions making room for it."""
+
+    def insert(self, key: Hashable) -> None:
+        """Starts tracking a new key."""
+        raise NotImplementedError
+
+    def remove(self, key: Hashable) -> None:
+        """Stops tracking a key removed by the cache."""
+        raise NotImplementedError
+
+    def evict(self) -> Hashable:
+        """
+            Chooses the next key to evict and stops tracking it.
+
+            Raises:
+                KeyError: If no key is tracked.
+        """
+        raise NotImplementedError
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evicts the least recently used key."""
+    name = 'lru'
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._order = OrderedDict()
+
+    def record_access(self, key: Hashable) -> None:
+        self._order.move_to_end(key)
+
+    def insert(self, key: Hashable) -> None:
+        self._order[key] = None
+
+    def remove(self, key: Hashable) -> None:
+        del self._order[key]
+
+    def evict(self) -> Hashable:
+        return self._order.popitem(last=False)[0]
+
+
+class _LinkedPolicy(EvictionPolicy):
+    """
+        A doubly linked ring of keys through a sentinel, with a flag per key.
+        Keys that never move are cheaper to keep in a ring than in an OrderedDict,
+        which cannot resume iteration from a key.
+    """
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._prev = {_SENTINEL: _SENTINEL}
+        self._next = {_SENTINEL: _SENTINEL}
+        self._flags = {}
+        self._hand = _SENTINEL
+
+    def record_access(self, key: Hashable) -> None:
+        self._flags[key] = True
+
+    def insert(self, key: Hashable) -> None:
+        """Links a new key into the ring, at a position defined by subclasses."""
+        raise NotImplementedError
+
+    def _link_before(self, key: Hashable, successor: Hashable) -> None:
+        """Inserts a key before another key or the sentinel."""
+        predecessor = self._prev[successor]
+        self._prev[key], self._next[key] = predecessor, successor
+        self._next[predecessor] = self._prev[successor] = key
+        self._flags[key] = False
+
+    def remove(self, key: Hashable) -> None:
+        if self._hand == key:
+            self._hand = self._prev[key]
+        predecessor, successor = self._prev.pop(key), self._next.pop(key)
+        self._next[predecessor], self._prev[successor] = successor, predecessor
+        del self._flags[key]
+
+    def evict(self) -> Hashable:
+        """Moves the hand forward, clearing flags, and evicts the first key without a flag."""
+        if not self._flags:
+            raise KeyError('evict from an empty policy')
+        hand = self._next[self._hand]
+        while hand is _SENTINEL or self._flags[hand]:
+            if hand is not _SENTINEL:
+                self._flags[hand] = False
+            hand = self._next[hand]
+        self._hand = hand
+        self.remove(hand)
+        return hand
+
+
+class SievePolicy(_LinkedPolicy):
+    """
+        SIEVE: new keys enter at the head of a queue and are never moved. The hand moves
+        from the tail to the head, clearing visited bits, and evicts the first unvisited key.
+    """
+    name = 'sieve'
+
+    def insert(self, key: Hashable) -> None:
+        self._link_before(key, _SENTINEL)
+
+
+class ClockPolicy(_LinkedPolicy):
+    """
+        CLOCK: keys are arranged in a circle behind the hand. The hand clears reference
+        bits and evicts the first key without one; new keys are placed right behind the
+        hand, so they are checked last.
+    """
+    name = 'clock'
+
+    def insert(self, key: Hashable) -> None:
+        self._link_before(key, self._next[self._hand])
+        self._hand = key
+
+
+class TwoQueuePolicy(EvictionPolicy):
+    """
+        2Q: new keys enter the FIFO `A1in` (a quarter of the capacity). Keys evicted from it
+        are remembered in the ghost FIFO `A1out` (half of the capacity); a key inserted again
+        while remembered goes to the LRU `Am`. One-time keys therefore never reach `Am`.
+    """
+    name = '2q'
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._in_size = max(1, capacity // 4)
+        self._out_size = max(1, capacity // 2)
+        self._a1_in = OrderedDict()
+        self._a1_out = OrderedDict()
+        self._am = OrderedDict()
+
+    def record_access(self, key: Hashable) -> None:
+        if key in self._am:
+            self._am.move_to_end(key)
+
+    def insert(self, key: Hashable) -> None:
+        if self._a1_out.pop(key, _SENTINEL) is not _SENTINEL:
+            self._am[key] = None
+        else:
+            self._a1_in[key] = None
+
+    def remove(self, key: Hashable) -> None:
+        if self._a1_in.pop(key, _SENTINEL) is _SENTINEL:
+            del self._am[key]
+
+    def evict(self) -> Hashable:
+        if self._a1_in and (len(self._a1_in) >= self._in_size or not self._am):
+            key = self._a1_in.popitem(last=False)[0]
+            self._a1_out[key] = None
+            if len(self._a1_out) > self._out_size:
+                self._a1_out.popitem(last=False)
+            return key
+        return self._am.popitem(last=False)[0]
+
+
+class ARCPolicy(EvictionPolicy):
+    """
+        ARC: `T1` holds keys seen once recently and `T2` keys seen at least twice, both in
+        LRU order; the ghost lists `B1` and `B2` remember keys evicted from them. A key
+        inserted again while in `B1` grows the target size `p` of `T1`, one in `B2` shrinks
+        it, so the split between recency and frequency adapts to the workload.
+    """
+    name = 'arc'
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._target = 0.0
+        self._t1 = OrderedDict()
+        self._t2 = OrderedDict()
+        self._b1 = OrderedDict()
+        self._b2 = OrderedDict()
+        self._from_b2 = False
+
+    def record_access(self, key: Hashable) -> None:
+        if self._t1.pop(key, _SENTINEL) is not _SENTINEL:
+            self._t2[key] = None
+        else:
+            self._t2.move_to_end(key)
+
+    def prepare_insert(self, key: Hashable) -> None:
+        """Adapts the target size of `T1` to a ghost hit before the victim is chosen."""
+        self._from_b2 = False
+        if key in self._b1:
+            self._target = min(self.capacity, self._target + max(len(self._b2) / len(self._b1), 1))
+        elif key in self._b2:
+            self._target = max(0.0, self._target - max(len(self._b1) / len(self._b2), 1))
+            self._from_b2 = True
+
+    def insert(self, key: Hashable) -> None:
+        if self._b1.pop(key, _SENTINEL) is not _SENTINEL or self._b2.pop(key, _SENTINEL) is not _SENTINEL:
+            self._t2[key] = None
+        else:
+            self._t1[key] = None
+        self._from_b2 = False
+        self._trim_ghosts()
+
+    def remove(self, key: Hashable) -> None:
+        if self._t1.pop(key, _SENTINEL) is _SENTINEL:
+            del self._t2[key]
+
+    def evict(self) -> Hashable:
+        if self._t1 and (not self._t2 or len(self._t1) > self._target
+                         or (self._from_b2 and len(self._t1) == self._target)):
+            key = self._t1.popitem(last=False)[0]
+            self._b1[key] = None
+        else:
+            key = self._t2.popitem(last=False)[0]
+            self._b2[key] = None
+        self._trim_ghosts()
+        return key
+
+    def _trim_ghosts(self) -> None:
+        """Keeps `T1` + `B1` within the capacity and all lists within twice the capacity."""
+        while self._b1 and len(self._t1) + len(self._b1) > self.capacity:
+            self._b1.popitem(last=False)
+        while self._b2 and len(self._t1) + len(self._t2) + len(self._b1) + len(self._b2) > 2 * self.capacity:
+            self._b2.popitem(last=False)
+
+
+class CountMinSketch:
+    """
+        Approximate access counts of keys: 4 rows of 4-bit counters (stored in bytes),
+        halved after a sample of `10 * width` increments so that old popularity fades.
+        Keys seen once since the last halving only set bits in the doorkeeper Bloom filter.
+    """
+    SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+    MAX_COUNT = 15
+    HALVE = bytes(count >> 1 for count in range(256))
+
+    def __init__(self, width: int):
+        """
+            Args:
+                width (int): Minimal number of counters per row, rounded up to a power of two.
+        """
+        self._bits = max(4, (width - 1).bit_length())
+        self._mask = (1 << self._bits) - 1
+        self._counters = [bytearray(1 << self._bits) for _ in self.SEEDS]
+        self._doorkeeper = bytearray(1 << self._bits)
+        self._sample_size = 10 << self._bits
+        self._additions = 0
+
+    def _indexes(self, key: Hashable) -> list[int]:
+        """Returns the counter index of the key in every row."""
+        key_hash = hash(key)
+        return [((key_hash * seed) & 0xFFFFFFFFFFFFFFFF) >> (64 - self._bits) for seed in self.SEEDS]
+
+    def increment(self, key: Hashable) -> None:
+        """Counts an access to a key."""
+        indexes = self._indexes(key)
+        if not (self._doorkeeper[indexes[0]] and self._doorkeeper[indexes[1]]):
+            self._doorkeeper[indexes[0]] = self._doorkeeper[indexes[1]] = 1
+        else:
+            for row, index in zip(self._counters, indexes):
+                if row[index] < self.MAX_COUNT:
+                    row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._counters = [row.translate(self.HALVE) for row in self._counters]
+            self._doorkeeper = bytearray(len(self._doorkeeper))
+            self._additions //= 2
+
+    def estimate(self, key: Hashable) -> int:
+        """Returns an upper estimate of the access count of a key."""
+        indexes = self._indexes(key)
+        seen = self._doorkeeper[indexes[0]] and self._doorkeeper[indexes[1]]
+        return min(row[index] for row, index in zip(self._counters, indexes)) + bool(seen)
+
+
+class WTinyLFUPolicy(EvictionPolicy):
+    """
+        W-TinyLFU: new keys enter an LRU window of 1% of the capacity. The main area is a
+        segmented LRU: keys leave the window into `probation`, and a hit there promotes them
+        to `protected` (80% of the main area). When the cache is full, the key leaving the
+        window replaces the probation victim only if its estimated frequency is higher.
+    """
+    name = 'w-tinylfu'
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._window_size = max(1, capacity // 100)
+        self._main_size = max(0, capacity - self._window_size)
+        self._protected_size = int(self._main_size * 0.8)
+        self._window = OrderedDict()
+        self._probation = OrderedDict()
+        self._protected = OrderedDict()
+        self._sketch = CountMinSketch(max(capacity, 16))
+
+    def record_access(self, key: Hashable) -> None:
+        self._sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        else:
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self._protected_size:
+                self._probation[self._protected.popitem(last=False)[0]] = None
+
+    def record_miss(self, key: Hashable) -> None:
+        self._sketch.increment(key)
+
+    def insert(self, key: Hashable) -> None:
+        self._sketch.increment(key)
+        self._window[key] = None
+        if len(self._window) > self._window_size and len(self._probation) + len(self._protected) < self._main_size:
+            self._probation[self._window.popitem(last=False)[0]] = None
+
+    def remove(self, key: Hashable) -> None:
+        for segment in (self._window, self._probation, self._protected):
+            if segment.pop(key, _SENTINEL) is not _SENTINEL:
+                return
+        raise KeyError(key)
+
+    def evict(self) -> Hashable:
+        main = self._probation or self._protected
+        if self._window and (len(self._window) >= self._window_size or not main):
+            candidate = self._window.popitem(last=False)[0]
+            if not main:
+                return candidate
+            victim = next(iter(main))
+            if self._sketch.estimate(candidate) <= self._sketch.estimate(victim):
+                return candidate
+            del main[victim]
+            self._probation[candidate] = None
+            return victim
+        return main.popitem(last=False)[0]
+
+
+POLICIES: dict[str, Callable[[int], EvictionPolicy]] = {
+    policy.name: policy
+    for policy in (LRUPolicy, SievePolicy, ClockPolicy, TwoQueuePolicy, ARCPolicy, WTinyLFUPolicy)
+}
+
+
+def create_policy(policy: str | Callable[[int], EvictionPolicy], capacity: int) -> EvictionPolicy:
+    """
+        Creates a policy from its name in `POLICIES` or from a factory.
+
+        Raises:
+            ValueError: If the name is unknown.
+    """
+    if isinstance(policy, str):
+        if policy not in POLICIES:
+            raise ValueError(f'Unknown eviction policy {policy!r}, expected one of {", ".join(POLICIES)}')
+        policy = POLICIES[policy]
+    return policy(capacity)
@@ -1,13 +1,30 @@
 """
 This module provides an LRUCache class, which implements a simple Least Recently Used (LRU) cache.
 The cache stores a fixed number of items, evicting the least recently used item when capacity is exceeded.
+Another eviction policy from `eviction_policies` can be chosen per cache.
+Operations are atomic: every `get` and `set` holds the lock of the cache.
+
+The cache can also be bounded by the total weight of its entries, e.g. their size in
+bytes, computed by a weigher function.
+
+Entries can expire after a time to live (TTL), set for the whole cache or per entry.
+Expired entries are removed lazily when they are read, when room is needed for a new
+entry, and optionally by a background sweeper working in short time slices.
 """
-from collections.abc import Hashable
+import heapq
+import itertools
+import sys
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, replace
 from typing import TypeVar
 from venv import logger
 
 from pydantic import BaseModel, field_validator, ValidationError
 
+from eviction_policies import EvictionPolicy, create_policy
+
 K = TypeVar('K')
 V = TypeVar('V')
 
@@ -26,62 +43,294 @@ class Capacity(BaseModel):
         return value
 
 
-class LRUCache:
+@dataclass
+class CacheStats:
+    """Counters of cache events."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expired: int = 0
+    rejected: int = 0
+
+
+def default_weigher(key: Hashable, value: object) -> int:
+    """Approximates the size of an entry in bytes, without the objects it references."""
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+def unit_weigher(_key: Hashable, _value: object) -> int:
+    """Gives every entry the weight 1."""
+    return 1
+
+
+def validate_ttl(ttl: float | None) -> float | None:
+    """Validates that a time to live is positive or None."""
+    if ttl is not None and ttl <= 0:
+        raise ValueError('TTL must be positive')
+    return ttl
+
+
+class LRUCache:  # pylint: disable=too-many-instance-attributes
     """A Least Recently Used (LRU) cache implementation with a fixed capacity."""
 
-    def __init__(self, capacity: int = 42):
+    def __init__(self, capacity: int = 42, *,  # pylint: disable=too-many-arguments
+                 ttl: float | None = None, timer: Callable[[], float] = time.monotonic,
+                 max_weight: int | None = None, weigher: Callable[[K, V], int] | None = None,
+                 policy: str | Callable[[int], EvictionPolicy] = 'lru'):
         """
             Initializes the LRUCache with a specified capacity.
 
             Args:
                 capacity (int): Maximum number of items that can be stored in the cache.
                                 If exceeded, the least recently used item is evicted.
+                policy (str | Callable): Eviction policy, a name from `eviction_policies.POLICIES`
+                                         or a factory taking the capacity. Evicts the least
+                                         recently used item by default.
+                max_weight (int | None): Maximum total weight of the items, None for no limit.
+                                         If exceeded, least recently used items are evicted.
+                weigher (Callable | None): Function of a key and a value returning the weight of the item.
+                                           Defaults to `default_weigher` with a `max_weight`, or to a
+                                           weight of 1 per item without one.
+                ttl (float | None): Default time to live of the entries in seconds, None to keep
+                                    entries until they are evicted.
+                timer (Callable): Clock used for expiry, in seconds.
+
+            Raises:
+                TypeError: If the capacity or the maximum weight is negative.
+                ValueError: If the TTL is not positive or the policy is unknown.
         """
         self.__capacity = Capacity(value=capacity)
+        self.__policy = create_policy(policy, capacity)
+        self.__max_weight = None if max_weight is None else Capacity(value=max_weight).value
+        if weigher is None:
+            weigher = unit_weigher if max_weight is None else default_weigher
+        self.__weigher = weigher
+        self.__weights = {}
+        self.__weight = 0
+        self.__ttl = validate_ttl(ttl)
+        self.__timer = timer
         self.__data = {}
+        self.__expires = {}
+        self.__deadlines = []
+        self.__counter = itertools.count()
+        self.__stats = CacheStats()
+        self.__lock = threading.Lock()
+        self.__sweeper: tuple[threading.Thread, threading.Event] | None = None
 
     @property
     def capacity(self) -> int:
         """Returns the capacity of the cache."""
         return self.__capacity.value
 
+    @property
+    def policy(self) -> EvictionPolicy:
+        """Returns the eviction policy of the cache."""
+        return self.__policy
+
+    @property
+    def max_weight(self) -> int | None:
+        """Returns the maximum total weight of the cache, or None."""
+        return self.__max_weight
+
+    @property
+    def weight(self) -> int:
+        """Returns the total weight of the items in the cache."""
+        return self.__weight
+
+    @property
+    def stats(self) -> CacheStats:
+        """Returns a copy of the counters of hits, misses, evictions, expired and rejected entries."""
+        with self.__lock:
+            return replace(self.__stats)
+
     def get(self, key: K) -> V | None:
         """
             Retrieves the value associated with the given key.
-            Moves the accessed key to the end to mark it as recently used.
+            Reports the access to the eviction policy, e.g. marks the key as recently used.
 
             Args:
                 key (K): The key to retrieve from the cache.
 
             Returns:
-                V | None: The associated value if the key exists, or None if not.
+                V | None: The associated value if the key exists and has not expired, or None if not.
         """
-        if key not in self.__data:
-            return None
+        with self.__lock:
+            if key not in self.__data:
+                self.__policy.record_miss(key)
+                self.__stats.misses += 1
+                return None
 
-        value = self.__data.pop(key)
-        self.__data[key] = value
-        return value
+            deadline = self.__expires.get(key)
+            if deadline is not None and deadline <= self.__timer():
+                self.__remove(key)
+                self.__stats.expired += 1
+                self.__stats.misses += 1
+                return None
 
-    def set(self, key: K, value: V | None) -> None:
-        """
-            Sets the value for a key in the cache. If the cache is full, evicts the
+            self.__policy.record_access(key)
+            self.__stats.hits += 1
+            return self.__data[key]
 
-            least recently used item before adding the new key-value pair.
+    def set(self, key: K, value: V | None, ttl: float | None = None) -> None:
+        """
+            Sets the value for a key in the cache. If the cache is full, removes expired
+            items and then evicts the items chosen by the policy (the least recently used
+            ones by default) until the number and the weight of the items fit, before a
+            new key is stored. An item
+            heavier than the maximum weight is not stored, and replaces the previous value
+            of the key by nothing.
 
             Args:
                 key (K): The key to set in the cache.
                 value (V): The value to associate with the key.
+                ttl (float | None): Time to live of the entry in seconds, the TTL of the cache if None.
 
             Raises:
                 TypeError: If the key is not hashable.
+                ValueError: If the TTL is not positive or the weight is negative.
         """
         if not isinstance(key, Hashable):
             raise TypeError(f'Unhashable type: {type(key).__name__}')
+        ttl = self.__ttl if ttl is None else validate_ttl(ttl)
+        weight = self.__weigher(key, value)
+        if weight < 0:
+            raise ValueError('Weight must be non-negative')
+
+        with self.__lock:
+            if self.__max_weight is not None and weight > self.__max_weight:
+                if key in self.__data:
+                    self.__remove(key)
+                self.__stats.rejected += 1
+                return
+
+            if key in self.__data:
+                self.__weight -= self.__weights[key]
+                self.__policy.record_access(key)
+            elif self.__make_room(key, weight):
+                self.__policy.insert(key)
+            else:
+                self.__stats.evictions += 1
+                return
+            self.__data[key] = value
+            self.__weights[key] = weight
+            self.__weight += weight
+            if ttl is None:
+                self.__expires.pop(key, None)
+            else:
+                deadline = self.__timer() + ttl
+                self.__expires[key] = deadline
+                heapq.heappush(self.__deadlines, (deadline, next(self.__counter), key))
+                if len(self.__deadlines) > 2 * len(self.__expires) + 64:
+                    self.__compact_deadlines()
+
+            if self.__is_full():
+                self.__remove_expired(self.__timer())
+            while self.__is_full():
+                self.__remove(self.__policy.evict(), evicted=True)
+                self.__stats.evictions += 1
+
+    def sweep(self, time_slice: float = 0.001, batch: int = 64) -> int:
+        """
+            Removes expired entries for at most about `time_slice` seconds. The lock is
+            released after every `batch` entries, so callers wait for one batch at most.
 
-        if key in self.__data:
-            self.__data.pop(key)
+            Args:
+                time_slice (float): Time budget of the sweep in seconds.
+                batch (int): Number of entries removed under one lock acquisition.
+
+            Returns:
+                int: The number of removed entries.
+        """
+        end_time = time.perf_counter() + time_slice
+        removed = 0
+        while True:
+            with self.__lock:
+                removed_in_batch = self.__remove_expired(self.__timer(), batch)
+            removed += removed_in_batch
+            if removed_in_batch < batch or time.perf_counter() >= end_time:
+                return removed
+
+    def start_sweeper(self, interval: float = 1.0, time_slice: float = 0.001) -> None:
+        """
+            Starts a background thread calling `sweep` every `interval` seconds.
+            Stop it with `stop_sweeper` when the cache is no longer used.
+
+            Args:
+                interval (float): Seconds between the sweeps.
+                time_slice (float): Time budget of every sweep in seconds.
+        """
+        self.stop_sweeper()
+        stopped = threading.Event()
+
+        def run() -> None:
+            while not stopped.wait(interval):
+                self.sweep(time_slice)
+
+        thread = threading.Thread(target=run, name='lru-cache-sweeper', daemon=True)
+        self.__sweeper = thread, stopped
+        thread.start()
+
+    def stop_sweeper(self) -> None:
+        """Stops the thread started by `start_sweeper`."""
+        if self.__sweeper is not None:
+            thread, stopped = self.__sweeper
+            stopped.set()
+            thread.join()
+            self.__sweeper = None
+
+    def __is_full(self, extra_items: int = 0, extra_weight: int = 0) -> bool:
+        """Checks whether the number or the weight of the items, with the extra ones, exceed the limits."""
+        return len(self.__data) + extra_items > self.capacity or (
+            self.__max_weight is not None and self.__weight + extra_weight > self.__max_weight
+        )
+
+    def __make_room(self, key: K, weight: int) -> bool:
+        """
+            Removes expired items and then evicts items until a new item of the given
+            weight fits, so the policy never chooses the new key. Must be called with the lock held.
+
+            Returns:
+                bool: Whether the new item fits, False for a zero capacity.
+        """
+        self.__policy.prepare_insert(key)
+        if self.__is_full(1, weight):
+            self.__remove_expired(self.__timer())
+        while self.__data and self.__is_full(1, weight):
+            self.__remove(self.__policy.evict(), evicted=True)
+            self.__stats.evictions += 1
+        return not self.__is_full(1, weight)
+
+    def __remove(self, key: K, evicted: bool = False) -> None:
+        """
+            Removes an entry, its weight and its deadline. Must be called with the lock held.
+
+            Args:
+                key (K): The key to remove.
+                evicted (bool): Whether the policy chose the key and no longer tracks it.
+        """
+        if not evicted:
+            self.__policy.remove(key)
+        del self.__data[key]
+        self.__weight -= self.__weights.pop(key)
+        self.__expires.pop(key, None)
+
+    def __remove_expired(self, now: float, limit: int | None = None) -> int:
+        """
+            Removes entries whose deadline has passed, earliest first. Must be called with the lock held.
+
+            Returns:
+                int: The number of removed entries.
+        """
+        removed = 0
+        while self.__deadlines and self.__deadlines[0][0] <= now and (limit is None or removed < limit):
+            deadline, _, key = heapq.heappop(self.__deadlines)
+            if self.__expires.get(key) == deadline:
+                self.__remove(key)
+                self.__stats.expired += 1
+                removed += 1
+        return removed
 
-        self.__data[key] = value
-        if len(self.__data) > self.capacity:
-            self.__data.pop(next(iter(self.__data)))
+    def __compact_deadlines(self) -> None:
+        """Drops deadlines of overwritten and removed entries. Must be called with the lock held."""
+        self.__deadlines = [item for item in self.__deadlines if self.__expires.get(item[2]) == item[0]]
+        heapq.heapify(self.__deadlines)
@@ -0,0 +1,87 @@
+"""
+This module provides a ShardedLRUCache class, an LRU cache for many threads.
+Keys are distributed by hash across independently locked LRUCache segments,
+so threads working with different segments do not wait for each other.
+The hash is mixed by a multiplicative (Fibonacci) hash first, so keys with
+regular hashes, e.g. integers with a common stride, spread over all segments.
+"""
+from collections.abc import Hashable
+
+from lru_cache import Capacity, LRUCache, K, V
+
+GOLDEN_RATIO_64 = 0x9E3779B97F4A7C15
+MASK_64 = (1 << 64) - 1
+
+
+class ShardedLRUCache:
+    """
+        A thread-safe cache of N LRUCache segments, each with capacity/N items.
+        Least recently used items are evicted per segment, i.e. the LRU order is
+        exact within a segment and approximate for the whole cache.
+    """
+
+    def __init__(self, capacity: int = 42, segments: int = 16, global_lock: bool = False):
+        """
+            Initializes the segments. The capacity is split as evenly as possible,
+            and there are never more segments than items.
+
+            Args:
+                capacity (int): Maximum number of items that can be stored in the cache.
+                segments (int): Number of independently locked segments.
+                global_lock (bool): Use one segment behind one lock, for an exact global LRU order.
+
+            Raises:
+                TypeError: If the capacity is negative.
+                ValueError: If the number of segments is not positive.
+        """
+        self.__capacity = Capacity(value=capacity)
+        if segments < 1:
+            raise ValueError('The number of segments must be positive')
+        count = 1 if global_lock else max(1, min(segments, capacity))
+        self.__segments = tuple(
+            LRUCache(capacity // count + (index < capacity % count)) for index in range(count)
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Returns the capacity of the cache."""
+        return self.__capacity.value
+
+    @property
+    def segments(self) -> int:
+        """Returns the number of segments."""
+        return len(self.__segments)
+
+    def __segment(self, key: K) -> LRUCache:
+        """Returns the segment storing a key, chosen by the high 32 bits of the mixed hash."""
+        mixed = ((hash(key) * GOLDEN_RATIO_64) & MASK_64) >> 32
+        return self.__segments[mixed * len(self.__segments) >> 32]
+
+    def get(self, key: K) -> V | None:
+        """
+            Retrieves the value associated with the given key from its segment,
+            marking it as recently used.
+
+            Args:
+                key (K): The key to retrieve from the cache.
+
+            Returns:
+                V | None: The associated value if the key exists, or None if not.
+        """
+        return self.__segment(key).get(key)
+
+    def set(self, key: K, value: V | None) -> None:
+        """
+            Sets the value for a key in its segment, evicting the least recently
+            used item of the segment if it is full.
+
+            Args:
+                key (K): The key to set in the cache.
+                value (V): The value to associate with the key.
+
+            Raises:
+                TypeError: If the key is not hashable.
+        """
+        if not isinstance(key, Hashable):
+            raise TypeError(f'Unhashable type: {type(key).__name__}')
+        self.__segment(key).set(key, value)
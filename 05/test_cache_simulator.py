@@ -0,0 +1,86 @@
+"""
+Test suite for the cache trace simulator: trace parsing, stack distances and
+the agreement of the single-pass LRU curve with replaying the trace.
+"""
+
+import json
+import random
+
+import pytest
+
+from cache_simulator import (FenwickTree, Request, default_capacities, lru_curve, main, parse_trace, simulate,
+                             stack_distances)
+
+
+def test_parse_key_per_line_and_log_traces():
+    """Test that plain keys with optional sizes are reads, and cache log sets are writes."""
+    assert parse_trace(['a\n', 'b 100\n', '\n', 'a 5\n']) == [('a', 1, False), ('b', 100, False), ('a', 5, False)]
+    log = [
+        '2024-12-01 17:03:47,026 - DEBUG - SET - Try to set: a=hello\n',
+        '2024-12-01 17:03:47,026 - INFO - SET - Key added: a\n',
+        '2024-12-01 17:03:47,027 - DEBUG - GET - Try to find: a\n',
+        '2024-12-01 17:03:47,027 - INFO - GET - Key accessed: a\n',
+        '2024-12-01 17:03:47,027 - DEBUG - GET - Try to find: b\n',
+    ]
+    assert parse_trace(log) == [('a', 5, True), ('a', 5, False), ('b', 1, False)]
+    with pytest.raises(ValueError):
+        parse_trace(['a big'])
+
+
+def test_stack_distances():
+    """Test distances on a small trace and the Fenwick tree behind them."""
+    trace = [Request(key) for key in 'abcab b a'.replace(' ', '')]
+    assert stack_distances(trace) == [None, None, None, 3, 3, 1, 2]
+
+    tree = FenwickTree(5)
+    for index, value in enumerate([3, 1, 4, 1, 5]):
+        tree.add(index, value)
+    assert [tree.prefix_sum(stop) for stop in range(6)] == [0, 3, 4, 8, 9, 14]
+
+
+def test_lru_curve_matches_replay():
+    """Test that the single-pass LRU curve equals replaying a trace with writes for every capacity."""
+    rng = random.Random(50)
+    trace = [
+        Request(int(rng.paretovariate(1.2)), rng.randint(1, 1000), rng.random() < 0.2) for _ in range(3000)
+    ]
+    capacities = default_capacities(trace)
+    assert capacities[:4] == [1, 2, 4, 8]
+    assert capacities[-1] == len({request.key for request in trace})
+
+    for curve, replay in zip(lru_curve(trace, capacities), (simulate(trace, 'lru', c) for c in capacities)):
+        assert curve.capacity == replay.capacity
+        assert curve.hit_ratio == pytest.approx(replay.hit_ratio)
+        assert curve.byte_hit_ratio == pytest.approx(replay.byte_hit_ratio)
+    assert lru_curve([], [1])[0].hit_ratio == 0
+
+
+def test_cache_aside_sets_are_not_hits():
+    """Test that a set after a missed get is a write, not a request hitting the cache."""
+    log = [
+        '2024-12-01 17:03:47,027 - DEBUG - GET - Try to find: x\n',
+        '2024-12-01 17:03:47,027 - DEBUG - SET - Try to set: x=1\n',
+        '2024-12-01 17:03:47,027 - DEBUG - GET - Try to find: y\n',
+        '2024-12-01 17:03:47,027 - DEBUG - SET - Try to set: y=1\n',
+        '2024-12-01 17:03:47,027 - DEBUG - GET - Try to find: x\n',
+    ]
+    trace = parse_trace(log)
+    assert [result.hit_ratio for result in lru_curve(trace, [1, 2])] == [0, pytest.approx(1 / 3)]
+    assert simulate(trace, 'lru', 1).hit_ratio == 0
+    assert simulate(trace, 'lru', 2).hit_ratio == pytest.approx(1 / 3)
+
+
+def test_main_reports_every_policy_and_capacity(tmp_path, capsys):
+    """Test the JSON report of the command line tool."""
+    path = tmp_path / 'trace.txt'
+    path.write_text('\n'.join('abcabdabe'))
+    assert main([str(path), '--capacities', '2', '3', '--policies', 'lru', 'arc', '--json']) == 0
+
+    report = json.loads(capsys.readouterr().out)
+    assert report['requests'] == 9
+    assert report['writes'] == 0
+    assert [(result['policy'], result['capacity']) for result in report['results']] == [
+        ('lru (stack distance)', 2), ('lru (stack distance)', 3),
+        ('lru', 2), ('lru', 3), ('arc', 2), ('arc', 3),
+    ]
+    assert report['results'][1]['hit_ratio'] == report['results'][3]['hit_ratio']
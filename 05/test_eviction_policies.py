@@ -0,0 +1,117 @@
+"""
+Test suite for the eviction policies of LRUCache.
+
+The policies are tested through the cache: capacity and weight limits, expiry and
+overwrites must work with every policy, and the scan-resistant policies must keep a
+hot set of keys during a scan of one-time keys.
+"""
+
+import random
+
+import pytest
+
+from eviction_policies import POLICIES, CountMinSketch, EvictionPolicy, LRUPolicy
+from lru_cache import LRUCache
+
+
+def access(cache: LRUCache, key) -> bool:
+    """Reads a key and sets it on a miss, returns whether it was a hit."""
+    if cache.get(key) is None:
+        cache.set(key, key)
+        return False
+    return True
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_policy_keeps_cache_consistent(policy):
+    """Test that random operations keep the cache within its limits and return the latest values."""
+    rng = random.Random(49)
+    cache = LRUCache(20, policy=policy, max_weight=60, weigher=lambda key, value: value[1])
+    latest = {}
+    for step in range(5000):
+        key = rng.randrange(60)
+        if rng.random() < 0.5:
+            latest[key] = (step, rng.choice((1, 2, 3, 70)))
+            cache.set(key, latest[key], ttl=rng.choice((None, None, 0.0001)))
+        else:
+            value = cache.get(key)
+            assert value is None or value == latest[key]
+
+    assert cache.policy.name == policy
+    stored = [key for key in range(60) if cache.get(key) is not None]
+    assert len(stored) <= 20
+    assert cache.weight <= 60
+    stats = cache.stats
+    assert stats.hits and stats.misses and stats.evictions and stats.rejected
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_zero_and_tiny_capacity(policy):
+    """Test that every policy can evict the only key it tracks."""
+    for capacity in (0, 1, 2):
+        cache = LRUCache(capacity, policy=policy)
+        for key in range(10):
+            cache.set(key, key)
+        assert cache.get(9) == (9 if capacity else None)
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_new_key_is_not_its_own_victim(policy):
+    """Test that a key set in a full cache of recently read keys is a hit right after."""
+    cache = LRUCache(4, policy=policy)
+    for key in range(4):
+        cache.set(key, key)
+    for key in range(4):
+        assert cache.get(key) == key
+    for step in range(8):
+        cache.set(f'new{step}', step)
+        assert cache.get(f'new{step}') == step
+    assert cache.stats.evictions == 8
+
+
+@pytest.mark.parametrize('policy', ['sieve', '2q', 'arc', 'w-tinylfu'])
+def test_scan_resistance(policy):
+    """Test that a hot set survives one-time keys that flush it from an LRU cache."""
+    caches = {name: LRUCache(20, policy=name) for name in ('lru', policy)}
+    hit_ratios = {}
+    for name, cache in caches.items():
+        for step in range(60):
+            access(cache, f'hot{step % 12}')
+        hits = sum(access(cache, f'hot{step % 12}') + 0 * access(cache, f'scan{step}') for step in range(1200))
+        hit_ratios[name] = hits / 1200
+    assert hit_ratios['lru'] < 0.05
+    assert hit_ratios[policy] > 0.95
+
+
+def test_custom_and_unknown_policies():
+    """Test that a policy factory can be passed and unknown names are rejected."""
+    evicted = []
+
+    class RecordingPolicy(LRUPolicy):
+        """An LRU policy recording its victims."""
+
+        def evict(self):
+            evicted.append(super().evict())
+            return evicted[-1]
+
+    cache = LRUCache(1, policy=RecordingPolicy)
+    cache.set(1, 'a')
+    cache.set(2, 'b')
+    assert evicted == [1]
+    assert isinstance(cache.policy, EvictionPolicy)
+    with pytest.raises(ValueError):
+        LRUCache(policy='fifo')
+
+
+def test_count_min_sketch():
+    """Test that frequent keys get higher estimates and counts fade after the sample."""
+    sketch = CountMinSketch(16)
+    for _ in range(10):
+        sketch.increment('frequent')
+    sketch.increment('rare')
+    assert sketch.estimate('frequent') > sketch.estimate('rare') >= 1
+    assert sketch.estimate('unknown') <= 1
+
+    for key in range(160):
+        sketch.increment(key)
+    assert sketch.estimate('frequent') < 10
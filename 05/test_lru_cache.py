@@ -6,9 +6,12 @@ including setting and getting values, eviction policy, capacity constraints,
 and handling of edge cases.
 """
 
+import sys
+import time
+
 import pytest
 
-from lru_cache import LRUCache
+from lru_cache import CacheStats, LRUCache
 
 
 def test_default_capacity():
@@ -197,3 +200,132 @@ def test_update_existing_key_and_eviction():
     assert cache.get(1) == 'updated'
     assert cache.get(2) is None
     assert cache.get(3) == 'c'
+
+
+class FakeTimer:
+    """A clock moved forward by tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_expires_entries_lazily():
+    """Test that entries expire after the TTL of the cache or of the entry."""
+    timer = FakeTimer()
+    cache = LRUCache(3, ttl=10, timer=timer)
+    cache.set(1, 'a')
+    cache.set(2, 'b', ttl=1)
+    timer.now = 5
+    assert cache.get(2) is None
+    assert cache.get(1) == 'a'
+    cache.set(1, 'c')
+    timer.now = 12
+    assert cache.get(1) == 'c'
+    timer.now = 15
+    assert cache.get(1) is None
+    assert cache.stats == CacheStats(hits=2, misses=2, evictions=0, expired=2)
+
+    with pytest.raises(ValueError):
+        cache.set(3, 'd', ttl=0)
+    with pytest.raises(ValueError):
+        LRUCache(ttl=-1)
+
+
+def test_expired_entries_make_room_before_live_ones():
+    """Test that a full cache removes expired entries instead of evicting live ones."""
+    timer = FakeTimer()
+    cache = LRUCache(2, timer=timer)
+    cache.set(1, 'a', ttl=1)
+    cache.set(2, 'b')
+    timer.now = 2
+    cache.set(3, 'c')
+    assert cache.get(2) == 'b'
+    assert cache.get(3) == 'c'
+    assert cache.stats.expired == 1
+    assert cache.stats.evictions == 0
+
+    cache.set(4, 'd')
+    assert cache.stats.evictions == 1
+    assert cache.get(2) is None
+
+
+def test_sweep_removes_expired_entries_in_batches():
+    """Test that sweeps reclaim expired entries only and stop after the time slice."""
+    timer = FakeTimer()
+    cache = LRUCache(1000, timer=timer)
+    for key in range(500):
+        cache.set(key, key, ttl=1 if key % 2 else None)
+    for key in range(1, 500, 2):
+        cache.set(key, key, ttl=1)
+    timer.now = 2
+    assert cache.sweep(time_slice=0, batch=10) == 10
+    assert cache.sweep() == 240
+    assert cache.sweep() == 0
+    assert len(cache._LRUCache__data) == 250  # pylint: disable=protected-access
+    assert cache.stats.expired == 250
+
+
+def test_background_sweeper():
+    """Test that the sweeper thread reclaims expired entries without reads."""
+    cache = LRUCache(10)
+    cache.set(1, 'a', ttl=0.01)
+    cache.start_sweeper(interval=0.01)
+    try:
+        deadline = time.monotonic() + 5
+        while cache.stats.expired == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        cache.stop_sweeper()
+    assert cache.stats.expired == 1
+    assert cache.stats.misses == 0
+
+
+def test_weight_limit_evicts_until_items_fit():
+    """Test that least recently used items are evicted until the total weight fits."""
+    cache = LRUCache(100, max_weight=10, weigher=lambda key, value: len(value))
+    cache.set(1, 'aaaa')
+    cache.set(2, 'bbbb')
+    cache.get(1)
+    cache.set(3, 'cccccc')
+    assert cache.get(2) is None
+    assert cache.get(1) == 'aaaa'
+    assert cache.weight == 10
+    assert cache.stats.evictions == 1
+
+    cache.set(3, 'cc')
+    assert cache.weight == 6
+    cache.set(1, '')
+    assert cache.weight == 2
+
+
+def test_items_heavier_than_the_limit_are_refused():
+    """Test that an item heavier than the maximum weight is not stored and removes the old value."""
+    cache = LRUCache(max_weight=5, weigher=lambda key, value: len(value))
+    cache.set(1, 'a')
+    cache.set(1, 'too heavy')
+    assert cache.get(1) is None
+    assert cache.weight == 0
+    assert cache.stats.rejected == 1
+    assert cache.stats.evictions == 0
+
+    with pytest.raises(ValueError):
+        LRUCache(weigher=lambda key, value: -1).set(2, 'a')
+    with pytest.raises(TypeError):
+        LRUCache(max_weight=-1)
+
+
+def test_default_weights():
+    """Test the default weigher with a maximum weight and unit weights without one."""
+    cache = LRUCache(max_weight=10_000)
+    cache.set('key', 'x' * 1000)
+    assert cache.weight == sys.getsizeof('key') + sys.getsizeof('x' * 1000)
+    assert cache.max_weight == 10_000
+
+    cache = LRUCache(3)
+    for key in range(5):
+        cache.set(key, key)
+    assert cache.weight == 3
+    assert cache.max_weight is None
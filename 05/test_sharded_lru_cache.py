@@ -0,0 +1,94 @@
+"""
+Test suite for the ShardedLRUCache class and for LRUCache under concurrent access.
+"""
+
+import sys
+import threading
+
+import pytest
+
+from lru_cache import LRUCache
+from sharded_lru_cache import ShardedLRUCache
+
+
+def hammer(cache, threads: int = 8, operations: int = 5000) -> list[Exception]:
+    """Runs gets and sets of overlapping keys from several threads and returns the errors."""
+    errors = []
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def work(offset: int):
+        try:
+            for i in range(operations):
+                key = (i + offset) % 64
+                cache.set(key, key)
+                value = cache.get((i * 7 + offset) % 64)
+                assert value is None or value == (i * 7 + offset) % 64
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            errors.append(error)
+
+    workers = [threading.Thread(target=work, args=(offset,)) for offset in range(threads)]
+    try:
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    return errors
+
+
+def test_capacity_is_split_between_segments():
+    """Test that segments hold capacity/N items and there are never more segments than items."""
+    cache = ShardedLRUCache(10, segments=4)
+    assert cache.capacity == 10
+    assert cache.segments == 4
+    assert ShardedLRUCache(3, segments=16).segments == 3
+    assert ShardedLRUCache(0).segments == 1
+
+    for key in range(1000):
+        cache.set(key, str(key))
+    assert sum(cache.get(key) is not None for key in range(1000)) == 10
+    assert cache.get(999) == '999'
+
+
+@pytest.mark.parametrize('stride', [1, 16, 1024, -3])
+def test_strided_integer_keys_spread_over_segments(stride):
+    """Test that integer keys with a stride that is a multiple of the segment count use all segments."""
+    cache = ShardedLRUCache(1600, segments=16)
+    keys = [key * stride for key in range(1600)]
+    for key in keys:
+        cache.set(key, key)
+    assert sum(cache.get(key) is not None for key in keys) > 1500
+
+
+def test_global_lock_keeps_exact_lru_order():
+    """Test that with a global lock the cache evicts exactly like LRUCache."""
+    cache = ShardedLRUCache(3, global_lock=True)
+    assert cache.segments == 1
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.set('c', 3)
+    cache.get('a')
+    cache.set('d', 4)
+    assert cache.get('b') is None
+    assert [cache.get(key) for key in 'acd'] == [1, 3, 4]
+
+
+def test_wrong_arguments():
+    """Test that invalid capacities, segment counts and keys are rejected."""
+    with pytest.raises(TypeError):
+        ShardedLRUCache(-1)
+    with pytest.raises(ValueError):
+        ShardedLRUCache(10, segments=0)
+    with pytest.raises(TypeError):
+        ShardedLRUCache().set([1], 1)
+
+
+@pytest.mark.parametrize('cache', [
+    LRUCache(16), ShardedLRUCache(16, segments=4), ShardedLRUCache(16, global_lock=True),
+])
+def test_concurrent_access(cache):
+    """Test that concurrent gets and sets of the same keys neither fail nor exceed the capacity."""
+    assert not hammer(cache)
+    assert sum(cache.get(key) is not None for key in range(64)) <= 16
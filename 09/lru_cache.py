@@ -1,11 +1,13 @@
 """
 This module provides an LRUCache class, which implements a simple Least Recently Used (LRU) cache.
 The cache stores a fixed number of items, evicting the least recently used item when capacity is exceeded.
+Operations are atomic: every `get` and `set` holds the lock of the cache.
 """
 
 import logging
 import sys
 import argparse
+import threading
 from collections.abc import Hashable
 from typing import TypeVar
 from pydantic import BaseModel, field_validator, ValidationError
@@ -49,6 +51,7 @@ class LRUCache:
         """
         self.__capacity = Capacity(value=capacity)
         self.__data = {}
+        self.__lock = threading.Lock()
 
     @property
     def capacity(self) -> int:
@@ -68,12 +71,14 @@ class LRUCache:
         """
         logger.debug("GET - Try to find: %s", str(key))
 
-        if (value := self.__data.get(key)) is None:
+        with self.__lock:
+            if (value := self.__data.get(key)) is not None:
+                self.__data.pop(key)
+                self.__data[key] = value
+
+        if value is None:
             logger.info("GET - Key not found: %s", str(key))
             return None
-
-        self.__data.pop(key)
-        self.__data[key] = value
         logger.info("GET - Key accessed: %s", str(key))
         return value
 
@@ -95,18 +100,19 @@ class LRUCache:
             logger.error('SET - Key must be hashable')
             raise TypeError(f'Unhashable type: {type(key).__name__}')
 
-        if self.__data.get(key) is not None:
-            self.__data.pop(key)
-            self.__data[key] = value
-            logger.info("SET - Key updated: %s", str(key))
-        else:
-            self.__data[key] = value
-            log_body = f"SET - Key added: {key}"
-            if len(self.__data) > self.capacity:
-                evicted_key = next(iter(self.__data))
-                evicted_value = self.__data.pop(evicted_key)
-                log_body += f', Evicted least recently used key: {evicted_key}, value: {evicted_value}'
-            logger.info(log_body)
+        with self.__lock:
+            if self.__data.get(key) is not None:
+                self.__data.pop(key)
+                self.__data[key] = value
+                log_body = f"SET - Key updated: {key}"
+            else:
+                self.__data[key] = value
+                log_body = f"SET - Key added: {key}"
+                if len(self.__data) > self.capacity:
+                    evicted_key = next(iter(self.__data))
+                    evicted_value = self.__data.pop(evicted_key)
+                    log_body += f', Evicted least recently used key: {evicted_key}, value: {evicted_value}'
+        logger.info(log_body)
 
 
 def configure_logging(to_stdout: bool, apply_filter: bool):